@@ -0,0 +1,60 @@
+"""Helpers shared by the benchmarks."""
+
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+EXAMPLES = Path(__file__).parents[1] / "examples"
+
+
+def compile_example(path: Path, replace: dict[str, str] | None = None) -> CodeType:
+    """
+    Compile the configuration part of an example, preceding the simulation.
+
+    Parameters
+    ----------
+    path : Path
+        Path of the example script.
+    replace : dict[str, str], optional
+        Replacements of the source code, e.g., {"pwm=True": "pwm=False"}.
+
+    Returns
+    -------
+    CodeType
+        Compiled code, which defines, e.g., `mdl` and `ctrl` when executed.
+
+    """
+    source = path.read_text(encoding="utf-8").split("sim = model.Simulation")[0]
+    for old, new in (replace or {}).items():
+        source = source.replace(old, new)
+    return compile(source, str(path), "exec")
+
+
+def load_example(path: Path, replace: dict[str, str] | None = None) -> dict[str, Any]:
+    """Run the configuration part of an example and return its namespace."""
+    namespace = {"__file__": str(path)}
+    exec(compile_example(path, replace), namespace)
+    return namespace
+
+
+class RhsCounter:
+    """
+    Count the right-hand-side evaluations of a model.
+
+    The model's `rhs` method is replaced with this counter.
+
+    Parameters
+    ----------
+    mdl : Model
+        System model.
+
+    """
+
+    def __init__(self, mdl: Any) -> None:
+        self.n = 0
+        self._rhs = mdl.rhs
+        mdl.rhs = self
+
+    def __call__(self, t: float, state_list: Any) -> list[complex]:
+        self.n += 1
+        return self._rhs(t, state_list)
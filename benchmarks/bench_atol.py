@@ -0,0 +1,67 @@
+"""
+Accuracy versus the number of function evaluations for the solver tolerances.
+
+A 10-kVA grid-following converter with an LCL filter is simulated using a scalar
+absolute tolerance and using per-state tolerances scaled by the base values
+(`SolverCfg.base`). The number of right-hand-side evaluations and the maximum
+per-unit error of the states at the sampling instants, compared to a
+tightly-toleranced reference solution, are reported.
+
+Run with::
+
+    python benchmarks/bench_atol.py
+
+"""
+
+import numpy as np
+from _common import RhsCounter
+
+from motulator.common.model import SolverCfg
+from motulator.grid import control, model, utils
+
+T_STOP = 0.08
+RTOLS = (1e-3, 1e-5)
+ATOLS = (1e-4, 1e-6, 1e-8)  # Scalar
+ATOLS_PU = (1e-3, 1e-4, 1e-6)  # Per-unit
+
+nom = utils.NominalValues(U=400, I=14.5, f=50, P=10e3)
+base = utils.BaseValues.from_nominal(nom)
+
+
+def run(cfg: SolverCfg) -> tuple[int, np.ndarray]:
+    """Simulate and return the number of evaluations and the per-unit states."""
+    ac_filter = model.LCLFilter(
+        L_fc=0.073 * base.L, L_fg=0.073 * base.L, C_f=0.043 * base.C, u_f0_ab=base.u
+    )
+    ac_source = model.ThreePhaseSource(w_g=base.w, e_g=base.u)
+    converter = model.VoltageSourceConverter(u_dc=650)
+    mdl = model.GridConverterSystem(converter, ac_filter, ac_source)
+    inner_ctrl = control.CurrentVectorController(
+        i_max=1.5 * base.i, L=0.073 * base.L, T_s=100e-6
+    )
+    ctrl = control.GridConverterControlSystem(inner_ctrl)
+    ctrl.set_power_ref(lambda t: (t > 0.02) * 5e3)
+    ctrl.set_reactive_power_ref(lambda t: (t > 0.04) * 4e3)
+
+    counter = RhsCounter(mdl)
+    sim = model.Simulation(mdl, ctrl, show_progress=False, cfg=cfg)
+    states = [snapshot.state for snapshot in sim.iter_steps(T_STOP)]
+    return counter.n, np.array(states) / np.array(mdl.get_state_scales(base))
+
+
+if __name__ == "__main__":
+    n_ref, ref = run(SolverCfg(rtol=1e-9, atol=1e-12))
+    print(f"reference              {n_ref:7d} evaluations")
+    for rtol in RTOLS:
+        for label, atols, scaled in (
+            ("atol", ATOLS, False),
+            ("atol_pu", ATOLS_PU, True),
+        ):
+            for atol in atols:
+                cfg = SolverCfg(rtol=rtol, atol=atol, base=base if scaled else None)
+                n_eval, states = run(cfg)
+                err = np.max(np.abs(states - ref))
+                print(
+                    f"rtol {rtol:.0e}  {label:7s} {atol:.0e}  {n_eval:7d} evaluations  "
+                    f"max error {err:.2e} p.u."
+                )
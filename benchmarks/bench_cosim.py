@@ -0,0 +1,108 @@
+"""
+Latency and throughput of the co-simulation server.
+
+A 2.2-kW induction machine drive is served in a separate process, and the reference
+client drives it with open-loop V/Hz duty ratios over the Unix and TCP sockets. The
+round-trip latency percentiles and the throughput are compared with advancing the same
+plant in-process, which shows the overhead of the protocol.
+
+Run with::
+
+    python benchmarks/bench_cosim.py
+
+"""
+
+import multiprocessing as mp
+import os
+import tempfile
+import time
+from math import cos, pi
+
+import numpy as np
+
+from motulator.common.model import CoSimulationClient, CoSimulationServer
+from motulator.drive import model
+
+T_S = 125e-6
+N_STEPS = 4000
+
+
+def create_model() -> model.Drive:
+    """Create a 2.2-kW induction machine drive."""
+    par = model.InductionMachineInvGammaPars(
+        n_p=2, R_s=3.7, R_R=2.1, L_sgm=0.021, L_M=0.224
+    )
+    machine = model.InductionMachine(par)
+    mechanics = model.MechanicalSystem(J=0.015)
+    converter = model.VoltageSourceConverter(u_dc=540)
+    return model.Drive(machine, mechanics, converter)
+
+
+def duty_ratios(k: int) -> list[float]:
+    """Open-loop V/Hz duty ratios at 25 Hz."""
+    theta = 2 * pi * 25 * k * T_S
+    return [0.5 + 0.2 * cos(theta - n * 2 * pi / 3) for n in range(3)]
+
+
+def serve(path: str | None, port: int) -> None:
+    """Run the server (in a separate process)."""
+    CoSimulationServer(create_model(), path=path, port=port).run()
+
+
+def run_client(address: str | tuple[str, int]) -> np.ndarray:
+    """Run the client and return the round-trip latencies (s)."""
+    for _ in range(100):  # Wait for the server to start
+        try:
+            client = CoSimulationClient(address)
+            break
+        except (ConnectionRefusedError, FileNotFoundError):
+            time.sleep(0.05)
+    else:
+        raise RuntimeError("Server did not start")
+    client.measure()
+    latency = np.empty(N_STEPS)
+    for k in range(N_STEPS):
+        t0 = time.perf_counter()
+        client.step(T_S, duty_ratios(k))
+        latency[k] = time.perf_counter() - t0
+    client.close()
+    return latency
+
+
+def run_in_process() -> np.ndarray:
+    """Advance the plant in-process without sockets."""
+    server = CoSimulationServer(create_model())
+    server.sim._start()
+    latency = np.empty(N_STEPS)
+    for k in range(N_STEPS):
+        t0 = time.perf_counter()
+        server.step(T_S, duty_ratios(k))
+        latency[k] = time.perf_counter() - t0
+    return latency
+
+
+def report(name: str, latency: np.ndarray) -> None:
+    """Print latency percentiles and throughput."""
+    p50, p90, p99 = 1e6 * np.percentile(latency, [50, 90, 99])
+    rate = len(latency) / np.sum(latency)
+    print(
+        f"{name:12s} p50 {p50:7.1f} us  p90 {p90:7.1f} us  p99 {p99:7.1f} us  "
+        f"{rate:8.0f} steps/s"
+    )
+
+
+if __name__ == "__main__":
+    report("in-process", run_in_process())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "motulator.sock")
+        proc = mp.Process(target=serve, args=(path, 0), daemon=True)
+        proc.start()
+        report("unix socket", run_client(path))
+        proc.terminate()
+
+    port = 5555
+    proc = mp.Process(target=serve, args=(None, port), daemon=True)
+    proc.start()
+    report("tcp socket", run_client(("127.0.0.1", port)))
+    proc.terminate()
@@ -0,0 +1,56 @@
+"""
+Import time of the model and control packages.
+
+Each package is imported in a fresh interpreter, as in the workers of a process pool.
+The median import time over several runs is reported, together with the heavy
+dependencies that got imported. The models, controls, and :class:`Simulation` should
+not import matplotlib, tqdm, or SciPy before they are used.
+
+Run with::
+
+    python benchmarks/bench_import.py
+
+"""
+
+import statistics
+import subprocess
+import sys
+
+N_RUNS = 7
+HEAVY = ("matplotlib", "tqdm", "scipy", "asyncio")
+TARGETS = (
+    "numpy",
+    "motulator.common.model",
+    "motulator.drive.model",
+    "motulator.drive.control",
+    "motulator.grid.model",
+    "motulator.grid.control",
+    "motulator.drive.utils",
+)
+CODE = """
+import sys, time
+t0 = time.perf_counter()
+import {target}
+elapsed = time.perf_counter() - t0
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def measure(target: str) -> tuple[float, str]:
+    """Return the median import time (s) and the imported heavy dependencies."""
+    times, heavy = [], ""
+    code = CODE.format(target=target, heavy=HEAVY)
+    for _ in range(N_RUNS):
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.split()
+        times.append(float(out[0]))
+        heavy = out[1] if len(out) > 1 else "-"
+    return statistics.median(times), heavy
+
+
+if __name__ == "__main__":
+    for target in TARGETS:
+        elapsed, heavy = measure(target)
+        print(f"{target:26s} {1e3 * elapsed:7.1f} ms   heavy imports: {heavy}")
@@ -0,0 +1,57 @@
+"""
+Solver work attributable to the mechanical states.
+
+The drive examples are simulated with the default solver tolerances and with the
+mechanical states excluded from the error control of the solver. The latter gives a
+bound on the savings of integrating the mechanical system at a coarser rate than the
+electrical subsystems. The number of right-hand-side evaluations and the wall-clock
+times are reported.
+
+Run with::
+
+    python benchmarks/bench_multirate.py
+
+"""
+
+import time
+from pathlib import Path
+
+import numpy as np
+from _common import EXAMPLES, RhsCounter, load_example
+
+from motulator.common.model import SolverCfg
+from motulator.drive import model
+
+CASES = {
+    "current_vector/plot_7kw_syrm_cvc.py": 1.0,
+    "current_vector/plot_2kw_ipmsm_diode_cvc.py": 1.0,
+    "flux_vector/plot_2kw_im_sat_fvc.py": 1.5,
+    "vhz/plot_2kw_ipmsm_2mass_ovhz.py": 1.2,
+}
+MECHANICAL_STATES = ("exp_j_theta_M", "w_M", "w_L", "theta_ML")
+
+
+def run(path: Path, t_stop: float, exclude: bool) -> tuple[int, float]:
+    """Return the number of evaluations and the time."""
+    ns = load_example(path)
+    mdl, ctrl = ns["mdl"], ns["ctrl"]
+    names = [
+        name
+        for subsystem in mdl.subsystems
+        if subsystem.state is not None
+        for name in vars(subsystem.state)
+    ]
+    atol = [np.inf if exclude and name in MECHANICAL_STATES else 1e-6 for name in names]
+    counter = RhsCounter(mdl)
+    sim = model.Simulation(mdl, ctrl, show_progress=False, cfg=SolverCfg(atol=atol))
+    t0 = time.perf_counter()
+    sim.simulate(t_stop)
+    return counter.n, time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    for name, t_stop in CASES.items():
+        print(name)
+        for exclude, label in ((False, "all states"), (True, "without mechanics")):
+            n_eval, elapsed = run(EXAMPLES / "drive" / name, t_stop, exclude)
+            print(f"  {label:18s} {n_eval:7d} evaluations  {elapsed:6.2f} s")
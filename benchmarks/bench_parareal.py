@@ -0,0 +1,114 @@
+"""
+Parareal simulation of the drive examples with the carrier comparison.
+
+The fine propagator is the current-vector control example with the carrier comparison,
+while the coarse propagator is the quasi-steady-state drive model, driven by the same
+speed controller and current reference generation at a longer sampling period. The
+serial simulation time, the Parareal wall-clock time, the projected parallel time with
+one process per time slice, the number of iterations, and the maximum speed and
+current errors compared to the serial simulation are reported for two tolerances. The
+projected parallel time is based on the measured times of the coarse propagation and
+the slowest fine slice in each iteration.
+
+Run with::
+
+    python benchmarks/bench_parareal.py [processes]
+
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from _common import EXAMPLES, compile_example
+
+from motulator.common.model import Parareal, Simulation
+from motulator.drive import control, model
+
+CASES = {
+    "plot_2kw_ipmsm_diode_cvc.py": 1.0,
+    "plot_2kw_ipmsm_cvc_adapt.py": 1.2,
+    "plot_7kw_syrm_cvc.py": 1.0,
+}
+# Enable the carrier comparison in the examples, which do not use it
+PWM = {
+    "model.Drive(machine, mechanics, converter)": (
+        "model.Drive(machine, mechanics, converter, pwm=True)"
+    )
+}
+N_SLICES = 8
+RTOL = (1e-2, 1e-3)  # Relative tolerances, the absolute ones are ten times larger
+T_S = 2e-3  # Sampling period of the coarse propagator
+
+
+def factories(path: Path):
+    """Return the functions creating the fine and coarse simulations of an example."""
+    code = compile_example(path, PWM)
+
+    def fine() -> Simulation:
+        ns = {"__file__": str(path)}
+        exec(code, ns)
+        return Simulation(ns["mdl"], ns["ctrl"], show_progress=False)
+
+    def coarse() -> Simulation:
+        ns = {"__file__": str(path)}
+        exec(code, ns)
+        mdl = model.QuasiSteadyStateDrive(
+            ns["machine"], ns["mechanics"], ns["converter"]
+        )
+        ctrl = control.sm.QuasiSteadyStateControlSystem(ns["ctrl"], T_s=T_S)
+        return Simulation(mdl, ctrl, show_progress=False)
+
+    return fine, coarse
+
+
+def max_error(t: np.ndarray, ref: tuple, res: tuple) -> float:
+    """Maximum error on a common time grid."""
+    return float(np.max(np.abs(np.interp(t, *res) - np.interp(t, *ref))))
+
+
+if __name__ == "__main__":
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    for name, t_stop in CASES.items():
+        fine, coarse = factories(EXAMPLES / "drive" / "current_vector" / name)
+
+        t0 = time.perf_counter()
+        ref = fine().simulate(t_stop)
+        serial_time = time.perf_counter() - t0
+
+        print(name)
+        print(f"  serial            {serial_time:6.2f} s")
+        for rtol in RTOL:
+            parareal = Parareal(
+                fine,
+                coarse,
+                n_slices=N_SLICES,
+                rtol=rtol,
+                atol=10 * rtol,
+                processes=processes,
+            )
+            res = parareal.simulate(t_stop)
+            stats = parareal.stats
+
+            t = np.linspace(0, t_stop, 10000)
+            mech, mech_ref = res.mdl.mechanics, ref.mdl.mechanics
+            err_w_M = max_error(t, (ref.mdl.t, mech_ref.w_M), (res.mdl.t, mech.w_M))
+            i_s, i_s_ref = res.mdl.machine.i_s_ab, ref.mdl.machine.i_s_ab
+            err_i_s = max_error(
+                t, (ref.mdl.t, np.abs(i_s_ref)), (res.mdl.t, np.abs(i_s))
+            )
+            speedup = serial_time / stats.parallel_time
+            errors = ", ".join(f"{err:.2g}" for err in stats.errors)
+            print(f"  rtol {rtol:.0e}")
+            print(
+                f"    Parareal        {stats.wall_time:6.2f} s  ({processes} processes)"
+            )
+            print(
+                f"    projected       {stats.parallel_time:6.2f} s  "
+                f"(speedup {speedup:.2f} with {N_SLICES} slices)"
+            )
+            print(f"    iterations      {stats.iterations}  (errors {errors})")
+            print(f"    speed error     {err_w_M:.2g} rad/s")
+            print(f"    current error   {err_i_s:.2g} A")
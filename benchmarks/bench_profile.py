@@ -0,0 +1,76 @@
+"""
+Scalar lookup time of large drive-cycle profiles.
+
+A profile with a few hundred thousand points is queried at monotonically advancing
+time instants, with every tenth step backwards as after rejected solver steps. In the
+dense case, the query interval is much shorter than the profile sampling interval, as
+in simulations. In the sparse case, each query moves the cursor by a few points. The
+lookup time per query is reported for `np.interp`, for :class:`SequenceGenerator`, and
+for :class:`Profile` both in memory and memory-mapped from a file. The maximum
+deviation from `np.interp` is also reported.
+
+Run with::
+
+    python benchmarks/bench_profile.py
+
+"""
+
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from motulator.common.utils import Profile, SequenceGenerator
+
+N_POINTS = 500_000
+N_QUERIES = 200_000
+T_END = 1800.0  # Drive cycle of 30 min
+
+
+def make_queries(rng: np.random.Generator, dt_mean: float) -> np.ndarray:
+    """Time instants advancing in random steps, with every tenth step backwards."""
+    dt = rng.uniform(0, 2 * dt_mean, N_QUERIES)
+    dt[::10] *= -0.5
+    return np.clip(100.0 + np.cumsum(dt), 0, T_END)
+
+
+def time_per_query(func, t: list[float]) -> tuple[float, np.ndarray]:
+    """Return the lookup time (s) per query and the values."""
+    t0 = time.perf_counter()
+    y = [func(t_k) for t_k in t]
+    return (time.perf_counter() - t0) / len(t), np.array(y)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(1)
+    times = np.linspace(0, T_END, N_POINTS)
+    values = np.cumsum(rng.normal(size=N_POINTS))
+    queries = {
+        "dense": make_queries(rng, 25e-6).tolist(),
+        "sparse": make_queries(rng, 2.5 * T_END / N_POINTS).tolist(),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "profile.npy"
+        np.save(path, np.column_stack((times, values)))
+        mapped = Profile.load(path)
+        candidates = {
+            "np.interp": lambda t_k: np.interp(t_k, times, values),
+            "SequenceGenerator": SequenceGenerator(times, values),
+            "Profile": Profile(times, values),
+            "Profile (memory-mapped)": mapped,
+            "Profile (unpickled)": pickle.loads(pickle.dumps(mapped)),
+        }
+        for case, t in queries.items():
+            print(f"{case} queries")
+            _, ref = time_per_query(candidates["np.interp"], t)
+            for name, func in candidates.items():
+                elapsed, y = time_per_query(func, t)
+                err = np.max(np.abs(y - ref))
+                print(
+                    f"  {name:24s} {1e6 * elapsed:6.2f} us/query   "
+                    f"max deviation {err:.1e}"
+                )
+        del candidates, mapped
@@ -0,0 +1,75 @@
+"""
+Error of the quasi-steady-state drive model compared to the full model.
+
+The current-vector control examples are simulated using the full drive model and using
+the reduced-order quasi-steady-state model, which is driven by the same speed
+controller and current reference generation. The maximum and rms errors of the rotor
+speed and the electromagnetic torque, in per-unit values, are reported together with
+the number of right-hand-side evaluations and the wall-clock times.
+
+Run with::
+
+    python benchmarks/bench_quasi_steady_state.py
+
+"""
+
+import time
+from typing import Any
+
+import numpy as np
+from _common import EXAMPLES, RhsCounter, load_example
+
+from motulator.drive import control, model
+
+CASES = {
+    "plot_2kw_im_cvc_tq.py": 2.0,
+    "plot_2kw_im_sat_cvc.py": 1.5,
+    "plot_2kw_ipmsm_cvc_adapt.py": 1.2,
+    "plot_7kw_syrm_cvc.py": 1.0,
+}
+T_S = 1e-3  # Sampling period of the reduced-order model
+
+
+def run(mdl, ctrl, t_stop: float) -> tuple[Any, int, float]:
+    """Simulate and return the results, the number of evaluations, and the time."""
+    counter = RhsCounter(mdl)
+    sim = model.Simulation(mdl, ctrl, show_progress=False)
+    t0 = time.perf_counter()
+    res = sim.simulate(t_stop)
+    return res, counter.n, time.perf_counter() - t0
+
+
+def errors(t: np.ndarray, ref: tuple, red: tuple, scale: float) -> tuple[float, float]:
+    """Maximum and rms errors on a uniform time grid."""
+    y_ref = np.interp(t, *ref)
+    y_red = np.interp(t, *red)
+    err = np.abs(y_red - y_ref) / scale
+    return float(np.max(err)), float(np.sqrt(np.mean(err**2)))
+
+
+if __name__ == "__main__":
+    for name, t_stop in CASES.items():
+        ns = load_example(EXAMPLES / "drive" / "current_vector" / name)
+        res_full, n_full, time_full = run(ns["mdl"], ns["ctrl"], t_stop)
+
+        ns = load_example(EXAMPLES / "drive" / "current_vector" / name)
+        mdl = model.QuasiSteadyStateDrive(
+            ns["machine"], ns["mechanics"], ns["converter"]
+        )
+        ctrl = control.sm.QuasiSteadyStateControlSystem(ns["ctrl"], T_s=T_S)
+        res_red, n_red, time_red = run(mdl, ctrl, t_stop)
+
+        base = ns["base"]
+        t = np.arange(0, t_stop, 1e-4)
+        full, red = res_full.mdl, res_red.mdl
+        w_M = errors(
+            t, (full.t, full.mechanics.w_M), (red.t, red.mechanics.w_M), base.w_M
+        )
+        tau_M = errors(
+            t, (full.t, full.machine.tau_M), (red.t, red.machine.tau_M), base.tau
+        )
+        print(name)
+        print(f"  full model     {n_full:7d} evaluations  {time_full:6.2f} s")
+        print(f"  reduced model  {n_red:7d} evaluations  {time_red:6.2f} s")
+        print(f"  speed error    max {w_M[0]:.3f} p.u.  rms {w_M[1]:.3f} p.u.")
+        print(f"  torque error   max {tau_M[0]:.3f} p.u.  rms {tau_M[1]:.3f} p.u.")
@@ -0,0 +1,67 @@
+"""
+Latency and throughput of the shared-memory controller bridge.
+
+A 2.2-kW induction machine drive is simulated with :class:`SharedMemoryControlSystem`,
+and an external controller process computes open-loop V/Hz duty ratios through
+:class:`SharedMemoryEndpoint`. The round-trip latency percentiles of the bridge and the
+throughput of the whole simulation loop are reported.
+
+Run with::
+
+    python benchmarks/bench_shm.py
+
+"""
+
+import multiprocessing as mp
+import os
+import time
+from math import cos, pi
+
+from motulator.common.control import SharedMemoryControlSystem, SharedMemoryEndpoint
+from motulator.common.model import Simulation
+from motulator.drive import model
+
+T_S = 125e-6
+N_STEPS = 4000
+SPIN = 1000 if (os.cpu_count() or 1) > 1 else 1
+
+
+def create_model() -> model.Drive:
+    """Create a 2.2-kW induction machine drive."""
+    par = model.InductionMachineInvGammaPars(
+        n_p=2, R_s=3.7, R_R=2.1, L_sgm=0.021, L_M=0.224
+    )
+    machine = model.InductionMachine(par)
+    mechanics = model.MechanicalSystem(J=0.015)
+    converter = model.VoltageSourceConverter(u_dc=540)
+    return model.Drive(machine, mechanics, converter)
+
+
+def run_controller(name: str) -> None:
+    """Run the external controller (in a separate process)."""
+    endpoint = SharedMemoryEndpoint(name, spin=SPIN)
+    while (meas := endpoint.receive()) is not None:
+        theta = 2 * pi * 25 * meas.t
+        endpoint.send(T_S, [0.5 + 0.2 * cos(theta - n * 2 * pi / 3) for n in range(3)])
+    endpoint.close()
+
+
+if __name__ == "__main__":
+    ctrl = SharedMemoryControlSystem(spin=SPIN)
+    proc = mp.Process(target=run_controller, args=(ctrl.name,), daemon=True)
+    proc.start()
+    sim = Simulation(create_model(), ctrl, show_progress=False)
+    try:
+        t0 = time.perf_counter()
+        sim.simulate(t_stop=N_STEPS * T_S)
+        elapsed = time.perf_counter() - t0
+    finally:
+        ctrl.close()
+        proc.join()
+
+    p50, p90, p99, p999 = (1e6 * v for v in ctrl.latency_percentiles().values())
+    print(
+        f"round trip   p50 {p50:5.1f} us  p90 {p90:5.1f} us  p99 {p99:5.1f} us  "
+        f"p99.9 {p999:6.1f} us"
+    )
+    print(f"simulation   {N_STEPS / elapsed:8.0f} steps/s")
@@ -0,0 +1,52 @@
+"""
+10-kVA, GFL, admittance scan
+============================
+
+This example identifies the dq admittance of a 10-kVA grid-following (GFL) converter
+connected to a strong grid through an L filter. A multisine perturbation is superimposed
+on the grid voltage, so that the admittance at all excitation frequencies is obtained
+from only two simulations, one per perturbation direction.
+
+"""
+
+# %%
+from motulator.grid import control, model, utils
+
+# %%
+# Compute base values based on the nominal values.
+
+nom = utils.NominalValues(U=400, I=14.5, f=50, P=10e3)
+base = utils.BaseValues.from_nominal(nom)
+
+
+# %%
+# Configure the system model and the control system. A new simulation object is needed
+# for each perturbation direction, which is why they are created in a function.
+
+
+def create_sim() -> model.Simulation:
+    """Create the simulation object."""
+    ac_filter = model.LFilter(L_f=0.2 * base.L)
+    ac_source = model.ThreePhaseSource(w_g=base.w, e_g=base.u)
+    converter = model.VoltageSourceConverter(u_dc=650)
+    mdl = model.GridConverterSystem(converter, ac_filter, ac_source)
+
+    inner_ctrl = control.CurrentVectorController(i_max=1.5 * base.i, L=0.2 * base.L)
+    ctrl = control.GridConverterControlSystem(inner_ctrl)
+    ctrl.set_power_ref(5e3)
+    ctrl.set_reactive_power_ref(0)
+
+    return model.Simulation(mdl, ctrl, show_progress=False)
+
+
+# %%
+# Design the multisine perturbation with 50 excitation frequencies. The perturbation is
+# switched on after the operating point has settled.
+
+exc = utils.Multisine(f_min=10, f_max=2e3, n_freqs=50, amplitude=0.005 * base.u)
+scan = utils.scan_admittance(create_sim, exc, t_settle=0.1)
+
+# %%
+# Plot the admittance in per-unit values.
+
+utils.plot_admittance(scan, base)
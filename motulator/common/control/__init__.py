@@ -1,4 +1,11 @@
-"""Common control functions and classes."""
+"""
+Common control functions and classes.
+
+The shared-memory bridge is imported when first accessed.
+
+"""
+
+from typing import TYPE_CHECKING
 
 from motulator.common.control._base import ControlSystem, TimeSeries
 from motulator.common.control._controllers import (
@@ -6,13 +13,30 @@ from motulator.common.control._controllers import (
     PIController,
     RateLimiter,
 )
+from motulator.common.control._multirate import MultiRateBlock
 from motulator.common.control._pwm import PWM
+from motulator.common.utils._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from motulator.common.control._shm import SharedMemoryControlSystem
+    from motulator.common.control._shm_endpoint import SharedMemoryEndpoint
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "SharedMemoryControlSystem": "motulator.common.control._shm",
+        "SharedMemoryEndpoint": "motulator.common.control._shm_endpoint",
+    },
+)
 
 __all__ = [
     "ComplexPIController",
     "ControlSystem",
+    "MultiRateBlock",
     "PIController",
     "PWM",
     "RateLimiter",
+    "SharedMemoryControlSystem",
+    "SharedMemoryEndpoint",
     "TimeSeries",
 ]
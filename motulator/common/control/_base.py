@@ -2,10 +2,18 @@
 
 from dataclasses import dataclass, field
 from types import SimpleNamespace
-from typing import Any, Protocol, Sequence
+from typing import Any, Callable, Protocol, Sequence
 
 import numpy as np
 
+from motulator.common.control._multirate import MultiRateBlock
+from motulator.common.utils._time_series import (
+    Resampler,
+    TimeWindow,
+    signal_names,
+    uniform_grid,
+)
+
 
 # %%
 class References(Protocol):
@@ -24,6 +32,100 @@ class TimeSeries:
     fbk: Any = field(default_factory=dict)
     ref: Any = field(default_factory=dict)
 
+    def window(self, t0: float, t1: float) -> "TimeSeries":
+        """
+        Select the time window [t0, t1].
+
+        Parameters
+        ----------
+        t0, t1 : float
+            Start and end of the window (s).
+
+        Returns
+        -------
+        TimeSeries
+            Time series, whose arrays are views of the original arrays.
+
+        """
+        window = TimeWindow(self.t, t0, t1)
+        return self._map(window(self.t), window, lambda t: TimeWindow(t, t0, t1))
+
+    def resample(self, dt: float, method: str = "zoh") -> "TimeSeries":
+        """
+        Resample all time series on a uniform time grid.
+
+        Parameters
+        ----------
+        dt : float
+            Sampling interval (s).
+        method : str, optional
+            Resampling method, "zoh" (default) or "linear".
+
+        Returns
+        -------
+        TimeSeries
+            Resampled time series.
+
+        """
+        t = uniform_grid(self.t, dt)
+        return self._map(t, Resampler(self.t, t, method))
+
+    def align(self, other: Any, method: str = "zoh") -> "TimeSeries":
+        """
+        Resample all time series at the time instants of other time series.
+
+        Parameters
+        ----------
+        other : Any
+            Time series with the time instants `other.t`, e.g., the continuous-time
+            model's time series.
+        method : str, optional
+            Resampling method, "zoh" (default) or "linear".
+
+        Returns
+        -------
+        TimeSeries
+            Resampled time series.
+
+        """
+        t = np.asarray(other.t)
+        return self._map(t, Resampler(self.t, t, method))
+
+    def _map(
+        self,
+        t: np.ndarray,
+        func: Callable[[Any], Any],
+        own: Callable[[np.ndarray], Callable[[Any], Any]] | None = None,
+    ) -> "TimeSeries":
+        """
+        Apply `func` to all time series.
+
+        The groups recorded at their own rate, see :class:`MultiRateBlock`, have their
+        own time instants `t`. These groups are mapped using `own(t)` if given,
+        otherwise they are kept as such.
+
+        """
+        ts = TimeSeries(t=t)
+        for name, value in vars(self).items():
+            if name == "t" or name.startswith("_"):
+                continue
+            if isinstance(value, (np.ndarray, list)):
+                setattr(ts, name, func(value))
+            elif isinstance(value, dict):
+                setattr(ts, name, {k: func(v) for k, v in value.items()})
+            else:
+                names = signal_names(value)
+                if "t" not in names:
+                    group_func = func
+                elif own is not None:
+                    group_func = own(np.asarray(value.t))
+                else:
+                    setattr(ts, name, value)
+                    continue
+                group = {k: group_func(getattr(value, k)) for k in names}
+                setattr(ts, name, SimpleNamespace(**group))
+        return ts
+
 
 class ControlSystem[Mdl, Meas, Ref: References, Fbk](Protocol):
     """
@@ -39,12 +141,72 @@ class ControlSystem[Mdl, Meas, Ref: References, Fbk](Protocol):
     # Time and signal history
     _t: list[float]
     _history: dict[str, dict[str, list]]
+    # Blocks executed at lower rates, keyed by their attribute paths
+    _blocks: dict[str, MultiRateBlock]
 
     def __init__(self) -> None:
         self.t: float = 0.0  # Controller time
         # Initialize the data buffer
         self._t: list[float] = []
         self._history: dict[str, dict[str, list]] = {}
+        self._blocks: dict[str, MultiRateBlock] = {}
+
+    def set_rate(
+        self,
+        path: str,
+        n: int,
+        methods: Sequence[str] = ("compute_output",),
+        update_method: str | None = "update",
+    ) -> MultiRateBlock:
+        """
+        Execute a controller block at a multiple of the base sampling period.
+
+        The block is replaced with :class:`MultiRateBlock`, which executes the block on
+        every `n`th control cycle and holds its outputs in between. The outputs are
+        recorded at the rate of the block in the group named after its path, with the
+        dots replaced by underscores, e.g., `ts.speed_ctrl` or
+        `ts.vector_ctrl_reference_gen` of the post-processed time series.
+
+        Parameters
+        ----------
+        path : str
+            Attribute path of the block, e.g., "speed_ctrl" or
+            "vector_ctrl.reference_gen".
+        n : int
+            Rate divider, i.e., the block is executed on every `n`th control cycle.
+        methods : Sequence[str], optional
+            Names of the methods, whose outputs are held, defaults to
+            ("compute_output",).
+        update_method : str | None, optional
+            Name of the update method, whose first argument is the sampling period,
+            defaults to "update".
+
+        Returns
+        -------
+        MultiRateBlock
+            Scheduled block.
+
+        Examples
+        --------
+        >>> ctrl.set_rate("speed_ctrl", 8)  # doctest: +SKIP
+        >>> ctrl.set_rate(
+        ...     "vector_ctrl.reference_gen",
+        ...     4,
+        ...     methods=("compute_flux_and_torque_refs",),
+        ... )  # doctest: +SKIP
+
+        """
+        *parents, name = path.split(".")
+        owner = self
+        for parent in parents:
+            owner = getattr(owner, parent)
+        block = getattr(owner, name)
+        if isinstance(block, MultiRateBlock):
+            block = block.block
+        scheduled = MultiRateBlock(block, n, methods, update_method)
+        setattr(owner, name, scheduled)
+        self._blocks[path] = scheduled
+        return scheduled
 
     def get_measurement(self, mdl: Mdl) -> Meas:
         """Get measurements from the model."""
@@ -62,6 +224,28 @@ class ControlSystem[Mdl, Meas, Ref: References, Fbk](Protocol):
         """Update controller internal states."""
         self.t = (self.t + ref.T_s) % 1e9  # Avoid overflow
 
+    def get_state(self) -> dict[str, Any]:
+        """
+        Return a copy of the internal states, e.g., for restarting the simulation.
+
+        Control systems extend this method with the states of their controllers.
+
+        Returns
+        -------
+        dict[str, Any]
+            Controller time "t" and the cycle states "blocks" of the blocks executed
+            at lower rates.
+
+        """
+        blocks = {path: block.get_cycle_state() for path, block in self._blocks.items()}
+        return {"t": self.t, "blocks": blocks}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the internal states returned by :meth:`get_state`."""
+        self.t = state["t"]
+        for path, block in self._blocks.items():
+            block.set_cycle_state(state["blocks"][path])
+
     def save(self, t: float, **signal_groups: Any) -> None:
         """Save a single timestep of data."""
         self._t.append(t)
@@ -77,8 +261,11 @@ class ControlSystem[Mdl, Meas, Ref: References, Fbk](Protocol):
         meas = self.get_measurement(mdl)
         fbk = self.get_feedback(meas)
         ref = self.compute_output(fbk)
-        self.save(self.t, ref=ref, fbk=fbk)
+        t = self.t
+        self.save(t, ref=ref, fbk=fbk)
         self.update(ref, fbk)
+        for block in self._blocks.values():
+            block.tick(t)
         return self.get_duty_ratios(ref)
 
     def get_duty_ratios(self, ref: References) -> tuple[float, Sequence[float]]:
@@ -97,9 +284,14 @@ class ControlSystem[Mdl, Meas, Ref: References, Fbk](Protocol):
         for group_name, signals in self._history.items():
             group_data = {k: np.array(v) for k, v in signals.items()}
             setattr(ts, group_name, SimpleNamespace(**group_data))
+        # Blocks executed at lower rates, with their own time instants
+        for path, block in self._blocks.items():
+            setattr(ts, path.replace(".", "_"), block.post_process())
         return ts
 
     def clear_data(self) -> None:
         """Clear all stored data."""
         self._t.clear()
         self._history.clear()
+        for block in self._blocks.values():
+            block.clear_data()
@@ -1,6 +1,7 @@
 """Common functions and classes for controls."""
 
 from math import inf
+from typing import Any
 
 from motulator.common.utils._utils import clip
 
@@ -88,6 +89,14 @@ class PIController:
         """
         self.u_i += T_s * self.alpha_i * (u - self.v)
 
+    def get_state(self) -> dict[str, Any]:
+        """Return the integral state."""
+        return {"u_i": self.u_i}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the integral state."""
+        self.u_i = state["u_i"]
+
 
 # %%
 class ComplexPIController:
@@ -173,6 +182,14 @@ class ComplexPIController:
         """
         self.u_i += T_s * (self.alpha_i + 1j * w_c) * (u - self.v)
 
+    def get_state(self) -> dict[str, Any]:
+        """Return the integral state."""
+        return {"u_i": self.u_i}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the integral state."""
+        self.u_i = state["u_i"]
+
 
 # %%
 class RateLimiter:
@@ -210,3 +227,11 @@ class RateLimiter:
         self._old_y = y
 
         return y
+
+    def get_state(self) -> dict[str, Any]:
+        """Return the latest output."""
+        return {"old_y": self._old_y}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the latest output."""
+        self._old_y = state["old_y"]
@@ -0,0 +1,131 @@
+"""
+Multi-rate execution of controller blocks.
+
+Outer control loops, such as speed controllers, DC-bus voltage controllers, and
+reference generators, are typically executed at a lower rate than the current control
+in embedded implementations. A block registered using
+:meth:`motulator.common.control.ControlSystem.set_rate` is executed on every `n`th
+control cycle, and its outputs are held in between.
+
+"""
+
+from functools import partial
+from types import SimpleNamespace
+from typing import Any, Sequence
+
+import numpy as np
+
+_OWN = ("block", "n", "methods", "update_method", "_k", "_held", "_t", "_history")
+
+
+# %%
+class MultiRateBlock:
+    """
+    Controller block executed at an integer multiple of the base sampling period.
+
+    The listed methods of the block are executed on every `n`th control cycle, and their
+    outputs are held in between. The update method of the block is called on the same
+    cycles, with the base sampling period multiplied by `n`. Other attributes are
+    forwarded to the block. The held outputs are recorded at the rate of the block.
+
+    Parameters
+    ----------
+    block : Any
+        Controller block, e.g., :class:`motulator.drive.control.SpeedController`.
+    n : int
+        Rate divider, i.e., the block is executed on every `n`th control cycle.
+    methods : Sequence[str], optional
+        Names of the methods, whose outputs are held, defaults to ("compute_output",).
+    update_method : str | None, optional
+        Name of the update method, whose first argument is the sampling period,
+        defaults to "update". None if the block has no update method.
+
+    """
+
+    def __init__(
+        self,
+        block: Any,
+        n: int,
+        methods: Sequence[str] = ("compute_output",),
+        update_method: str | None = "update",
+    ) -> None:
+        if int(n) != n or n < 1:
+            raise ValueError("The rate divider must be a positive integer")
+        if update_method is not None and not hasattr(block, update_method):
+            update_method = None
+        object.__setattr__(self, "block", block)
+        object.__setattr__(self, "n", int(n))
+        object.__setattr__(self, "methods", tuple(methods))
+        object.__setattr__(self, "update_method", update_method)
+        object.__setattr__(self, "_k", 0)  # Control cycle counter
+        object.__setattr__(self, "_held", {})
+        object.__setattr__(self, "_t", [])
+        object.__setattr__(self, "_history", {name: [] for name in self.methods})
+
+    def __getattr__(self, name: str) -> Any:
+        # Called only for the attributes not found in the wrapper
+        if name.startswith("__") or "block" not in self.__dict__:
+            raise AttributeError(name)
+        if name in self.methods:
+            return partial(self._call, name)
+        if name == self.update_method:
+            return self._update
+        return getattr(self.block, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _OWN:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.block, name, value)
+
+    def _call(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """Execute the method on the active cycles, otherwise hold its output."""
+        if self._k == 0 or name not in self._held:
+            self._held[name] = getattr(self.block, name)(*args, **kwargs)
+        return self._held[name]
+
+    def _update(self, T_s: float, *args: Any, **kwargs: Any) -> None:
+        """Update the block states on the active cycles."""
+        if self._k == 0:
+            getattr(self.block, self.update_method)(self.n * T_s, *args, **kwargs)  # type: ignore
+
+    def tick(self, t: float) -> None:
+        """
+        Record the outputs and advance the cycle counter.
+
+        Parameters
+        ----------
+        t : float
+            Time (s) of the completed control cycle.
+
+        """
+        if self._k == 0 and self._held:
+            self._t.append(t)
+            for name in self.methods:
+                self._history[name].append(self._held.get(name))
+        self._k = (self._k + 1) % self.n
+
+    def post_process(self) -> SimpleNamespace:
+        """Return the recorded outputs and their time instants."""
+        outputs = {name: np.array(values) for name, values in self._history.items()}
+        return SimpleNamespace(t=np.array(self._t), **outputs)
+
+    def get_cycle_state(self) -> dict[str, Any]:
+        """
+        Return the cycle counter and the held outputs.
+
+        The states of the block itself are available via its own `get_state`.
+
+        """
+        return {"k": self._k, "held": dict(self._held)}
+
+    def set_cycle_state(self, state: dict[str, Any]) -> None:
+        """Set the cycle counter and the held outputs."""
+        self._k = state["k"]
+        self._held = dict(state["held"])
+
+    def clear_data(self) -> None:
+        """Clear the recorded outputs."""
+        self._t.clear()
+        for values in self._history.values():
+            values.clear()
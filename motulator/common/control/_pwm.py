@@ -8,7 +8,7 @@ strategies.
 
 from cmath import exp, phase
 from math import acos, floor, pi, sqrt
-from typing import Literal
+from typing import Any, Literal
 
 from motulator.common.utils import abc2complex, complex2abc
 
@@ -207,6 +207,18 @@ class PWM:
         self.realized_voltage = 0.5 * (self._old_u_c_ab + u_c_ab)
         self._old_u_c_ab = u_c_ab
 
+    def get_state(self) -> dict[str, Any]:
+        """Return the realized voltage and the latest voltage."""
+        return {
+            "realized_voltage": self.realized_voltage,
+            "old_u_c_ab": self._old_u_c_ab,
+        }
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the realized voltage and the latest voltage."""
+        self.realized_voltage = state["realized_voltage"]
+        self._old_u_c_ab = state["old_u_c_ab"]
+
     def __call__(
         self, T_s: float, u_c_ref_ab: complex, u_dc: float, w: float
     ) -> list[float]:
@@ -0,0 +1,183 @@
+"""
+Shared-memory bridge to an external controller.
+
+The measurements and duty ratios are exchanged with a controller running in another
+local process through a shared memory block. The synchronization is based on polling
+the sequence numbers of the ring buffer slots, so that the round-trip latency is low
+enough for full-rate controller-in-the-loop simulations. The controller side is
+implemented in :class:`SharedMemoryEndpoint`.
+
+"""
+
+import time
+from dataclasses import dataclass
+from math import nan
+from multiprocessing import shared_memory
+from typing import Any, Sequence
+
+import numpy as np
+
+from motulator.common.control._base import ControlSystem, TimeSeries
+from motulator.common.control._shm_endpoint import (
+    CMD,
+    MEAS,
+    SEQ,
+    block_size,
+    cmd_offset,
+    meas_offset,
+    wait_for,
+)
+from motulator.common.utils._utils import abc2complex
+
+
+# %%
+@dataclass
+class Measurements:
+    """Measured signals."""
+
+    i_abc: Any  # Phase currents
+    u_dc: float
+    w_M: float
+
+
+@dataclass
+class Feedbacks:
+    """Feedback signals."""
+
+    i_c_ab: complex
+    u_dc: float
+    w_M: float
+
+
+@dataclass
+class References:
+    """Commands received from the external controller."""
+
+    T_s: float
+    d_abc: Sequence[float]
+
+
+# %%
+class SharedMemoryControlSystem(ControlSystem):
+    """
+    Control system bridging to an external controller through shared memory.
+
+    In each sampling period, the measured phase currents, DC-bus voltage, and rotor
+    speed are written to the shared memory, and the sampling period and duty ratios are
+    read back from the external controller. The round-trip latency of each exchange is
+    recorded. The system models are used as such.
+
+    Parameters
+    ----------
+    name : str, optional
+        Name of the shared memory block. If not given, a unique name is generated.
+        The external controller attaches to the block using this name.
+    n_slots : int, optional
+        Number of slots in each ring, defaults to 64.
+    spin : int, optional
+        Number of busy-wait polls between yielding the processor, defaults to 1000.
+        Use a small value if the processes share a single processor core.
+    timeout : float, optional
+        Timeout (s) for waiting for the external controller, defaults to 10.
+
+    Notes
+    -----
+    The shared memory block is released by calling :meth:`close`.
+
+    """
+
+    def __init__(
+        self,
+        name: str | None = None,
+        n_slots: int = 64,
+        spin: int = 1000,
+        timeout: float = 10.0,
+    ) -> None:
+        super().__init__()
+        self._shm = shared_memory.SharedMemory(
+            name, create=True, size=block_size(n_slots)
+        )
+        buf = self._shm.buf
+        assert buf is not None
+        self._buf = buf
+        self._buf[:] = bytes(len(self._buf))
+        self.name: str = self._shm.name
+        self.n_slots = n_slots
+        self.spin = spin
+        self.timeout = timeout
+        self._k = 0
+        self._t_sent = 0.0
+        self._latency: list[float] = []
+
+    def get_measurement(self, mdl: Any) -> Measurements:
+        """Get measurements from sensors."""
+        if getattr(mdl, "lc_filter", None) is not None:
+            i_abc = mdl.lc_filter.meas_currents()
+        elif hasattr(mdl, "machine"):
+            i_abc = mdl.machine.meas_currents()
+        else:
+            i_abc = mdl.ac_filter.meas_currents()
+        u_dc = mdl.converter.meas_dc_voltage()
+        w_M = mdl.mechanics.meas_speed() if hasattr(mdl, "mechanics") else nan
+        return Measurements(i_abc, u_dc, w_M)
+
+    def get_feedback(self, meas: Measurements) -> Feedbacks:
+        """Send the measurements to the external controller."""
+        self._k += 1
+        k, i_abc = self._k, meas.i_abc
+        offset = meas_offset(k, self.n_slots)
+        MEAS.pack_into(
+            self._buf,
+            offset + SEQ.size,
+            self.t,
+            i_abc[0],
+            i_abc[1],
+            i_abc[2],
+            meas.u_dc,
+            meas.w_M,
+        )
+        self._t_sent = time.perf_counter()
+        SEQ.pack_into(self._buf, offset, k)
+        return Feedbacks(abc2complex(i_abc), meas.u_dc, meas.w_M)
+
+    def compute_output(self, fbk: Feedbacks) -> References:
+        """Wait for the commands from the external controller."""
+        offset = cmd_offset(self._k, self.n_slots)
+        if not wait_for(self._buf, offset, self._k, self.spin, self.timeout):
+            # The stale commands in the slot must not be used
+            raise TimeoutError("No commands from the external controller")
+        self._latency.append(time.perf_counter() - self._t_sent)
+        T_s, d_a, d_b, d_c = CMD.unpack_from(self._buf, offset + SEQ.size)
+        return References(T_s, [d_a, d_b, d_c])
+
+    def latency_percentiles(
+        self, q: Sequence[float] = (50, 90, 99, 99.9)
+    ) -> dict[float, float]:
+        """
+        Compute the percentiles of the round-trip latency.
+
+        Parameters
+        ----------
+        q : Sequence[float], optional
+            Percentiles, defaults to (50, 90, 99, 99.9).
+
+        Returns
+        -------
+        dict[float, float]
+            Latency (s) for each percentile.
+
+        """
+        values = np.percentile(self._latency, q)
+        return dict(zip(q, values.tolist(), strict=True))
+
+    def post_process(self) -> TimeSeries:
+        """Extend the post-process method with the round-trip latencies."""
+        ts = super().post_process()
+        ts.latency = np.array(self._latency)  # type: ignore
+        return ts
+
+    def close(self) -> None:
+        """Signal the external controller to stop and release the shared memory."""
+        SEQ.pack_into(self._buf, 0, 1)
+        self._shm.close()
+        self._shm.unlink()
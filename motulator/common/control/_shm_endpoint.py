@@ -0,0 +1,175 @@
+"""
+External endpoint of the shared-memory controller bridge.
+
+This module depends only on the Python standard library, so that it can be copied as
+such to the process running the controller under test. The shared memory block
+consists of 64-byte slots: a header slot with the closing flag, followed by a ring of
+measurement slots (written by the simulator) and a ring of command slots (written by
+the controller). Each slot starts with a sequence number (uint64), which is written
+after the payload. The reader polls the sequence number, so no locks are needed.
+
+- Measurement payload: model time `t`, phase currents `i_a`, `i_b`, `i_c`, DC-bus
+  voltage `u_dc`, and rotor speed `w_M` (float64).
+- Command payload: sampling period `T_s` and duty ratios `d_a`, `d_b`, `d_c` (float64).
+
+"""
+
+import struct
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import NamedTuple, Sequence
+
+# %%
+SLOT_SIZE = 64
+SEQ = struct.Struct("<Q")
+MEAS = struct.Struct("<6d")
+CMD = struct.Struct("<4d")
+
+
+class Measurements(NamedTuple):
+    """Measured signals."""
+
+    t: float
+    i_a: float
+    i_b: float
+    i_c: float
+    u_dc: float
+    w_M: float
+
+
+def meas_offset(k: int, n_slots: int) -> int:
+    """Offset of the measurement slot for sequence number `k`."""
+    return SLOT_SIZE * (1 + k % n_slots)
+
+
+def cmd_offset(k: int, n_slots: int) -> int:
+    """Offset of the command slot for sequence number `k`."""
+    return SLOT_SIZE * (1 + n_slots + k % n_slots)
+
+
+def block_size(n_slots: int) -> int:
+    """Size of the shared memory block."""
+    return SLOT_SIZE * (1 + 2 * n_slots)
+
+
+def wait_for(buf: memoryview, offset: int, k: int, spin: int, timeout: float) -> bool:
+    """
+    Poll the sequence number of a slot.
+
+    Parameters
+    ----------
+    buf : memoryview
+        Shared memory buffer.
+    offset : int
+        Offset of the slot.
+    k : int
+        Expected sequence number.
+    spin : int
+        Number of busy-wait polls between yielding the processor.
+    timeout : float
+        Timeout (s).
+
+    Returns
+    -------
+    bool
+        True if the slot was written, False if the bridge was closed.
+
+    """
+    deadline = time.perf_counter() + timeout
+    n = 0
+    while SEQ.unpack_from(buf, offset)[0] != k:
+        n += 1
+        if n >= spin:
+            n = 0
+            if SEQ.unpack_from(buf, 0)[0]:
+                return False
+            if time.perf_counter() > deadline:
+                raise TimeoutError("No response through shared memory")
+            time.sleep(0)
+    return True
+
+
+# %%
+class SharedMemoryEndpoint:
+    """
+    Controller-side endpoint of the shared-memory bridge.
+
+    Parameters
+    ----------
+    name : str
+        Name of the shared memory block, see `SharedMemoryControlSystem.name`.
+    n_slots : int, optional
+        Number of slots in each ring, defaults to 64. Must match the simulator side.
+    spin : int, optional
+        Number of busy-wait polls between yielding the processor, defaults to 1000.
+        Use a small value if the processes share a single processor core.
+    timeout : float, optional
+        Timeout (s) for waiting for the measurements, defaults to 10.
+
+    Examples
+    --------
+    >>> endpoint = SharedMemoryEndpoint(name)  # doctest: +SKIP
+    >>> while (meas := endpoint.receive()) is not None:  # doctest: +SKIP
+    ...     endpoint.send(125e-6, [0.5, 0.5, 0.5])
+    >>> endpoint.close()  # doctest: +SKIP
+
+    """
+
+    def __init__(
+        self, name: str, n_slots: int = 64, spin: int = 1000, timeout: float = 10.0
+    ) -> None:
+        if sys.version_info >= (3, 13):
+            self._shm = shared_memory.SharedMemory(name, track=False)
+        else:
+            # The simulator side owns the block, so do not register it to be unlinked
+            register = resource_tracker.register
+            resource_tracker.register = lambda name, rtype: None
+            try:
+                self._shm = shared_memory.SharedMemory(name)
+            finally:
+                resource_tracker.register = register
+        buf = self._shm.buf
+        assert buf is not None
+        self._buf = buf
+        self.n_slots = n_slots
+        self.spin = spin
+        self.timeout = timeout
+        self._k = 0
+
+    def receive(self) -> Measurements | None:
+        """
+        Wait for the next measurements.
+
+        Returns
+        -------
+        Measurements | None
+            Measurements, or None if the simulator has closed the bridge.
+
+        """
+        k = self._k + 1
+        offset = meas_offset(k, self.n_slots)
+        if not wait_for(self._buf, offset, k, self.spin, self.timeout):
+            return None
+        self._k = k
+        return Measurements(*MEAS.unpack_from(self._buf, offset + SEQ.size))
+
+    def send(self, T_s: float, d_abc: Sequence[float]) -> None:
+        """
+        Send the commands for the latest measurements.
+
+        Parameters
+        ----------
+        T_s : float
+            Sampling period (s).
+        d_abc : Sequence[float]
+            Duty ratios in the range [0, 1].
+
+        """
+        offset = cmd_offset(self._k, self.n_slots)
+        CMD.pack_into(self._buf, offset + SEQ.size, T_s, d_abc[0], d_abc[1], d_abc[2])
+        SEQ.pack_into(self._buf, offset, self._k)
+
+    def close(self) -> None:
+        """Detach from the shared memory block."""
+        self._shm.close()
@@ -1,21 +1,92 @@
-"""Model package."""
+"""
+Model package.
 
+The co-simulation server and client, and the Parareal driver, are imported when first
+accessed, so that the models can be used without importing asyncio and multiprocessing.
+
+"""
+
+from typing import TYPE_CHECKING
+
+from motulator.common.model._accumulators import (
+    RMS,
+    Accumulator,
+    Harmonics,
+    Integral,
+    Mean,
+    MinMax,
+    active_power,
+)
 from motulator.common.model._base import (
     Model,
     ModelTimeSeries,
+    StateEvent,
     Subsystem,
     SubsystemTimeSeries,
 )
+from motulator.common.model._cache import ResultCache, cache_key
+from motulator.common.model._events import Event, SetAttribute, SetSignal
 from motulator.common.model._pwm import CarrierComparison
-from motulator.common.model._simulation import Simulation, SimulationResults, SolverCfg
+from motulator.common.model._simulation import (
+    Simulation,
+    SimulationResults,
+    SimulationSnapshot,
+    SolverCfg,
+)
+from motulator.common.model._stop import (
+    GrowingOscillation,
+    LimitExceeded,
+    SteadyState,
+    StopCallback,
+    StopCondition,
+)
+from motulator.common.utils._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from motulator.common.model._cosim import CoSimulationServer
+    from motulator.common.model._cosim_client import CoSimulationClient
+    from motulator.common.model._parareal import Parareal, PararealStats
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "CoSimulationServer": "motulator.common.model._cosim",
+        "CoSimulationClient": "motulator.common.model._cosim_client",
+        "Parareal": "motulator.common.model._parareal",
+        "PararealStats": "motulator.common.model._parareal",
+    },
+)
 
 __all__ = [
+    "Accumulator",
     "CarrierComparison",
+    "CoSimulationClient",
+    "CoSimulationServer",
+    "Event",
+    "GrowingOscillation",
+    "Harmonics",
+    "Integral",
+    "LimitExceeded",
+    "Mean",
+    "MinMax",
     "Model",
     "ModelTimeSeries",
+    "Parareal",
+    "PararealStats",
+    "RMS",
+    "ResultCache",
+    "SetAttribute",
+    "SetSignal",
     "Simulation",
     "SolverCfg",
     "SimulationResults",
+    "SimulationSnapshot",
+    "StateEvent",
+    "SteadyState",
+    "StopCallback",
+    "StopCondition",
     "Subsystem",
     "SubsystemTimeSeries",
+    "active_power",
+    "cache_key",
 ]
@@ -0,0 +1,378 @@
+"""
+Streaming accumulators.
+
+The accumulators are updated from each solver segment during the simulation, so that
+the metrics, such as mean, RMS, extreme values, harmonics, and energies, are available
+without storing the waveforms. The signals are specified either by their dotted names,
+e.g., "machine.i_s_ab", or by functions of the signals of the segment, which are
+accessed as in the model's time series. The integrals are evaluated using the
+trapezoidal rule over the solver output points, so the results equal those computed
+from the stored waveforms.
+
+"""
+
+from math import pi
+from typing import TYPE_CHECKING, Any, Callable, Protocol, Sequence
+
+import numpy as np
+
+from motulator.common.model._base import ModelTimeSeries, Subsystem
+
+if TYPE_CHECKING:
+    from motulator.common.model._base import Model
+
+type Signal = str | Callable[[Any], Any]
+
+
+# %%
+class SegmentSignals:
+    """
+    Signals of a solver segment, extracted directly from the solver output.
+
+    The signals are accessed as in the model's time series, e.g., `segment.machine.
+    i_s_ab`. The extraction of each signal is set up on its first access and reused in
+    the subsequent segments: the states are read from the rows of the solver output,
+    the ZOH inputs are held, and the inputs are taken from their sources. The time
+    series of a subsystem is created from the rows only if its outputs or other derived
+    signals are accessed.
+
+    Parameters
+    ----------
+    mdl : Model
+        System model.
+
+    """
+
+    def __init__(self, mdl: "Model") -> None:
+        self.t = np.array([])
+        self.y: Any = np.empty((0, 0))
+        self._mdl = mdl
+        self._views: dict[Subsystem, _SubsystemSignals] = {}
+        index = 0
+        for subsystem in mdl.subsystems:
+            view = _SubsystemSignals(self, subsystem, index)
+            index += len(view.rows)
+            self._views[subsystem] = view
+            setattr(self, view.name, view)
+
+    def update(self, t: np.ndarray, y: Any) -> None:
+        """Set the solver output points and the phasor-valued solution."""
+        self.t, self.y = t, y
+        for view in self._views.values():
+            view.clear()
+
+    def held(self, name: str) -> np.ndarray:
+        """Return the ZOH input `name` held over the segment."""
+        return np.repeat(np.array([self._mdl.zoh_inputs[name]]), len(self.t), axis=0)
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the model-level ZOH inputs."""
+        if not name.startswith("_") and name in self._mdl.zoh_inputs:
+            return self.held(name)
+        error_msg = f"'{self.__class__.__name__}' has no attribute '{name}'"
+        raise AttributeError(error_msg)
+
+
+class _SubsystemSignals:
+    """Signals of a single subsystem over the solver segment."""
+
+    def __init__(
+        self, segment: SegmentSignals, subsystem: Subsystem, index: int
+    ) -> None:
+        self._segment = segment
+        self._subsystem = subsystem
+        self._extractors: dict[str, Callable[[], Any]] = {}
+        self._values: dict[str, Any] = {}
+        self._ts: Any = None
+        history = subsystem._history
+        names = list(vars(history)) if history is not None else []
+        self.index = index
+        self.rows = {name: index + k for k, name in enumerate(names)}
+        # Probe the time-series class once, to find the states it stores as such
+        probe = np.arange(1, len(names) + 1)[:, None] * np.array([1 + 2j, 3 + 4j])
+        self.name, ts = self._create_time_series(np.zeros(2), probe, 0)
+        self._states: dict[str, bool] = {}
+        for name, row in zip(names, probe, strict=True):
+            value = ts.__dict__.get(name)
+            if value is None or name in ts.__dict__.get("_deferred", {}):
+                continue
+            if np.array_equal(value, row):
+                self._states[name] = False
+            elif np.array_equal(value, row.real):
+                self._states[name] = True
+
+    def clear(self) -> None:
+        """Clear the signals of the previous segment."""
+        self._values.clear()
+        self._ts = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Extract the signal `name` of the current segment."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name not in self._values:
+            if (extractor := self._extractors.get(name)) is None:
+                extractor = self._extractors[name] = self._extractor(name)
+            self._values[name] = extractor()
+        return self._values[name]
+
+    def _extractor(self, name: str) -> Callable[[], Any]:
+        """Set up the extraction of the signal `name`."""
+        segment, key = self._segment, (self._subsystem, name)
+        if name in self._states:
+            row, real = self.rows[name], self._states[name]
+            return (lambda: segment.y[row].real) if real else (lambda: segment.y[row])
+        mdl = segment._mdl
+        if (input_name := mdl.zoh_connections.get(key)) is not None:
+            return lambda: segment.held(input_name)
+        if (source := mdl.connections.get(key)) is not None:
+            src, src_attr = source
+            view = segment._views[src]
+            return lambda: getattr(view, src_attr)
+        return lambda: getattr(self._time_series(), name)
+
+    def _time_series(self) -> Any:
+        """Create the time series of the subsystem for its derived signals."""
+        if self._ts is None:
+            segment, subsystem = self._segment, self._subsystem
+            t = segment.t
+            _, ts = self._create_time_series(t, segment.y, self.index)
+            mdl = segment._mdl
+            for (target, attr), input_name in mdl.zoh_connections.items():
+                if target is subsystem:
+                    ts.defer(attr, lambda name=input_name: segment.held(name))
+            ts.compute_zoh_input_derived_signals(t, subsystem)
+            for target, attr in mdl.connections:
+                if target is subsystem:
+                    ts.defer(attr, lambda attr=attr: np.array(getattr(self, attr)))
+            ts.compute_input_derived_signals(t, subsystem)
+            self._ts = ts
+        return self._ts
+
+    def _create_time_series(self, t: np.ndarray, y: Any, index: int) -> tuple[str, Any]:
+        """Create the time series of the subsystem from the rows of `y`."""
+        subsystem = self._subsystem
+        history = subsystem._history
+        if history is not None:
+            # The history class of the subsystem may provide derived quantities, e.g.,
+            # the stationary-frame states of the rotating-frame models
+            segment_history = type(history)()
+            for k, name in enumerate(vars(history)):
+                setattr(segment_history, name, y[index + k])
+            subsystem._history = segment_history
+        try:
+            return subsystem.create_time_series(t)
+        finally:
+            subsystem._history = history
+
+
+# %%
+def get_signal(ts: ModelTimeSeries | SegmentSignals, signal: Signal) -> np.ndarray:
+    """Get the signal from the time series."""
+    if callable(signal):
+        return np.asarray(signal(ts))
+    value: Any = ts
+    for name in signal.split("."):
+        value = getattr(value, name)
+    return np.asarray(value)
+
+
+def active_power(u: Signal, i: Signal) -> Callable[[Any], Any]:
+    """
+    Return a function computing the active power from the space vectors.
+
+    Parameters
+    ----------
+    u : str | Callable[[Any], Any]
+        Voltage space vector, e.g., "machine.u_s_ab".
+    i : str | Callable[[Any], Any]
+        Current space vector, e.g., "machine.i_s_ab".
+
+    Returns
+    -------
+    Callable[[Any], Any]
+        Function computing the active power (W).
+
+    """
+    return lambda ts: 1.5 * np.real(get_signal(ts, u) * np.conj(get_signal(ts, i)))
+
+
+def _trapezoid(t: np.ndarray, y: np.ndarray) -> Any:
+    """Integrate along the last axis using the trapezoidal rule."""
+    return np.sum(0.5 * (y[..., 1:] + y[..., :-1]) * np.diff(t), axis=-1)
+
+
+# %%
+class Accumulator(Protocol):
+    """
+    Base class for streaming accumulators.
+
+    Parameters
+    ----------
+    signal : str | Callable[[Any], Any]
+        Signal to be accumulated, given by its dotted name or as a function of the
+        signals of the segment, see :class:`SegmentSignals`. Multi-dimensional signals
+        have the time on the last axis, e.g., the phase quantities from `complex2abc`.
+    t_start : float, optional
+        Start time (s) of the accumulation, defaults to 0.
+
+    """
+
+    signal: Signal
+    t_start: float
+    T: float
+
+    def __init__(self, signal: Signal, t_start: float = 0.0) -> None:
+        self.signal = signal
+        self.t_start = t_start
+        self.T = 0.0  # Accumulated duration
+
+    def update(self, ts: ModelTimeSeries | SegmentSignals) -> None:
+        """Update from the signals of a solver segment."""
+        t = ts.t
+        if len(t) == 0 or t[-1] <= self.t_start:
+            return
+        y = get_signal(ts, self.signal)
+        if t[0] < self.t_start:
+            # Split the segment at the start time
+            k = np.searchsorted(t, self.t_start, side="right")
+            y0 = y[..., k - 1] + (y[..., k] - y[..., k - 1]) * (
+                (self.t_start - t[k - 1]) / (t[k] - t[k - 1])
+            )
+            t = np.concatenate(([self.t_start], t[k:]))
+            y = np.concatenate((np.asarray(y0)[..., None], y[..., k:]), axis=-1)
+        self.T += t[-1] - t[0]
+        self.accumulate(t, y)
+
+    def accumulate(self, t: np.ndarray, y: np.ndarray) -> None:
+        """Accumulate the samples."""
+        ...
+
+    def result(self) -> Any:
+        """Return the accumulated metric."""
+        ...
+
+
+class Integral(Accumulator):
+    """Time integral of the signal, e.g., energy from power."""
+
+    def __init__(self, signal: Signal, t_start: float = 0.0) -> None:
+        super().__init__(signal, t_start)
+        self.value: Any = 0.0
+
+    def accumulate(self, t: np.ndarray, y: np.ndarray) -> None:
+        """Accumulate the samples."""
+        self.value = self.value + _trapezoid(t, y)
+
+    def result(self) -> Any:
+        """Return the integral."""
+        return self.value
+
+
+class Mean(Integral):
+    """Time average of the signal."""
+
+    def result(self) -> Any:
+        """Return the mean value."""
+        return self.value / self.T if self.T > 0 else np.nan
+
+
+class RMS(Integral):
+    """
+    Root-mean-square value of the signal.
+
+    For complex space vectors, the magnitude is used. With the peak-value scaling, the
+    RMS value of the phase quantities is obtained by dividing the result by sqrt(2).
+
+    """
+
+    def accumulate(self, t: np.ndarray, y: np.ndarray) -> None:
+        """Accumulate the squared samples."""
+        super().accumulate(t, np.abs(y) ** 2)
+
+    def result(self) -> Any:
+        """Return the RMS value."""
+        return np.sqrt(self.value / self.T) if self.T > 0 else np.nan
+
+
+class MinMax(Accumulator):
+    """Minimum and maximum values of the signal."""
+
+    def __init__(self, signal: Signal, t_start: float = 0.0) -> None:
+        super().__init__(signal, t_start)
+        self.min: Any = np.inf
+        self.max: Any = -np.inf
+
+    def accumulate(self, t: np.ndarray, y: np.ndarray) -> None:
+        """Accumulate the samples."""
+        self.min = np.minimum(self.min, np.min(y, axis=-1))
+        self.max = np.maximum(self.max, np.max(y, axis=-1))
+
+    def result(self) -> tuple[Any, Any]:
+        """Return the minimum and maximum values."""
+        return self.min, self.max
+
+
+class Harmonics(Accumulator):
+    """
+    Harmonic components at multiples of the fundamental frequency.
+
+    The Fourier integrals are accumulated directly over the non-uniform solver output
+    points, which corresponds to a continuous-time Goertzel filter. The accumulation
+    should cover an integer number of fundamental periods.
+
+    Parameters
+    ----------
+    signal : str | Callable[[Any], Any]
+        Real signal or complex space vector.
+    f_1 : float
+        Fundamental frequency (Hz).
+    orders : Sequence[int], optional
+        Harmonic orders, defaults to (1, 3, 5, 7). For complex space vectors, the
+        negative orders correspond to the negative-sequence components.
+    t_start : float, optional
+        Start time (s) of the accumulation, defaults to 0.
+
+    """
+
+    def __init__(
+        self,
+        signal: Signal,
+        f_1: float,
+        orders: Sequence[int] = (1, 3, 5, 7),
+        t_start: float = 0.0,
+    ) -> None:
+        super().__init__(signal, t_start)
+        self.w = 2 * pi * f_1 * np.asarray(orders)
+        self.orders = list(orders)
+        self.value: Any = 0j
+        self.is_real = True
+
+    def accumulate(self, t: np.ndarray, y: np.ndarray) -> None:
+        """Accumulate the Fourier integrals."""
+        self.is_real = self.is_real and not np.iscomplexobj(y)
+        kernel = np.exp(-1j * np.multiply.outer(self.w, t))  # Shape (n_orders, n)
+        self.value = self.value + _trapezoid(t, y[..., None, :] * kernel)
+
+    def result(self) -> dict[int, Any]:
+        """
+        Return the harmonic components.
+
+        Returns
+        -------
+        dict[int, Any]
+            Complex amplitudes (peak values) of the harmonics. For real signals, the
+            zeroth order is the mean value.
+
+        """
+        if self.T <= 0:
+            return {k: np.nan for k in self.orders}
+        c = np.moveaxis(np.asarray(self.value) / self.T, -1, 0)
+        scale = [2 if self.is_real and k != 0 else 1 for k in self.orders]
+        return {k: s * c_k for k, s, c_k in zip(self.orders, scale, c, strict=True)}
+
+    def thd(self) -> Any:
+        """Return the total harmonic distortion of the accumulated harmonics."""
+        c = self.result()
+        distortion = sum(np.abs(c[k]) ** 2 for k in self.orders if abs(k) > 1)
+        return np.sqrt(distortion) / np.abs(c[1]) if 1 in c else np.nan
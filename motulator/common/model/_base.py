@@ -1,12 +1,23 @@
 """Base classes for models."""
 
+from bisect import bisect_left
+from cmath import exp
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Callable, Protocol
 
 import numpy as np
-from scipy.integrate._ivp.ivp import OdeResult
 
 from motulator.common.model._pwm import ZOH, CarrierComparison
+from motulator.common.utils._time_series import (
+    Resampler,
+    TimeWindow,
+    signal_names,
+    uniform_grid,
+)
+from motulator.common.utils._utils import BaseValues
+
+if TYPE_CHECKING:
+    from scipy.integrate._ivp.ivp import OdeResult
 
 
 # %%
@@ -26,6 +37,56 @@ class SubsystemStateHistory(Protocol):
     """Protocol for subsystem state histories."""
 
 
+@dataclass
+class StateEvent:
+    """
+    Zero crossing of a function of the subsystem states.
+
+    The solver stops at the zero crossing, so that it does not step across the
+    resulting discontinuity, and continues from there after calling `action`.
+
+    Parameters
+    ----------
+    func : Callable[[float], float]
+        Function of time, evaluated after the states of the subsystem have been set.
+    direction : float, optional
+        Direction of the zero crossing: positive for rising, negative for falling, and
+        zero for both, defaults to 0.
+    action : Callable[[], None], optional
+        Function called at the event, e.g., switching the conduction mode of the
+        subsystem.
+
+    """
+
+    func: Callable[[float], float]
+    direction: float = 0.0
+    action: Callable[[], None] | None = None
+
+
+def default_state_scale(name: str, base: BaseValues) -> float:
+    """
+    Return the typical magnitude of a state, based on its name.
+
+    The quantity is identified from the prefix of the name, e.g., "psi_s_ab" is a flux
+    linkage, "u_dc" is a voltage, and "exp_j_theta_M" is a unit-magnitude complex
+    number. The rotor speeds, "w_M" and "w_L", are mechanical angular speeds. Unknown
+    quantities are scaled by one.
+
+    """
+    quantity = name.split("_", maxsplit=1)[0]
+    if quantity == "psi":
+        return base.psi
+    if quantity == "i":
+        return base.i
+    if quantity == "u":
+        return base.u
+    if quantity == "w":
+        return base.w_M if base.w_M > 0 else base.w
+    if quantity == "tau":
+        return base.tau if base.tau > 0 else 1.0
+    return 1.0
+
+
 class Subsystem[
     Inp: SubsystemInputs,
     Out: SubsystemOutputs,
@@ -60,10 +121,47 @@ class Subsystem[
         """Set output variables."""
         ...
 
+    def state_scales(self, base: BaseValues) -> list[float]:
+        """
+        Return the typical magnitudes of the states, used to scale solver tolerances.
+
+        Subsystems can override this method, if the naming convention of
+        :func:`default_state_scale` does not apply to their states.
+
+        """
+        if self.state is None:
+            return []
+        return [default_state_scale(name, base) for name in vars(self.state)]
+
     def rhs(self, t: float) -> list[complex]:
         """Compute state derivatives."""
         ...
 
+    def get_state(self) -> dict[str, Any]:
+        """
+        Return a copy of the states, e.g., for restarting the simulation.
+
+        Subsystems with discrete modes, e.g., diode conduction, extend this method.
+
+        """
+        return {} if self.state is None else dict(vars(self.state))
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the states returned by :meth:`get_state`."""
+        for attr, value in state.items():
+            setattr(self.state, attr, value)
+
+    def state_events(self, t: float) -> list[StateEvent]:
+        """
+        Return the state events for the solver segment starting at `t`.
+
+        Subsystems with discontinuities in their state derivatives, e.g., diode
+        commutations, can override this method. It is called at the beginning of each
+        solver segment.
+
+        """
+        return []
+
     def extend_state_history(self, sol_y: list[list[float]], index: int) -> int:
         """Extend the state history with values from solver output."""
         if self._history is not None:
@@ -81,11 +179,42 @@ class Subsystem[
 
 
 # %%
+@dataclass
+class ZOHInputHistory:
+    """
+    Run-length-encoded history of a zero-order-hold input.
+
+    Each run stores the index of its first sample and the held value. A new run is
+    started only if the value changes.
+
+    """
+
+    start: list[int] = field(default_factory=list)
+    value: list[Any] = field(default_factory=list)
+
+    def append(self, start: int, value: Any) -> None:
+        """Append a run, unless the value equals the latest one."""
+        if self.value:
+            last = self.value[-1]
+            if value is last or np.array_equal(value, last):
+                return
+        self.start.append(start)
+        self.value.append(value)
+
+    def expand(self, n: int) -> np.ndarray:
+        """Expand the runs to `n` samples."""
+        if not self.value:
+            return np.array([])
+        lengths = np.diff([*self.start, n])
+        return np.repeat(np.array(self.value), lengths, axis=0)
+
+
 @dataclass
 class ModelStateHistory:
     """Temporary storage."""
 
     t: list[float] = field(default_factory=list)
+    zoh: dict[str, ZOHInputHistory] = field(default_factory=dict)
 
 
 class Model:
@@ -100,6 +229,12 @@ class Model:
     the simulation results, which includes the time history and the ZOH inputs. The
     class is designed to be subclassed for specific applications.
 
+    The rotor and grid angles are states of unit-magnitude complex numbers, whose names
+    start with "exp_j_theta". If `real_angles` is True, the solver integrates the real
+    angles instead, so that the rotating phasors do not limit the step size. The angles
+    are wrapped at the beginning of each solver segment, and the phasors are formed
+    from them for the subsystems and for the state history.
+
     """
 
     def __init__(self, pwm: bool = False, delay: int = 0) -> None:
@@ -110,7 +245,24 @@ class Model:
         self.connections: dict[tuple[Subsystem, str], tuple[Subsystem, str]] = {}
         self.zoh_connections: dict[tuple[Subsystem, str], str] = {}
         self.zoh_inputs: dict[str, Any] = {}
+        self.real_angles: bool = False
         self._history = ModelStateHistory()
+        self._angle_index: list[int] | None = None
+
+    @property
+    def angle_index(self) -> list[int]:
+        """Indices of the unit-phasor angle states in the state list."""
+        if self._angle_index is None:
+            names = [
+                name
+                for subsystem in self.subsystems
+                if subsystem.state is not None
+                for name in vars(subsystem.state)
+            ]
+            self._angle_index = [
+                k for k, name in enumerate(names) if name.startswith("exp_j_theta")
+            ]
+        return self._angle_index
 
     def get_initial_values(self) -> list[complex]:
         """Get initial values of all subsystems before the solver."""
@@ -120,6 +272,70 @@ class Model:
                 state0.extend(vars(subsystem.state).values())
         return state0
 
+    def get_solver_initial_values(self) -> list[complex]:
+        """Get initial values of all subsystems in the solver's state representation."""
+        state0 = self.get_initial_values()
+        if self.real_angles:
+            # The phase angle is wrapped to (-pi, pi]
+            for k in self.angle_index:
+                state0[k] = complex(np.angle(state0[k]))
+        return state0
+
+    def to_phasors(self, sol_y: Any) -> Any:
+        """Convert the angles of the solver output to phasors, if needed."""
+        if not self.real_angles or not self.angle_index:
+            return sol_y
+        y = np.array(sol_y, dtype=complex)
+        y[self.angle_index] = np.exp(1j * np.real(y[self.angle_index]))
+        return y
+
+    def get_state_scales(self, base: BaseValues) -> list[float]:
+        """Get the typical magnitudes of all states, in the order of the state list."""
+        scales: list[float] = []
+        for subsystem in self.subsystems:
+            scales.extend(subsystem.state_scales(base))
+        return scales
+
+    def get_state(self) -> dict[str, Any]:
+        """
+        Return a copy of the model state, e.g., for restarting the simulation.
+
+        Returns
+        -------
+        dict[str, Any]
+            Time "t0", ZOH inputs "zoh_inputs", computational delay "delay", carrier
+            direction "pwm", and the states of the subsystems "subsystems", keyed by
+            their attribute names in the model, e.g., "machine".
+
+        """
+        return {
+            "t0": self.t0,
+            "zoh_inputs": dict(self.zoh_inputs),
+            "delay": self.delay.get_state(),
+            "pwm": self.pwm.get_state(),
+            "subsystems": {
+                name: subsystem.get_state()
+                for name, subsystem in self._named_subsystems()
+            },
+        }
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the model state returned by :meth:`get_state` and update the outputs."""
+        self.t0 = state["t0"]
+        for name, value in state["zoh_inputs"].items():
+            self.set_zoh_input(name, value)
+        self.delay.set_state(state["delay"])
+        self.pwm.set_state(state["pwm"])
+        for name, subsystem in self._named_subsystems():
+            subsystem.set_state(state["subsystems"][name])
+        self.set_outputs(self.t0)
+        self.interconnect()
+
+    def _named_subsystems(self) -> list[tuple[str, Subsystem]]:
+        """Return the subsystems together with their attribute names."""
+        names = {id(value): name for name, value in vars(self).items()}
+        return [(names[id(subsystem)], subsystem) for subsystem in self.subsystems]
+
     def set_zoh_input(self, name: str, value: Any) -> None:
         """Set a specific ZOH input value."""
         self.zoh_inputs[name] = value
@@ -144,34 +360,143 @@ class Model:
         for (target, target_attr), (src, src_attr) in self.connections.items():
             setattr(target.inp, target_attr, getattr(src.out, src_attr))
 
+    def set_solver_states(self, state_list: list[complex]) -> list[complex]:
+        """Set states in all subsystems from the solver states."""
+        if self.real_angles:
+            state_list = list(state_list)
+            for k in self.angle_index:
+                state_list[k] = exp(1j * state_list[k].real)
+        self.set_states(state_list)
+        return state_list
+
+    def get_solver_events(self, t: float) -> list[tuple[Callable, StateEvent]]:
+        """
+        Get the state events of all subsystems as solver event functions.
+
+        Parameters
+        ----------
+        t : float
+            Start time (s) of the solver segment.
+
+        Returns
+        -------
+        list[tuple[Callable, StateEvent]]
+            Terminal event functions of time and solver states, see
+            :func:`scipy.integrate.solve_ivp`, and the corresponding state events.
+
+        """
+        events = []
+        for subsystem in self.subsystems:
+            for event in subsystem.state_events(t):
+
+                def func(t_: float, y: Any, event: StateEvent = event) -> float:
+                    self.set_solver_states(y)
+                    return event.func(t_)
+
+                func.terminal = True  # type: ignore[attr-defined]
+                func.direction = event.direction  # type: ignore[attr-defined]
+                events.append((func, event))
+        return events
+
     def rhs(self, t: float, state_list: list[complex]) -> list[complex]:
         """Compute complete state derivative list for the solver."""
-        self.set_states(state_list)
+        state_list = self.set_solver_states(state_list)
         self.set_outputs(t)
         self.interconnect()
         rhs_list: list[complex] = []
         for subsystem in self.subsystems:
             if derivatives := subsystem.rhs(t):
                 rhs_list.extend(derivatives)
+        if self.real_angles:
+            # d/dt exp(j*theta) = j*w*exp(j*theta) gives the angular speed w
+            for k in self.angle_index:
+                rhs_list[k] = (rhs_list[k] * state_list[k].conjugate()).imag
         return rhs_list
 
-    def save(self, sol: OdeResult) -> None:
+    def save(self, sol: "OdeResult") -> None:
         """Save solution with all ZOH inputs."""
-        self._history.t.extend(sol.t)
-        # Save ZOH inputs for the current time span
+        # Save ZOH inputs for the current time span as runs
+        start = len(self._history.t)
         for name, value in self.zoh_inputs.items():
-            if not hasattr(self._history, name):
-                setattr(self._history, name, [])
-            getattr(self._history, name).extend([value] * len(sol.t))
+            self._history.zoh.setdefault(name, ZOHInputHistory()).append(start, value)
+        self._history.t.extend(sol.t)
         # Save states
+        sol_y = self.to_phasors(sol.y)
         index = 0
         for subsystem in self.subsystems:
-            index = subsystem.extend_state_history(sol.y, index)
+            index = subsystem.extend_state_history(sol_y, index)
 
 
 # %%
+def defer_signals(obj: Any, names: str | tuple[str, ...], func: Callable) -> None:
+    """
+    Defer computing time series until they are first accessed.
+
+    Parameters
+    ----------
+    obj : Any
+        Time-series container.
+    names : str | tuple[str, ...]
+        Name(s) of the time series. If multiple names are given, `func` returns a
+        tuple of the corresponding time series.
+    func : Callable[[], Any]
+        Function computing the time series.
+
+    """
+    names = (names,) if isinstance(names, str) else names
+    deferred = obj.__dict__.setdefault("_deferred", {})
+    for name in names:
+        obj.__dict__.pop(name, None)
+        deferred[name] = (names, func)
+
+
+def resolve_deferred(obj: Any, name: str) -> Any:
+    """Compute and cache the deferred time series `name` of `obj`."""
+    deferred = obj.__dict__.get("_deferred", {})
+    if name not in deferred:
+        error_msg = f"'{obj.__class__.__name__}' has no attribute '{name}'"
+        raise AttributeError(error_msg)
+    names, func = deferred[name]
+    for key in names:
+        deferred.pop(key, None)
+    values = func()
+    for key, value in zip(names, values if len(names) > 1 else (values,), strict=True):
+        obj.__dict__[key] = value
+    return obj.__dict__[name]
+
+
+def resolve_all_deferred(obj: Any) -> dict[str, Any]:
+    """Compute all deferred time series of `obj` and return its attributes."""
+    while deferred := obj.__dict__.get("_deferred"):
+        resolve_deferred(obj, next(iter(deferred)))
+    obj.__dict__.pop("_deferred", None)
+    return obj.__dict__
+
+
+class LazyTimeSeries:
+    """Container of time series, which are computed on first access."""
+
+    def defer(self, names: str | tuple[str, ...], func: Callable) -> None:
+        """Defer computing time series until they are first accessed."""
+        defer_signals(self, names, func)
+
+    def __getattr__(self, name: str) -> Any:
+        """Compute deferred time series on first access."""
+        return resolve_deferred(self, name)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Compute deferred time series before pickling."""
+        return resolve_all_deferred(self)
+
+
 class SubsystemTimeSeries[S: Subsystem](Protocol):
-    """Base class for subsystem time series."""
+    """
+    Base class for subsystem time series.
+
+    Derived signals are registered using :meth:`defer`, so that they are computed only
+    when first accessed. The computed signals are cached.
+
+    """
 
     t: np.ndarray
 
@@ -183,10 +508,30 @@ class SubsystemTimeSeries[S: Subsystem](Protocol):
         """Compute additional time series using subsystem's regular inputs."""
         pass
 
+    def defer(self, names: str | tuple[str, ...], func: Callable) -> None:
+        """Defer computing time series until they are first accessed."""
+        defer_signals(self, names, func)
+
+    def __getattr__(self, name: str) -> Any:
+        """Compute deferred time series on first access."""
+        return resolve_deferred(self, name)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Compute deferred time series before pickling."""
+        return resolve_all_deferred(self)
+
 
 @dataclass
 class ModelTimeSeries:
-    """Container for simulation result time series."""
+    """
+    Container for simulation result time series.
+
+    The time series of the ZOH inputs, the subsystem inputs, and the derived signals
+    are computed when first accessed, so that the post-processing cost scales with the
+    signals actually used. The subsystem parameters should not be changed before the
+    results have been accessed.
+
+    """
 
     _history: InitVar[ModelStateHistory]
     subsystems: InitVar[list[Subsystem] | None] = None
@@ -198,10 +543,10 @@ class ModelTimeSeries:
 
     def __post_init__(self, history, subsystems, connections, zoh_connections) -> None:
         self.t = np.array(history.t)
-        # Process ZOH inputs
-        for attr_name, value in vars(history).items():
-            if attr_name != "t" and not attr_name.startswith("_"):
-                setattr(self, attr_name, np.array(value))
+        # Process ZOH inputs, which are expanded from the runs when accessed
+        self._zoh_history: dict[str, ZOHInputHistory] = history.zoh
+        for name in history.zoh:
+            defer_signals(self, name, self._expand_zoh_input(name))
         # Process subsystems
         zoh_connections = zoh_connections or {}
         if subsystems is not None and connections is not None:
@@ -210,8 +555,93 @@ class ModelTimeSeries:
     def __getattr__(self, name: str) -> Any:
         """Support type checking for dynamic attributes."""
         # This helps type checkers understand dynamic attributes
-        error_msg = f"'{self.__class__.__name__}' has no attribute '{name}'"
-        raise AttributeError(error_msg)
+        return resolve_deferred(self, name)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Compute deferred time series before pickling."""
+        return resolve_all_deferred(self)
+
+    def window(self, t0: float, t1: float) -> "ModelTimeSeries":
+        """
+        Select the time window [t0, t1].
+
+        Parameters
+        ----------
+        t0, t1 : float
+            Start and end of the window (s).
+
+        Returns
+        -------
+        ModelTimeSeries
+            Time series, whose arrays are views of the original arrays.
+
+        """
+        window = TimeWindow(self.t, t0, t1)
+        return self._map(window(self.t), window)
+
+    def resample(self, dt: float, method: str = "linear") -> "ModelTimeSeries":
+        """
+        Resample all time series on a uniform time grid.
+
+        Parameters
+        ----------
+        dt : float
+            Sampling interval (s).
+        method : str, optional
+            Resampling method, "linear" (default) or "zoh". The interpolation never
+            crosses the switching instants, and the integer-valued signals are held.
+
+        Returns
+        -------
+        ModelTimeSeries
+            Resampled time series.
+
+        """
+        t = uniform_grid(self.t, dt)
+        return self._map(t, Resampler(self.t, t, method))
+
+    def align(self, other: Any, method: str = "linear") -> "ModelTimeSeries":
+        """
+        Resample all time series at the time instants of other time series.
+
+        Parameters
+        ----------
+        other : Any
+            Time series with the time instants `other.t`, e.g., the control system's
+            time series.
+        method : str, optional
+            Resampling method, "linear" (default) or "zoh".
+
+        Returns
+        -------
+        ModelTimeSeries
+            Resampled time series.
+
+        """
+        t = np.asarray(other.t)
+        return self._map(t, Resampler(self.t, t, method))
+
+    def _map(self, t: np.ndarray, func: Callable[..., Any]) -> "ModelTimeSeries":
+        """Apply `func` lazily to all time series."""
+
+        def mapped(src: Any, name: str) -> Callable[[], Any]:
+            # The time axis is the last one, see complex2abc()
+            return lambda: func(getattr(src, name), axis=-1)
+
+        ts = ModelTimeSeries(ModelStateHistory())
+        ts.t = t
+        for name in signal_names(self):
+            value = self.__dict__.get(name)
+            if name == "t":
+                continue
+            if value is not None and not isinstance(value, np.ndarray):
+                subsystem_ts = LazyTimeSeries()
+                for key in signal_names(value):
+                    subsystem_ts.defer(key, mapped(value, key))
+                setattr(ts, name, subsystem_ts)
+            else:
+                defer_signals(ts, name, mapped(self, name))
+        return ts
 
     def build_subsystem_time_series(
         self, subsystems: list, connections: dict, zoh_connections: dict
@@ -255,7 +685,7 @@ class ModelTimeSeries:
             return
         for (target, target_attr), input_name in zoh_connections.items():
             if (target_ts := ts_objects.get(target)) is not None:
-                setattr(target_ts, target_attr, np.array(getattr(self, input_name)))
+                target_ts.defer(target_attr, self._expand_zoh_input(input_name))
 
     def _compute_zoh_input_derived_signals(
         self, subsystems: list, ts_objects: dict
@@ -286,8 +716,21 @@ class ModelTimeSeries:
             target_ts = ts_objects.get(target)
             source_ts = ts_objects.get(src)
             if target_ts is not None and source_ts is not None:
-                data = getattr(source_ts, src_attr)
-                setattr(target_ts, target_attr, np.array(data))
+                target_ts.defer(target_attr, self._copy_signal(source_ts, src_attr))
+
+    def _expand_zoh_input(self, name: str) -> Callable[[], np.ndarray]:
+        """Return a function expanding the ZOH input `name` to all time instants."""
+        runs = self._zoh_history.get(name, ZOHInputHistory())
+        n = len(self.t)
+        # Copy the runs up to the current time, since the simulation may continue
+        k = bisect_left(runs.start, n)
+        runs = ZOHInputHistory(runs.start[:k], runs.value[:k])
+        return lambda: runs.expand(n)
+
+    @staticmethod
+    def _copy_signal(source: Any, name: str) -> Callable[[], np.ndarray]:
+        """Return a function copying the time series `name` of `source`."""
+        return lambda: np.array(getattr(source, name))
 
     def _compute_input_derived_signals(
         self, subsystems: list, ts_objects: dict
@@ -339,3 +782,11 @@ class Delay:
         self.data.append(u)
         # Pop the first element and return it
         return self.data.pop(0)
+
+    def get_state(self) -> dict[str, Any]:
+        """Return a copy of the buffer."""
+        return {"data": list(self.data)}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the buffer returned by :meth:`get_state`."""
+        self.data = list(state["data"])
@@ -0,0 +1,585 @@
+"""
+Content-addressed cache of simulation results.
+
+The key of a simulation is a digest of its full configuration: the subsystems of the
+continuous-time model with their parameters, the control system with its configuration
+dataclasses, the solver configuration, the events, the stop conditions, the
+accumulators, and the stop time. The source files of motulator and of the modules
+defining the classes of the configuration are included, so that editing the code
+invalidates the stored results. Python functions, e.g., reference and load torque
+profiles, are included by their code, default arguments, closure variables, and the
+global variables they refer to. Other callables can be tagged using :func:`cache_key`.
+The results are stored in the columnar format of :meth:`SimulationResults.save`,
+including the metrics and the stop reason, together with the final states of the
+accumulators::
+
+    cache/
+        3f2a.../
+            entry.json
+            accumulators.npy
+            manifest.json
+            mdl/...
+            ctrl/...
+
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from dataclasses import dataclass, field
+from functools import cache, partial
+from importlib.metadata import PackageNotFoundError, version
+from inspect import isclass, ismethod, ismodule, isroutine
+from pathlib import Path
+from types import CodeType, FunctionType
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from motulator.common.model._accumulators import Accumulator
+    from motulator.common.model._simulation import Simulation, SimulationResults
+
+try:
+    _VERSION = version("motulator")
+except PackageNotFoundError:
+    _VERSION = ""
+
+
+# %%
+@cache
+def _module_digest(name: str) -> str:
+    """Return the digest of the source file of a module, or "" if not available."""
+    file = getattr(sys.modules.get(name), "__file__", None)
+    if not file:
+        return ""
+    try:
+        return hashlib.blake2b(Path(file).read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return ""
+
+
+@cache
+def _package_digest() -> str:
+    """Return the digest of the source files of motulator."""
+    root = Path(__file__).parents[2]
+    digest = hashlib.blake2b(digest_size=16)
+    for file in sorted(root.rglob("*.py")):
+        digest.update(file.relative_to(root).as_posix().encode())
+        digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def _class_digests(cls: type) -> list[str]:
+    """Return the digests of the modules defining the class and its bases."""
+    return [_module_digest(klass.__module__) for klass in cls.__mro__]
+
+
+def cache_key[F: Callable](key: str) -> Callable[[F], F]:
+    """
+    Tag a callable with a key used in place of its contents.
+
+    Tagged callables are fingerprinted by their key only, so the key should be changed
+    when the behavior changes. Alternatively, the stored results can be removed using
+    :meth:`ResultCache.invalidate`.
+
+    Parameters
+    ----------
+    key : str
+        Key of the callable.
+
+    Examples
+    --------
+    >>> @cache_key("speed-profile-v2")
+    ... def w_M_ref(t):
+    ...     return np.interp(t, *load_profile())
+
+    """
+
+    def decorate(func: F) -> F:
+        func.__cache_key__ = key  # type: ignore
+        return func
+
+    return decorate
+
+
+def callable_token(func: Callable | str) -> str:
+    """Return the token identifying a callable in the stored entries."""
+    if isinstance(func, str):
+        return func
+    key = getattr(func, "__cache_key__", None)
+    if key is not None:
+        return str(key)
+    if isinstance(func, partial):
+        return callable_token(func.func)
+    if ismethod(func):
+        func = func.__func__
+    module = getattr(func, "__module__", None) or ""
+    name = getattr(func, "__qualname__", None) or type(func).__qualname__
+    return f"{module}.{name}"
+
+
+class _Hasher:
+    """Digest of an object graph."""
+
+    def __init__(self) -> None:
+        self._hash = hashlib.blake2b(digest_size=16)
+        self._memo: dict[int, int] = {}
+        # Keep the visited objects alive, so that their ids are not reused
+        self._keep: list[Any] = []
+        self.callables: set[str] = set()
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def _write(self, *parts: str | bytes) -> None:
+        for part in parts:
+            data = part.encode() if isinstance(part, str) else part
+            self._hash.update(len(data).to_bytes(8, "little"))
+            self._hash.update(data)
+
+    def update(self, obj: Any) -> None:
+        """Add an object to the digest."""
+        if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+            self._write(type(obj).__name__, repr(obj))
+        elif isinstance(obj, bytes):
+            self._write("bytes", obj)
+        elif isinstance(obj, os.PathLike):
+            self._write("path", os.fspath(obj))
+        elif isinstance(obj, np.generic):
+            self._write("np", obj.dtype.str, obj.tobytes())
+        elif id(obj) in self._memo:
+            # Shared and cyclic references are written by their order of visit
+            self._write("ref", str(self._memo[id(obj)]))
+        else:
+            self._memo[id(obj)] = len(self._memo)
+            self._keep.append(obj)
+            key = getattr(obj, "__cache_key__", None)
+            if isinstance(key, str):
+                self.callables.add(key)
+                self._write("key", key)
+            elif isinstance(obj, (np.ndarray, list, tuple, set, frozenset, dict)):
+                self._update_container(obj)
+            elif (
+                ismodule(obj)
+                or isclass(obj)
+                or isroutine(obj)
+                or isinstance(obj, (partial, np.ufunc))
+            ):
+                self._update_callable(obj)
+            else:
+                self._update_object(obj)
+
+    def _update_container(self, obj: Any) -> None:
+        if isinstance(obj, np.ndarray):
+            self._write("ndarray", obj.dtype.str, repr(obj.shape))
+            if obj.dtype.hasobject:
+                for item in obj.flat:
+                    self.update(item)
+            else:
+                self._write(np.ascontiguousarray(obj).tobytes())
+        elif isinstance(obj, (set, frozenset)):
+            digests = sorted(_digest(item) for item in obj)
+            self._write(type(obj).__name__, *digests)
+        elif isinstance(obj, dict):
+            self._write("dict", str(len(obj)))
+            for key, value in obj.items():
+                self.update(key)
+                self.update(value)
+        else:
+            self._write(type(obj).__name__, str(len(obj)))
+            for item in obj:
+                self.update(item)
+
+    def _update_callable(self, obj: Any) -> None:
+        if ismodule(obj):
+            self._write("module", obj.__name__)
+        elif isclass(obj):
+            self._write("class", obj.__module__, obj.__qualname__, *_class_digests(obj))
+        elif isinstance(obj, partial):
+            self._write("partial")
+            self.update(obj.func)
+            self.update(obj.args)
+            self.update(obj.keywords)
+        elif ismethod(obj):
+            self._write("method")
+            self.update(obj.__func__)
+            self.update(obj.__self__)
+        elif isinstance(obj, FunctionType):
+            self.callables.add(callable_token(obj))
+            self._write("function")
+            self._update_code(obj.__code__, obj.__globals__)
+            self.update(obj.__defaults__)
+            self.update(obj.__kwdefaults__)
+            self.update([cell.cell_contents for cell in obj.__closure__ or ()])
+        else:
+            # Compiled functions, e.g., NumPy functions, are identified by their name
+            self._write("routine", callable_token(obj))
+
+    def _update_object(self, obj: Any) -> None:
+        cls = type(obj)
+        if not hasattr(obj, "__dict__") and not hasattr(cls, "__slots__"):
+            raise TypeError(f"Cannot fingerprint {cls.__qualname__}")
+        self._write("object", cls.__module__, cls.__qualname__, *_class_digests(cls))
+        attrs = dict(vars(obj)) if hasattr(obj, "__dict__") else {}
+        for klass in cls.__mro__:
+            slots = getattr(klass, "__slots__", ())
+            for name in [slots] if isinstance(slots, str) else slots:
+                if name not in ("__dict__", "__weakref__") and hasattr(obj, name):
+                    attrs[name] = getattr(obj, name)
+        self.update(attrs)
+
+    def _update_code(self, code: CodeType, namespace: dict[str, Any]) -> None:
+        """Add the code and the global variables it refers to."""
+        self._write("code", code.co_code, repr(code.co_names))
+        for const in code.co_consts:
+            if isinstance(const, CodeType):
+                self._update_code(const, namespace)
+            else:
+                self.update(const)
+        for name in code.co_names:
+            if name in namespace:
+                self._write("global", name)
+                self.update(namespace[name])
+
+
+def _digest(obj: Any) -> str:
+    """Return the digest of a single object."""
+    hasher = _Hasher()
+    hasher.update(obj)
+    return hasher.hexdigest()
+
+
+def fingerprint(sim: "Simulation", t_stop: float) -> tuple[str, set[str]]:
+    """
+    Fingerprint the configuration of a simulation.
+
+    Parameters
+    ----------
+    sim : Simulation
+        Simulation, which has not been started.
+    t_stop : float
+        Simulation stop time.
+
+    Returns
+    -------
+    key : str
+        Hexadecimal digest of the configuration.
+    callables : set[str]
+        Tokens of the callables included in the digest, see :func:`callable_token`.
+
+    Raises
+    ------
+    TypeError
+        If the configuration contains objects, which cannot be fingerprinted.
+
+    """
+    hasher = _Hasher()
+    hasher.update(
+        {
+            "version": _VERSION,
+            "source": _package_digest(),
+            "t_stop": float(t_stop),
+            "cfg": sim.cfg,
+            "mdl": sim.mdl,
+            "ctrl": sim.ctrl,
+            "events": sim.events,
+            "stop_conditions": sim.stop_conditions,
+            "accumulators": sim.accumulators,
+        }
+    )
+    return hasher.hexdigest(), hasher.callables
+
+
+# %%
+@dataclass
+class CacheEntry:
+    """
+    Metadata of a stored result.
+
+    Attributes
+    ----------
+    key : str
+        Digest of the configuration.
+    created : float
+        Time of storing (s since the epoch).
+    used : float
+        Time of the latest use (s since the epoch).
+    size : int
+        Size of the stored results (bytes).
+    t_stop : float
+        Simulation stop time.
+    callables : list[str]
+        Tokens of the callables included in the digest.
+
+    """
+
+    key: str
+    created: float
+    used: float
+    size: int
+    t_stop: float
+    callables: list[str] = field(default_factory=list)
+
+
+class ResultCache:
+    """
+    Content-addressed local store of simulation results.
+
+    A simulation, whose configuration has already been simulated, returns the stored
+    results instead of simulating again. The cache is used only if the simulation has
+    not been started and its history is saved. On a hit, the stop reason and the
+    accumulators of the simulation object are restored, and :meth:`Simulation.
+    post_process` returns the stored results, as after a run. The model and the control
+    system are not advanced, so the simulation cannot be continued. Configurations
+    containing objects, which cannot be fingerprinted, are simulated without the cache.
+
+    Parameters
+    ----------
+    path : Path | str, optional
+        Directory of the store, defaults to "~/.cache/motulator/results".
+    max_size : float, optional
+        Maximum total size (bytes) of the stored results, defaults to `inf`. The least
+        recently used entries are evicted first.
+    max_age : float, optional
+        Maximum age (s) of the stored results, defaults to `inf`.
+
+    Notes
+    -----
+    Python functions are fingerprinted by their code and the values they refer to, but
+    not by the files or other external data they read. Such functions can be tagged
+    using :func:`cache_key`, and their results removed using :meth:`invalidate`.
+    The stored columns are read when first accessed, so results should not be evicted
+    while in use.
+
+    Examples
+    --------
+    >>> cache = ResultCache(max_size=2e9, max_age=7 * 24 * 3600)
+    >>> sim = model.Simulation(mdl, ctrl, cache=cache)
+    >>> res = sim.simulate(t_stop=2)  # Loaded from the store on subsequent runs
+
+    """
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        max_size: float = np.inf,
+        max_age: float = np.inf,
+    ) -> None:
+        if path is None:
+            path = Path.home() / ".cache" / "motulator" / "results"
+        self.path = Path(path)
+        self.max_size = max_size
+        self.max_age = max_age
+
+    def simulate(
+        self, sim: "Simulation", t_stop: float, run: Callable[[], "SimulationResults"]
+    ) -> "SimulationResults":
+        """
+        Return the stored results, or simulate and store them.
+
+        Parameters
+        ----------
+        sim : Simulation
+            Simulation, which has not been started.
+        t_stop : float
+            Simulation stop time.
+        run : Callable[[], SimulationResults]
+            Function running the simulation.
+
+        Returns
+        -------
+        SimulationResults
+            Results.
+
+        """
+        try:
+            key, callables = fingerprint(sim, t_stop)
+        except TypeError:
+            return run()
+        res = self.load(key)
+        if res is None:
+            res = run()
+            self.store(key, res, t_stop, callables, sim.accumulators)
+        else:
+            # Restore the simulation object as after a run
+            sim.stop_reason = res.stop_reason
+            self._load_accumulators(key, sim.accumulators)
+            sim._results = res
+        return res
+
+    def load(self, key: str) -> "SimulationResults | None":
+        """
+        Load the stored results.
+
+        Parameters
+        ----------
+        key : str
+            Digest of the configuration, see :func:`fingerprint`.
+
+        Returns
+        -------
+        SimulationResults | None
+            Results, or None if not stored or expired.
+
+        """
+        from motulator.common.model._simulation import (  # noqa: PLC0415
+            SimulationResults,
+        )
+
+        entry = self._read_entry(key)
+        if entry is None:
+            return None
+        if time.time() - entry.created > self.max_age:
+            self.remove(key)
+            return None
+        folder = self.path / key
+        # The latest use is the modification time of the entry file
+        os.utime(folder / "entry.json")
+        return SimulationResults.load(folder)
+
+    def store(
+        self,
+        key: str,
+        res: "SimulationResults",
+        t_stop: float,
+        callables: set[str] | None = None,
+        accumulators: "dict[str, Accumulator] | None" = None,
+    ) -> None:
+        """
+        Store the results and evict the expired and the least recently used entries.
+
+        Parameters
+        ----------
+        key : str
+            Digest of the configuration, see :func:`fingerprint`.
+        res : SimulationResults
+            Results.
+        t_stop : float
+            Simulation stop time.
+        callables : set[str], optional
+            Tokens of the callables included in the digest.
+        accumulators : dict[str, Accumulator], optional
+            Accumulators, whose final states are stored.
+
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        # The entry is written to a temporary folder and renamed when complete
+        tmp = self.path / f".{key}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        res.save(tmp)
+        if accumulators:
+            # The signal definitions are part of the key, only the states are stored
+            data = np.empty((), dtype=object)
+            data[()] = {
+                name: {k: v for k, v in vars(acc).items() if k != "signal"}
+                for name, acc in accumulators.items()
+            }
+            np.save(tmp / "accumulators.npy", data, allow_pickle=True)
+        size = sum(file.stat().st_size for file in tmp.rglob("*") if file.is_file())
+        with open(tmp / "entry.json", "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "created": time.time(),
+                    "size": size,
+                    "t_stop": t_stop,
+                    "callables": sorted(callables or ()),
+                },
+                f,
+                indent=1,
+            )
+        try:
+            tmp.rename(self.path / key)
+        except OSError:
+            # Stored concurrently by another process
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.evict(keep=key)
+
+    def entries(self) -> list[CacheEntry]:
+        """Return the stored entries, the least recently used first."""
+        if not self.path.is_dir():
+            return []
+        entries = [
+            entry
+            for folder in self.path.iterdir()
+            if not folder.name.startswith(".")
+            and (entry := self._read_entry(folder.name)) is not None
+        ]
+        return sorted(entries, key=lambda entry: entry.used)
+
+    def evict(self, keep: str | None = None) -> None:
+        """
+        Remove the expired entries and the least recently used entries over the size.
+
+        Parameters
+        ----------
+        keep : str, optional
+            Key of an entry, which is kept regardless of the size.
+
+        """
+        now = time.time()
+        entries = self.entries()
+        size = sum(entry.size for entry in entries)
+        for entry in entries:
+            expired = now - entry.created > self.max_age
+            if expired or (size > self.max_size and entry.key != keep):
+                self.remove(entry.key)
+                size -= entry.size
+
+    def invalidate(self, func: Callable | str) -> int:
+        """
+        Remove the results depending on a callable.
+
+        Parameters
+        ----------
+        func : Callable | str
+            Callable, or its key given using :func:`cache_key`.
+
+        Returns
+        -------
+        int
+            Number of removed entries.
+
+        """
+        token = callable_token(func)
+        removed = 0
+        for entry in self.entries():
+            if token in entry.callables:
+                self.remove(entry.key)
+                removed += 1
+        return removed
+
+    def remove(self, key: str) -> None:
+        """Remove a stored entry."""
+        shutil.rmtree(self.path / key, ignore_errors=True)
+
+    def clear(self) -> None:
+        """Remove all stored entries."""
+        for entry in self.entries():
+            self.remove(entry.key)
+
+    def _load_accumulators(
+        self, key: str, accumulators: "dict[str, Accumulator]"
+    ) -> None:
+        """Restore the final states of the accumulators."""
+        file = self.path / key / "accumulators.npy"
+        if not accumulators or not file.is_file():
+            return
+        states = np.load(file, allow_pickle=True)[()]
+        for name, acc in accumulators.items():
+            vars(acc).update(states.get(name, {}))
+
+    def _read_entry(self, key: str) -> CacheEntry | None:
+        file = self.path / key / "entry.json"
+        try:
+            with open(file, encoding="utf-8") as f:
+                data = json.load(f)
+            used = file.stat().st_mtime
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(
+            key, data["created"], used, data["size"], data["t_stop"], data["callables"]
+        )
@@ -7,13 +7,14 @@ vectors are used also for duty ratios and switching states, wherever applicable.
 
 """
 
+from cmath import exp
 from dataclasses import InitVar, dataclass, field
-from math import sqrt
+from math import atan2, cos, floor, pi, sqrt
 from typing import Any, Callable
 
 import numpy as np
 
-from motulator.common.model._base import Subsystem
+from motulator.common.model._base import StateEvent, Subsystem, SubsystemTimeSeries
 from motulator.common.utils._utils import abc2complex, complex2abc, empty_array
 
 
@@ -81,7 +82,9 @@ class VoltageSourceConverter(Subsystem):
 
 
 @dataclass
-class VoltageSourceConverterTimeSeries[T: VoltageSourceConverter]:
+class VoltageSourceConverterTimeSeries[T: VoltageSourceConverter](
+    SubsystemTimeSeries[T]
+):
     """Continuous time series."""
 
     t: InitVar[np.ndarray]
@@ -97,11 +100,11 @@ class VoltageSourceConverterTimeSeries[T: VoltageSourceConverter]:
 
     def compute_zoh_input_derived_signals(self, t: np.ndarray, subsystem: T) -> None:
         """Compute zero-order hold derived signals."""
-        self.u_c_ab = self.q_c_ab * self.u_dc
+        self.defer("u_c_ab", lambda: self.q_c_ab * self.u_dc)
 
     def compute_input_derived_signals(self, t: np.ndarray, subsystem: T) -> None:
         """Process input time series."""
-        self.i_dc_int = subsystem.compute_internal_dc_current(self)
+        self.defer("i_dc_int", lambda: subsystem.compute_internal_dc_current(self))
 
 
 # %%
@@ -210,6 +213,11 @@ class FrequencyConverter(VoltageSourceConverter):
     A three-phase diode bridge rectifier with a DC-bus inductor is modeled. The diode
     bridge is connected to the voltage-source inverter. The grid inductance is zero.
 
+    The DC-bus inductor is either conducting or blocking, in which case its current is
+    zero. The solver stops at the diode commutations and at the start and end of the
+    current-zero intervals, so that it does not step across the kinks of the rectified
+    voltage or across the mode changes.
+
     Parameters
     ----------
     C_dc : float
@@ -232,16 +240,23 @@ class FrequencyConverter(VoltageSourceConverter):
         self.u_g = sqrt(2 / 3) * U_g
         self.state: FrequencyConverterStates = FrequencyConverterStates(u_dc)
         self._history: FrequencyConverterStateHistory = FrequencyConverterStateHistory()
+        self.conducting = False
 
     def compute_voltages(self, state: Any) -> tuple[Any, Any]:
         """Compute grid and rectified voltages."""
         # Grid voltage
         u_g_ab = self.u_g * state.exp_j_theta_g
-        u_g_abc = complex2abc(u_g_ab)
-        # Output voltage of the diode bridge
-        u_di = np.amax(u_g_abc, axis=0) - np.amin(u_g_abc, axis=0)
+        # Output voltage of the diode bridge, i.e., the largest line-line voltage
+        theta_g = np.angle(state.exp_j_theta_g)
+        u_di = sqrt(3) * self.u_g * np.cos(np.mod(theta_g, pi / 3) - pi / 6)
         return u_g_ab, u_di
 
+    def _rectified_voltage(self, t: float) -> float:
+        """Compute the rectified voltage using scalar math."""
+        exp_j_theta_g = self.state.exp_j_theta_g
+        theta_g = atan2(exp_j_theta_g.imag, exp_j_theta_g.real)
+        return sqrt(3) * self.u_g * cos(theta_g % (pi / 3) - pi / 6)
+
     def set_outputs(self, t: float) -> None:
         """Set output variables for interconnection."""
         self.out.u_dc = self.state.u_dc.real
@@ -250,17 +265,54 @@ class FrequencyConverter(VoltageSourceConverter):
     def rhs(self, t: float) -> list[complex]:
         """Compute state derivatives."""
         # Rectified voltage and internal DC current
-        _, u_di = self.compute_voltages(self.state)
+        u_di = self._rectified_voltage(t)
         i_dc_int = self.compute_internal_dc_current(self.inp)
         # State derivatives
         d_u_dc = (self.state.i_L.real - i_dc_int) / self.C_dc
-        d_i_L = (u_di - self.state.u_dc.real) / self.L_dc
+        # Inductor current stays at zero, when the diodes are blocking
+        d_i_L = (u_di - self.state.u_dc.real) / self.L_dc if self.conducting else 0.0
         d_exp_j_theta_g = 1j * self.w_g * self.state.exp_j_theta_g
-        # Inductor current cannot be negative due to the diode bridge
-        if self.state.i_L.real < 0 and d_i_L < 0:
-            d_i_L = 0
         return [d_u_dc, d_i_L, d_exp_j_theta_g]
 
+    def get_state(self) -> dict[str, Any]:
+        """Return a copy of the states and the conduction mode."""
+        return {**super().get_state(), "conducting": self.conducting}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the states and the conduction mode returned by :meth:`get_state`."""
+        state = dict(state)
+        self.conducting = state.pop("conducting")
+        super().set_state(state)
+
+    def state_events(self, t: float) -> list[StateEvent]:
+        """Return the diode commutation and conduction events."""
+        self._update_mode(t)
+        if not self.conducting:
+            return [StateEvent(self._conduction_margin, 1, self._start_conduction)]
+        # Next commutation angle, excluding the current one
+        theta_g = atan2(self.state.exp_j_theta_g.imag, self.state.exp_j_theta_g.real)
+        exp_j_theta_c = exp(1j * (floor(3 * theta_g / pi + 1e-9) + 1) * pi / 3)
+        return [
+            StateEvent(lambda t: (self.state.exp_j_theta_g / exp_j_theta_c).imag, 1),
+            StateEvent(lambda t: self.state.i_L.real, -1, self._stop_conduction),
+        ]
+
+    def _update_mode(self, t: float) -> None:
+        """Start conducting, if the states have been changed between segments."""
+        if self.state.i_L.real > 0 or self._conduction_margin(t) > 0:
+            self.conducting = True
+
+    def _conduction_margin(self, t: float) -> float:
+        """Return the voltage forward-biasing the diodes, when blocking."""
+        return self._rectified_voltage(t) - self.state.u_dc.real
+
+    def _start_conduction(self) -> None:
+        self.conducting = True
+
+    def _stop_conduction(self) -> None:
+        self.conducting = False
+        self.state.i_L = 0j
+
     def create_time_series(
         self, t: np.ndarray
     ) -> tuple[str, "FrequencyConverterTimeSeries"]:
@@ -290,11 +342,159 @@ class FrequencyConverterTimeSeries(
         self.u_dc = np.real(np.array(subsystem._history.u_dc))
         self.i_L = np.real(np.array(subsystem._history.i_L))
         self.exp_j_theta_g = np.array(subsystem._history.exp_j_theta_g)
-        self.u_g_ab, self.u_di = subsystem.compute_voltages(self)
-        self.u_g_abc = complex2abc(self.u_g_ab)
-        # Diode bridge switching states (-1, 0, 1)
-        self.q_g_abc = (np.amax(self.u_g_abc, axis=0) == self.u_g_abc).astype(int) - (
+        self.defer(("u_g_ab", "u_di"), lambda: subsystem.compute_voltages(self))
+        self.defer("u_g_abc", lambda: complex2abc(self.u_g_ab))
+        self.defer("q_g_abc", self.compute_diode_states)
+        # Grid current space vector
+        self.defer("i_g_ab", lambda: abc2complex(self.q_g_abc) * self.i_L)
+
+    def compute_diode_states(self) -> np.ndarray:
+        """Compute the diode bridge switching states (-1, 0, 1)."""
+        return (np.amax(self.u_g_abc, axis=0) == self.u_g_abc).astype(int) - (
             np.amin(self.u_g_abc, axis=0) == self.u_g_abc
         ).astype(int)
-        # Grid current space vector
-        self.i_g_ab = abc2complex(self.q_g_abc) * self.i_L
+
+
+# %%
+@dataclass
+class AveragedFrequencyConverterStates:
+    """State variables."""
+
+    u_dc: complex  # Imaginary part is always zero
+    i_L: complex = 0j  # Imaginary part is always zero
+
+
+@dataclass
+class AveragedFrequencyConverterStateHistory:
+    """State history."""
+
+    u_dc: list[complex] = field(default_factory=list)
+    i_L: list[complex] = field(default_factory=list)
+
+
+class AveragedFrequencyConverter(FrequencyConverter):
+    """
+    Frequency converter with an averaged six-pulse diode bridge.
+
+    The diode bridge is replaced with its mean rectified voltage, so that the solver
+    step size is limited by the DC-bus dynamics instead of the diode commutations. The
+    interface is the same as in :class:`FrequencyConverter`. The grid current is
+    approximated by its fundamental component, which is in phase with the grid voltage
+    and whose magnitude follows from the power balance.
+
+    Parameters
+    ----------
+    C_dc : float
+        DC-bus capacitance (F).
+    L_dc : float
+        DC-bus inductance (H).
+    U_g : float
+        Grid voltage (V, line-line, rms).
+    f_g : float
+        Grid frequency (Hz).
+    L_g : float, optional
+        Grid inductance (H) causing the commutation overlap, defaults to 0. The overlap
+        reduces the mean rectified voltage in proportion to the DC-bus current.
+    ripple : bool, optional
+        Include the dominant sixth-harmonic ripple of the rectified voltage, defaults
+        to False. The ripple restores the DC-bus voltage ripple, but the step size is
+        then limited by the grid frequency again.
+
+    """
+
+    def __init__(
+        self,
+        C_dc: float,
+        L_dc: float,
+        U_g: float,
+        f_g: float,
+        L_g: float = 0.0,
+        ripple: bool = False,
+    ) -> None:
+        super().__init__(C_dc, L_dc, U_g, f_g)
+        self.L_g = L_g
+        self.ripple = ripple
+        self.state: AveragedFrequencyConverterStates = (  # type: ignore
+            AveragedFrequencyConverterStates(self.u_dc)
+        )
+        self._history: AveragedFrequencyConverterStateHistory = (  # type: ignore
+            AveragedFrequencyConverterStateHistory()
+        )
+
+    @property
+    def u_di0(self) -> float:
+        """No-load mean rectified voltage (V)."""
+        return 3 * sqrt(3) / pi * self.u_g
+
+    @property
+    def R_c(self) -> float:
+        """Equivalent resistance (Ohm) of the commutation overlap."""
+        return 3 * self.w_g * self.L_g / pi
+
+    def compute_voltages(self, state: Any) -> tuple[Any, Any]:
+        """Compute grid and rectified voltages."""
+        u_g_ab = self.u_g * state.exp_j_theta_g
+        u_di = self.u_di0 - self.R_c * np.real(state.i_L)
+        if self.ripple:
+            u_di = u_di - 2 / 35 * self.u_di0 * np.real(state.exp_j_theta_g**6)
+        return u_g_ab, u_di
+
+    def _rectified_voltage(self, t: float) -> float:
+        """Compute the rectified voltage using scalar math."""
+        u_di = self.u_di0 - self.R_c * self.state.i_L.real
+        if self.ripple:
+            u_di -= 2 / 35 * self.u_di0 * cos(6 * self.w_g * t)
+        return u_di
+
+    def rhs(self, t: float) -> list[complex]:
+        """Compute state derivatives."""
+        u_di = self._rectified_voltage(t)
+        i_dc_int = self.compute_internal_dc_current(self.inp)
+        d_u_dc = (self.state.i_L.real - i_dc_int) / self.C_dc
+        d_i_L = (u_di - self.state.u_dc.real) / self.L_dc if self.conducting else 0.0
+        return [d_u_dc, d_i_L]
+
+    def state_events(self, t: float) -> list[StateEvent]:
+        """Return the conduction events."""
+        self._update_mode(t)
+        if not self.conducting:
+            return [StateEvent(self._conduction_margin, 1, self._start_conduction)]
+        return [StateEvent(lambda t: self.state.i_L.real, -1, self._stop_conduction)]
+
+    def create_time_series(  # type: ignore
+        self, t: np.ndarray
+    ) -> tuple[str, "AveragedFrequencyConverterTimeSeries"]:
+        """Time series."""
+        return "converter", AveragedFrequencyConverterTimeSeries(t, self)
+
+
+@dataclass
+class AveragedFrequencyConverterTimeSeries(
+    VoltageSourceConverterTimeSeries[AveragedFrequencyConverter]
+):
+    """Continuous time series."""
+
+    subsystem: InitVar[AveragedFrequencyConverter]
+
+    # State variables
+    i_L: np.ndarray = field(default_factory=empty_array)
+    # Derived signals
+    exp_j_theta_g: np.ndarray = field(default_factory=empty_array)
+    u_g_ab: np.ndarray = field(default_factory=empty_array)
+    u_di: np.ndarray = field(default_factory=empty_array)
+    u_g_abc: np.ndarray = field(default_factory=empty_array)
+    i_g_ab: np.ndarray = field(default_factory=empty_array)
+
+    def __post_init__(
+        self, t: np.ndarray, subsystem: AveragedFrequencyConverter
+    ) -> None:
+        self.u_dc = np.real(np.array(subsystem._history.u_dc))
+        self.i_L = np.real(np.array(subsystem._history.i_L))
+        self.defer("exp_j_theta_g", lambda: np.exp(1j * subsystem.w_g * t))
+        self.defer(("u_g_ab", "u_di"), lambda: subsystem.compute_voltages(self))
+        self.defer("u_g_abc", lambda: complex2abc(self.u_g_ab))
+        # Fundamental grid current from the power balance
+        self.defer(
+            "i_g_ab",
+            lambda: self.u_di * self.i_L / (1.5 * subsystem.u_g) * self.exp_j_theta_g,
+        )
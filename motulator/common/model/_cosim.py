@@ -0,0 +1,210 @@
+"""
+Co-simulation server.
+
+The continuous-time system model is exposed over a local Unix or TCP socket, so that
+the control system can run in another process. The binary protocol is described in
+:mod:`motulator.common.model._cosim_client`.
+
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass
+from math import nan
+from typing import Any, Callable, Sequence
+
+from motulator.common.control._base import ControlSystem
+from motulator.common.model._base import Model
+from motulator.common.model._cosim_client import CLOSE, MEASURE, REPLY, REQUEST, STEP
+from motulator.common.model._simulation import Simulation, SimulationResults, SolverCfg
+
+ERROR_REPLY = REPLY.pack(nan, nan, nan, nan, nan, nan)
+
+
+# %%
+@dataclass
+class _References:
+    """Commands received from the client."""
+
+    T_s: float
+    d_abc: Sequence[float]
+
+
+class _ExternalControlSystem(ControlSystem):
+    """Control system returning the commands received from the client."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ref = _References(0.0, [0.0, 0.0, 0.0])
+
+    def get_measurement(self, mdl: Model) -> None:
+        """Measurements are sent to the client instead."""
+        return None
+
+    def get_feedback(self, meas: None) -> None:
+        """Feedback signals are computed by the client."""
+        return None
+
+    def compute_output(self, fbk: None) -> _References:
+        """Return the latest commands from the client."""
+        return self.ref
+
+    def run_control_loop(self, mdl: Model) -> tuple[float, Sequence[float]]:
+        """Save and return the latest commands from the client."""
+        ref = self.compute_output(self.get_feedback(self.get_measurement(mdl)))
+        self.save(self.t, ref=ref)
+        self.update(ref, None)
+        return self.get_duty_ratios(ref)
+
+
+def _default_sensors(mdl: Any) -> list[Callable[[], Any]]:
+    """Return the current, DC-bus voltage, and speed sensors of the model."""
+    if getattr(mdl, "lc_filter", None) is not None:
+        meas_currents = mdl.lc_filter.meas_currents
+    elif hasattr(mdl, "machine"):
+        meas_currents = mdl.machine.meas_currents
+    else:
+        meas_currents = mdl.ac_filter.meas_currents
+    sensors = [meas_currents, mdl.converter.meas_dc_voltage]
+    if hasattr(mdl, "mechanics"):
+        sensors.append(mdl.mechanics.meas_speed)
+    else:
+        sensors.append(lambda: nan)
+    return sensors
+
+
+# %%
+class CoSimulationServer:
+    """
+    Co-simulation server.
+
+    For each sampling period, the server receives the sampling period `T_s` and the
+    duty ratios `d_abc` from the client, advances the model using the same
+    computational delay, PWM, and solver as :class:`Simulation`, and replies with the
+    measured phase currents, DC-bus voltage, and rotor speed. One client is served at a
+    time, and successive sessions continue from the current model state. The model is
+    advanced in a worker thread, so that the event loop keeps accepting and closing
+    connections meanwhile.
+
+    Parameters
+    ----------
+    mdl : Model
+        Continuous-time system model, e.g., `Drive` or `GridConverterSystem`.
+    path : str, optional
+        Path of the Unix socket. If not given, a TCP socket is used.
+    host : str, optional
+        Host of the TCP socket, defaults to "127.0.0.1".
+    port : int, optional
+        Port of the TCP socket, defaults to 0 (chosen by the operating system).
+    cfg : SolverCfg, optional
+        Solver configuration parameters.
+    save_history : bool, optional
+        Save the model history for post-processing, defaults to True.
+
+    """
+
+    def __init__(
+        self,
+        mdl: Model,
+        path: str | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        cfg: SolverCfg | None = None,
+        save_history: bool = True,
+    ) -> None:
+        self.path = path
+        self.host = host
+        self.port = port
+        self.save_history = save_history
+        self._ctrl = _ExternalControlSystem()
+        self.sim = Simulation(mdl, self._ctrl, show_progress=False, cfg=cfg)
+        self._sensors = _default_sensors(mdl)
+        self._server: asyncio.Server | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def address(self) -> str | tuple[str, int]:
+        """Address to which the clients connect."""
+        if self.path is not None:
+            return self.path
+        return self.host, self.port
+
+    def measure(self) -> bytes:
+        """Pack the current measurements into a reply frame."""
+        i_abc, u_dc, w_M = (sensor() for sensor in self._sensors)
+        t = self.sim.mdl.t0
+        return REPLY.pack(t, i_abc[0], i_abc[1], i_abc[2], u_dc, w_M)
+
+    def step(self, T_s: float, d_abc: Sequence[float]) -> bytes:
+        """Advance the model over one sampling period and return the measurements."""
+        self._ctrl.ref = _References(T_s, d_abc)
+        self.sim.step(1, self.save_history)
+        return self.measure()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client session."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            self.sim._start()
+            try:
+                while True:
+                    cmd, T_s, d_a, d_b, d_c = REQUEST.unpack(
+                        await reader.readexactly(REQUEST.size)
+                    )
+                    reply: bytes | None = None
+                    if cmd == STEP:
+                        try:
+                            reply = await loop.run_in_executor(
+                                None, self.step, T_s, (d_a, d_b, d_c)
+                            )
+                        except Exception:
+                            pass  # E.g., the solver failed with the given commands
+                    elif cmd == MEASURE:
+                        reply = self.measure()
+                    elif cmd == CLOSE:
+                        break
+                    if reply is None:
+                        # Error reply, after which the session is closed
+                        writer.write(ERROR_REPLY)
+                        await writer.drain()
+                        break
+                    writer.write(reply)
+                    await writer.drain()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass  # Client disconnected
+            finally:
+                writer.close()
+
+    async def start(self) -> None:
+        """Start listening for clients."""
+        if self.path is not None:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self._server = await asyncio.start_unix_server(self._handle, self.path)
+        else:
+            self._server = await asyncio.start_server(
+                self._handle, self.host, self.port
+            )
+            sock = self._server.sockets[0]
+            self.port = sock.getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Start the server, if not started yet, and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    def run(self) -> None:
+        """Run the server in a new event loop until interrupted."""
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            pass
+
+    def post_process(self) -> SimulationResults:
+        """Post-process the model history and the received commands."""
+        return self.sim.post_process()
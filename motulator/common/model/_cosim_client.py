@@ -0,0 +1,117 @@
+"""
+Reference client for the co-simulation protocol.
+
+This module depends only on the Python standard library, so that it can be copied as
+such to the process running the controller under test. The protocol consists of
+fixed-size little-endian frames:
+
+- Request (33 bytes): command (uint8), sampling period `T_s` (float64), and duty ratios
+  `d_a`, `d_b`, `d_c` (float64).
+- Reply (48 bytes): model time `t`, phase currents `i_a`, `i_b`, `i_c`, DC-bus voltage
+  `u_dc`, and rotor speed `w_M` (float64). Unavailable signals are NaN.
+
+The command `STEP` advances the plant over one sampling period and replies with the
+measurements at the end of the period. The command `MEASURE` replies with the current
+measurements without advancing. The command `CLOSE` ends the session without a reply.
+An unknown command or a failed step, e.g., due to a solver error, is answered with an
+error reply, whose model time `t` is NaN, after which the server closes the session.
+
+"""
+
+import math
+import socket
+import struct
+from typing import NamedTuple, Sequence
+
+# %%
+CLOSE = 0
+STEP = 1
+MEASURE = 2
+
+REQUEST = struct.Struct("<B4d")
+REPLY = struct.Struct("<6d")
+
+
+class Measurements(NamedTuple):
+    """Measured signals."""
+
+    t: float
+    i_a: float
+    i_b: float
+    i_c: float
+    u_dc: float
+    w_M: float
+
+
+# %%
+class CoSimulationClient:
+    """
+    Blocking co-simulation client.
+
+    Parameters
+    ----------
+    address : str | tuple[str, int]
+        Path of the Unix socket or (host, port) of the TCP socket.
+
+    Examples
+    --------
+    >>> client = CoSimulationClient(("127.0.0.1", 5555))  # doctest: +SKIP
+    >>> meas = client.measure()  # doctest: +SKIP
+    >>> meas = client.step(125e-6, [0.5, 0.5, 0.5])  # doctest: +SKIP
+    >>> client.close()  # doctest: +SKIP
+
+    """
+
+    def __init__(self, address: str | tuple[str, int]) -> None:
+        if isinstance(address, str):
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock.connect(address)
+        self._buffer = bytearray(REPLY.size)
+
+    def _request(self, cmd: int, T_s: float, d_abc: Sequence[float]) -> Measurements:
+        """Send a request and wait for the reply."""
+        self._sock.sendall(REQUEST.pack(cmd, T_s, d_abc[0], d_abc[1], d_abc[2]))
+        view = memoryview(self._buffer)
+        n = 0
+        while n < REPLY.size:
+            k = self._sock.recv_into(view[n:])
+            if k == 0:
+                raise ConnectionError("Server closed the connection")
+            n += k
+        meas = Measurements(*REPLY.unpack(self._buffer))
+        if math.isnan(meas.t):
+            raise ValueError(f"Server rejected the command: {cmd}")
+        return meas
+
+    def measure(self) -> Measurements:
+        """Get the measurements without advancing the plant."""
+        return self._request(MEASURE, 0.0, (0.0, 0.0, 0.0))
+
+    def step(self, T_s: float, d_abc: Sequence[float]) -> Measurements:
+        """
+        Advance the plant over one sampling period.
+
+        Parameters
+        ----------
+        T_s : float
+            Sampling period (s).
+        d_abc : Sequence[float]
+            Duty ratios in the range [0, 1].
+
+        Returns
+        -------
+        Measurements
+            Measurements at the end of the sampling period.
+
+        """
+        return self._request(STEP, T_s, d_abc)
+
+    def close(self) -> None:
+        """End the session and close the socket."""
+        try:
+            self._sock.sendall(REQUEST.pack(CLOSE, 0.0, 0.0, 0.0, 0.0))
+        finally:
+            self._sock.close()
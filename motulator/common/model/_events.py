@@ -0,0 +1,115 @@
+"""
+Scheduled events for simulations.
+
+An event changes parameters or inputs of the model at a given time instant, e.g., a
+load torque step or a grid voltage dip. The simulation splits the solver segments at
+the event times, so that the solver never integrates across the resulting
+discontinuities. Events at sampling instants are applied before the control system is
+executed.
+
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable
+
+from motulator.common.utils._signals import Switch, as_time_signal
+
+if TYPE_CHECKING:
+    from motulator.common.model._simulation import Simulation
+
+
+# %%
+@dataclass(order=True)
+class Event:
+    """
+    Scheduled event.
+
+    Parameters
+    ----------
+    t : float
+        Time (s) of the event.
+    action : Callable[[Simulation], None]
+        Function applying the change, e.g., :class:`SetAttribute`.
+    name : str, optional
+        Name of the event, defaults to "".
+
+    """
+
+    t: float
+    action: Callable[["Simulation"], None] = field(compare=False)
+    name: str = field(default="", compare=False)
+
+
+class SetAttribute:
+    """
+    Event action setting an attribute.
+
+    The time series derived in post-processing, e.g., the PCC voltage depending on the
+    grid inductance, are computed using the latest values of the attributes. For the
+    attributes, which are functions of time, use :class:`SetSignal` instead.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to be modified, e.g., a subsystem or its inputs.
+    name : str
+        Name of the attribute, e.g., "e_g" of a three-phase source.
+    value : Any
+        New value.
+
+    Examples
+    --------
+    >>> from motulator.common.model import Event, SetAttribute
+    >>> dip = Event(0.2, SetAttribute(mdl.ac_source, "e_g", 160.0))  # doctest: +SKIP
+
+    """
+
+    def __init__(self, obj: Any, name: str, value: Any) -> None:
+        if not hasattr(obj, name):
+            raise AttributeError(f"'{type(obj).__name__}' has no attribute '{name}'")
+        self.obj = obj
+        self.name = name
+        self.value = value
+
+    def __call__(self, sim: "Simulation") -> None:
+        """Set the attribute."""
+        setattr(self.obj, self.name, self.value)
+
+
+class SetSignal:
+    """
+    Event action switching an attribute, which is a function of time, to a new value.
+
+    The attribute is replaced with a signal, which equals the previous value before the
+    event and the new value after it. Hence, the time series computed in
+    post-processing remain correct. Suitable attributes are, e.g., `e_g`, `phi`, and
+    `w_g` of a three-phase source or `tau_L` of the mechanics inputs.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to be modified, e.g., a subsystem or its inputs.
+    name : str
+        Name of the attribute.
+    value : Any
+        New value, either a constant or a function of time.
+
+    Examples
+    --------
+    >>> from motulator.common.model import Event, SetSignal
+    >>> dip = Event(0.2, SetSignal(mdl.ac_source, "e_g", 160.0))  # doctest: +SKIP
+
+    """
+
+    def __init__(self, obj: Any, name: str, value: Any) -> None:
+        if not hasattr(obj, name):
+            raise AttributeError(f"'{type(obj).__name__}' has no attribute '{name}'")
+        self.obj = obj
+        self.name = name
+        self.value = value
+
+    def __call__(self, sim: "Simulation") -> None:
+        """Switch the attribute at the current simulation time."""
+        before = as_time_signal(getattr(self.obj, self.name))
+        after = as_time_signal(self.value)
+        setattr(self.obj, self.name, Switch(sim.mdl.t0, before, after))
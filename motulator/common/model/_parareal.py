@@ -0,0 +1,439 @@
+"""
+Parallel-in-time simulation using the Parareal algorithm.
+
+The simulation interval is divided into time slices. A coarse propagator `G`, e.g., the
+quasi-steady-state drive model with a long sampling period, predicts the states at the
+slice boundaries serially. Fine propagators `F`, i.e., the full simulation, refine all
+slices in parallel in a process pool. The states of both propagators, e.g., the rotor
+speed and the speed-controller integrator, are then corrected as::
+
+    U[n + 1] = G(U[n]) + F(U_old[n]) - G(U_old[n])
+
+The other states, e.g., the flux linkages and the current-controller integrators, are
+taken from the fine solution. The states are exchanged using the `get_state` and
+`set_state` methods of the models and the control systems.
+
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+import numpy as np
+
+from motulator.common.model._base import ZOHInputHistory
+from motulator.common.model._simulation import Simulation, SimulationResults
+
+type State = dict[str, Any]
+type KeyPath = tuple[str, ...]
+
+# Times of the model and the control system, which are not corrected
+_TIMES: tuple[KeyPath, ...] = (("mdl", "t0"), ("ctrl", "t"))
+
+
+# %%
+def get_state(sim: Simulation) -> State:
+    """Return the states of the model and the control system."""
+    return {"mdl": sim.mdl.get_state(), "ctrl": sim.ctrl.get_state()}
+
+
+def set_state(sim: Simulation, state: State) -> None:
+    """Set the states of the model and the control system."""
+    sim.mdl.set_state(state["mdl"])
+    sim.ctrl.set_state(state["ctrl"])
+
+
+def _leaves(state: dict, path: KeyPath = ()) -> Iterator[tuple[KeyPath, Any]]:
+    """Iterate over the values of the nested state with their key paths."""
+    for key, value in state.items():
+        if isinstance(value, dict):
+            yield from _leaves(value, (*path, key))
+        else:
+            yield (*path, key), value
+
+
+def _get(state: State, path: KeyPath) -> Any:
+    """Return the value at the key path."""
+    for key in path:
+        state = state[key]
+    return state
+
+
+def _set(state: State, path: KeyPath, value: Any) -> None:
+    """Set the value at the key path."""
+    for key in path[:-1]:
+        state = state[key]
+    state[path[-1]] = value
+
+
+def shared_states(fine: State, coarse: State) -> list[KeyPath]:
+    """
+    Return the key paths of the states corrected by the Parareal iteration.
+
+    These are the real and complex values at the same key paths in both states, e.g.,
+    ("mdl", "subsystems", "mechanics", "w_M"). The times and the unit phasors of the
+    angles, whose names start with "exp_j", are excluded. The angles are taken from
+    the fine solution, so that the angles of the different subsystems stay consistent.
+
+    """
+    inexact = (float, complex)
+    coarse_values = dict(_leaves(coarse))
+    return [
+        path
+        for path, value in _leaves(fine)
+        if path not in _TIMES
+        and not path[-1].startswith("exp_j")
+        and isinstance(value, inexact)
+        and isinstance(coarse_values.get(path), inexact)
+    ]
+
+
+def transfer(source: State, target: State, paths: list[KeyPath]) -> State:
+    """Return a copy of `target`, with the values at `paths` taken from `source`."""
+    state = deepcopy(target)
+    for path in (*_TIMES, *paths):
+        _set(state, path, _get(source, path))
+    return state
+
+
+def correct(f_old: State, g_new: State, g_old: State, paths: list[KeyPath]) -> State:
+    """Parareal correction of the fine state at the key paths."""
+    state = deepcopy(f_old)
+    for path in paths:
+        f = _get(f_old, path)
+        _set(state, path, type(f)(f + _get(g_new, path) - _get(g_old, path)))
+    return state
+
+
+def state_error(
+    new: State, old: State, paths: list[KeyPath], rtol: float, atol: float
+) -> float:
+    """Return the maximum change of the states at `paths`, relative to tolerance."""
+    err = 0.0
+    for path in paths:
+        x, y = _get(new, path), _get(old, path)
+        err = max(err, abs(x - y) / (atol + rtol * abs(x)))
+    return err
+
+
+# %%
+def _apply_past_events(sim: Simulation, t: float) -> None:
+    """Apply the scheduled events before `t` at their own times."""
+    t0 = sim.mdl.t0
+    while sim._next_event_time() < t:
+        sim.mdl.t0 = sim._next_event_time()
+        sim.events[sim._next_event].action(sim)
+        sim._next_event += 1
+    sim.mdl.t0 = t0
+
+
+def _get_history(sim: Simulation) -> tuple:
+    """Return the history buffers of the model and the control system."""
+    mdl, ctrl = sim.mdl, sim.ctrl
+    blocks = {
+        name: (block._t, block._history)
+        for name, block in getattr(ctrl, "_blocks", {}).items()
+    }
+    subsystem_histories = [subsystem._history for subsystem in mdl.subsystems]
+    return mdl._history, subsystem_histories, ctrl._t, ctrl._history, blocks
+
+
+def _merge_history(sim: Simulation, history: tuple) -> None:
+    """Append the history buffers of a time slice to `sim`."""
+    mdl_history, subsystem_histories, ctrl_t, ctrl_history, blocks = history
+    mdl, ctrl = sim.mdl, sim.ctrl
+    offset = len(mdl._history.t)
+    mdl._history.t.extend(mdl_history.t)
+    for name, runs in mdl_history.zoh.items():
+        target = mdl._history.zoh.setdefault(name, ZOHInputHistory())
+        for start, value in zip(runs.start, runs.value, strict=True):
+            target.append(offset + start, value)
+    for subsystem, subsystem_history in zip(
+        mdl.subsystems, subsystem_histories, strict=True
+    ):
+        if subsystem_history is None:
+            continue
+        for attr, values in vars(subsystem_history).items():
+            target = getattr(subsystem._history, attr)
+            if isinstance(target, list):
+                target.extend(values)
+            else:
+                setattr(subsystem._history, attr, list(values))
+    ctrl._t.extend(ctrl_t)
+    for group, signals in ctrl_history.items():
+        target = ctrl._history.setdefault(group, {})
+        for key, values in signals.items():
+            target.setdefault(key, []).extend(values)
+    for name, (block_t, block_history) in blocks.items():
+        block = ctrl._blocks[name]
+        block._t.extend(block_t)
+        for key, values in block_history.items():
+            block._history[key].extend(values)
+
+
+def propagate(
+    factory: Callable[[], Simulation],
+    t_end: float,
+    state: State | None,
+    paths: list[KeyPath] | None = None,
+    save_history: bool = False,
+) -> tuple[State, tuple | None, float]:
+    """
+    Propagate a time slice.
+
+    Parameters
+    ----------
+    factory : Callable[[], Simulation]
+        Function creating the simulation.
+    t_end : float
+        End time (s) of the slice. The slice ends at the sampling instant closest to
+        `t_end`.
+    state : State | None
+        State at the start of the slice. If None, the slice starts from the initial
+        state given by `factory`.
+    paths : list[KeyPath], optional
+        Key paths of the states taken from `state`, see :func:`shared_states`. If
+        None (default), `state` is the complete state of the simulation.
+    save_history : bool, optional
+        Return the history buffers, defaults to False.
+
+    Returns
+    -------
+    state : State
+        State at the end of the slice.
+    history : tuple | None
+        History buffers, if `save_history` is True.
+    elapsed : float
+        Wall-clock time (s).
+
+    """
+    t_start = time.perf_counter()
+    sim = factory()
+    sim._start()
+    if state is not None:
+        _apply_past_events(sim, state["mdl"]["t0"])
+        if paths is not None:
+            state = transfer(state, get_state(sim), paths)
+        set_state(sim, state)
+    # The sampling period is known after the first step
+    while sim.mdl.t0 < t_end - 0.5 * sim._T_s:
+        sim.step(1, save_history)
+    history = _get_history(sim) if save_history else None
+    return get_state(sim), history, time.perf_counter() - t_start
+
+
+# Worker processes create the fine simulations using this factory
+_factory: Callable[[], Simulation] | None = None
+
+
+def _init_worker(factory: Callable[[], Simulation]) -> None:
+    global _factory  # noqa: PLW0603
+    _factory = factory
+
+
+def _propagate_fine(task: tuple[float, State | None]) -> tuple[State, Any, float]:
+    assert _factory is not None
+    return propagate(_factory, *task, save_history=True)
+
+
+# %%
+@dataclass
+class PararealStats:
+    """
+    Parareal statistics.
+
+    Attributes
+    ----------
+    iterations : int
+        Number of Parareal iterations.
+    errors : list[float]
+        Maximum change of the slice-boundary states in each iteration, relative to the
+        tolerances.
+    coarse_time : float
+        Wall-clock time (s) of the serial coarse propagation.
+    fine_times : list[list[float]]
+        Wall-clock times (s) of the fine propagation of each slice in each iteration.
+    wall_time : float
+        Total wall-clock time (s).
+
+    """
+
+    iterations: int = 0
+    errors: list[float] = field(default_factory=list)
+    coarse_time: float = 0.0
+    fine_times: list[list[float]] = field(default_factory=list)
+    wall_time: float = 0.0
+
+    @property
+    def parallel_time(self) -> float:
+        """Projected wall-clock time (s) with one process per time slice."""
+        return self.coarse_time + sum(max(times) for times in self.fine_times)
+
+
+class Parareal:
+    """
+    Parareal driver for long simulations.
+
+    Parameters
+    ----------
+    fine : Callable[[], Simulation]
+        Function creating the fine simulation, e.g., the drive model with the carrier
+        comparison.
+    coarse : Callable[[], Simulation]
+        Function creating the coarse simulation, e.g., the quasi-steady-state drive
+        model with a long sampling period. The states at the same key paths in the
+        states of both simulations are corrected, see :func:`shared_states`.
+    n_slices : int, optional
+        Number of time slices, defaults to the number of processes, but at least 2.
+    max_iter : int, optional
+        Maximum number of iterations, defaults to 5.
+    rtol : float, optional
+        Relative tolerance of the corrected slice-boundary states, defaults to 1e-3.
+    atol : float, optional
+        Absolute tolerance of the corrected slice-boundary states, defaults to 1e-2.
+    processes : int, optional
+        Number of worker processes, defaults to the number of processors. If 1, the
+        fine propagation runs in the calling process.
+
+    Notes
+    -----
+    The models and the control systems of both simulations should implement
+    `get_state` and `set_state`, e.g., the drive models and the current-vector control
+    of synchronous machines. The initial prediction of the fine states, which the
+    coarse simulation does not have, e.g., the flux linkages, is the initial state of
+    the fine simulation.
+
+    The factories are not pickled if the "fork" start method is available, e.g., on
+    Linux. Otherwise, they should be module-level functions. Accumulators and stop
+    conditions are not supported.
+
+    Examples
+    --------
+    >>> def fine():
+    ...     return model.Simulation(create_model(pwm=True), create_ctrl())
+    >>> def coarse():
+    ...     mdl = model.QuasiSteadyStateDrive(machine, mechanics, converter)
+    ...     ctrl = control.QuasiSteadyStateControlSystem(create_ctrl(), T_s=2e-3)
+    ...     return model.Simulation(mdl, ctrl)
+    >>> res = Parareal(fine, coarse).simulate(t_stop=30)  # doctest: +SKIP
+
+    """
+
+    def __init__(
+        self,
+        fine: Callable[[], Simulation],
+        coarse: Callable[[], Simulation],
+        n_slices: int | None = None,
+        max_iter: int = 5,
+        rtol: float = 1e-3,
+        atol: float = 1e-2,
+        processes: int | None = None,
+    ) -> None:
+        self.fine = fine
+        self.coarse = coarse
+        self.processes = processes if processes is not None else os.cpu_count() or 1
+        self.n_slices = n_slices if n_slices is not None else max(2, self.processes)
+        self.max_iter = max_iter
+        self.rtol = rtol
+        self.atol = atol
+        self.stats = PararealStats()
+
+    def simulate(self, t_stop: float = 1.0) -> SimulationResults:
+        """
+        Simulate using the Parareal algorithm.
+
+        Parameters
+        ----------
+        t_stop : float, optional
+            Simulation stop time, defaults to 1.
+
+        Returns
+        -------
+        SimulationResults
+            Results, combined from the fine solutions of the time slices.
+
+        """
+        t_start = time.perf_counter()
+        self.stats = stats = PararealStats()
+        n_slices = self.n_slices
+        t = np.linspace(0, t_stop, n_slices + 1)
+        fine0, _, _ = propagate(self.fine, 0, None)
+        coarse0, _, _ = propagate(self.coarse, 0, None)
+        paths = shared_states(fine0, coarse0)
+
+        # Initial prediction using the coarse propagator
+        u: list[State | None] = [None] * (n_slices + 1)
+        g: list[State | None] = [None] * (n_slices + 1)
+        for n in range(n_slices):
+            g[n + 1], _, elapsed = propagate(self.coarse, t[n + 1], u[n], paths)
+            u[n + 1] = transfer(g[n + 1], fine0, paths)  # type: ignore
+            stats.coarse_time += elapsed
+
+        histories: list[Any] = [None] * n_slices
+        with self._executor() as pool:
+            for k in range(min(self.max_iter, n_slices)):
+                # Fine propagation of the remaining slices in parallel, the slices
+                # before k are already exact
+                tasks = [(t[n + 1], u[n]) for n in range(k, n_slices)]
+                if pool is None:
+                    results = [
+                        propagate(self.fine, *task, save_history=True) for task in tasks
+                    ]
+                else:
+                    results = list(pool.map(_propagate_fine, tasks))
+                f: dict[int, State] = {}
+                for n, (state, history, _) in enumerate(results, start=k):
+                    f[n], histories[n] = state, history
+                stats.fine_times.append([elapsed for *_, elapsed in results])
+
+                # Serial correction, the slice after k is now exact, but its fine
+                # solution started from the old state, so it is also checked
+                u_new = list(u)
+                u_new[k + 1] = f[k]
+                for n in range(k + 1, n_slices):
+                    g_new, _, elapsed = propagate(
+                        self.coarse, t[n + 1], u_new[n], paths
+                    )
+                    stats.coarse_time += elapsed
+                    u_new[n + 1] = correct(f[n], g_new, g[n + 1], paths)  # type: ignore
+                    g[n + 1] = g_new
+                err = max(
+                    (
+                        state_error(u_new[n], u[n], paths, self.rtol, self.atol)  # type: ignore
+                        for n in range(k + 1, n_slices + 1)
+                    ),
+                    default=0.0,
+                )
+                stats.errors.append(err)
+                stats.iterations = k + 1
+                u = u_new
+                if err <= 1:
+                    break
+
+        # Combine the fine solutions
+        sim = self.fine()
+        for history in histories:
+            _merge_history(sim, history)
+        # Post-processing uses the parameters after the events
+        _apply_past_events(sim, np.inf)
+        res = sim.post_process()
+        stats.wall_time = time.perf_counter() - t_start
+        return res
+
+    def _executor(self) -> Any:
+        """Return the process pool, or a null context if a single process is used."""
+        if self.processes <= 1:
+            return nullcontext(None)
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        return ProcessPoolExecutor(
+            self.processes,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.fine,),
+        )
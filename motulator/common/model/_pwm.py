@@ -1,6 +1,6 @@
 """Pulse-width modulation (PWM) implementations."""
 
-from typing import Protocol, Sequence
+from typing import Any, Protocol, Sequence
 
 import numpy as np
 
@@ -39,6 +39,13 @@ class PWM(Protocol):
         """
         ...
 
+    def get_state(self) -> dict[str, Any]:
+        """Return the internal state, e.g., the carrier direction."""
+        return {}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the internal state returned by :meth:`get_state`."""
+
 
 # %%
 class ZOH(PWM):
@@ -113,6 +120,14 @@ class CarrierComparison(PWM):
         self.return_complex = return_complex
         self._rising_edge = True  # Stores the carrier direction
 
+    def get_state(self) -> dict[str, Any]:
+        """Return the carrier direction."""
+        return {"rising_edge": self._rising_edge}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the carrier direction."""
+        self._rising_edge = state["rising_edge"]
+
     def __call__(
         self, T_s: float, d_abc: Sequence[float]
     ) -> tuple[SwitchingTimes, SwitchingStates]:
@@ -1,15 +1,23 @@
 """Simulation environment."""
 
 import os
-from dataclasses import dataclass
-from typing import Any, Callable
+from bisect import insort
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Sequence
 
 import numpy as np
-from scipy.integrate import solve_ivp
-from tqdm import tqdm
 
 from motulator.common.control._base import ControlSystem
-from motulator.common.model._base import Model, ModelTimeSeries
+from motulator.common.model._accumulators import Accumulator, SegmentSignals
+from motulator.common.model._base import Model, ModelStateHistory, ModelTimeSeries
+from motulator.common.model._events import Event
+from motulator.common.model._stop import StopCondition
+from motulator.common.model._store import load_results, save_results
+from motulator.common.utils._utils import BaseValues
+
+if TYPE_CHECKING:
+    from motulator.common.model._cache import ResultCache
 
 
 # %%
@@ -26,15 +34,27 @@ class SolverCfg:
         Integration method, defaults to "RK45".
     rtol : float, optional
         Relative tolerance, defaults to 1e-3.
-    atol : float, optional
-        Absolute tolerance, defaults to 1e-6.
+    atol : float | Sequence[float], optional
+        Absolute tolerance, defaults to 1e-6. A sequence gives the tolerance of each
+        state, in the order of the state list.
+    base : BaseValues, optional
+        Base values. If given, `atol` is in per-unit values, and the absolute
+        tolerance of each state is `atol` times its typical magnitude, see
+        :meth:`Subsystem.state_scales`. This balances the resolution of the states,
+        whose magnitudes span several orders, e.g., flux linkages and DC-bus voltages.
+    real_angles : bool, optional
+        Integrate the rotor and grid angles as real states instead of unit phasors,
+        defaults to False. At high speeds, this relaxes the step-size limits. The
+        state history and the time series are the same in both cases.
 
     """
 
     max_step: float = np.inf
     method: str = "RK45"
     rtol: float = 1e-3
-    atol: float = 1e-6
+    atol: float | Sequence[float] = 1e-6
+    base: BaseValues | None = None
+    real_angles: bool = False
 
     @property
     def solver(self) -> dict[str, Any]:
@@ -46,6 +66,14 @@ class SolverCfg:
             "atol": self.atol,
         }
 
+    def get_options(self, mdl: Model) -> dict[str, Any]:
+        """Return the solver options with the per-state tolerances of the model."""
+        options = self.solver
+        if self.base is not None:
+            scales = np.array(mdl.get_state_scales(self.base))
+            options["atol"] = np.asarray(self.atol) * scales
+        return options
+
 
 # %%
 @dataclass
@@ -59,11 +87,92 @@ class SimulationResults:
         Results from the continuous-time model.
     ctrl : Any
         Results from the digital control system.
+    metrics : dict[str, Any]
+        Results from the streaming accumulators.
+    stop_reason : str
+        Reason for stopping the simulation, "t_stop" if the stop time was reached.
 
     """
 
     mdl: ModelTimeSeries
     ctrl: Any
+    metrics: dict[str, Any] = field(default_factory=dict)
+    stop_reason: str = "t_stop"
+
+    def save(
+        self, path: Path | str, single: bool = False, compress: bool = False
+    ) -> None:
+        """
+        Save the results to a directory of per-signal columns.
+
+        The metrics and the stop reason are saved as well.
+
+        Parameters
+        ----------
+        path : Path | str
+            Directory, created if needed.
+        single : bool, optional
+            Down-cast float64 and complex128 signals to float32 and complex64, except
+            the time vectors, defaults to False.
+        compress : bool, optional
+            Compress each column, defaults to False. Compressed columns cannot be
+            memory-mapped.
+
+        """
+        save_results(
+            self.mdl,
+            self.ctrl,
+            path,
+            single,
+            compress,
+            metrics=self.metrics,
+            stop_reason=self.stop_reason,
+        )
+
+    @classmethod
+    def load(cls, path: Path | str, mmap: bool = True) -> "SimulationResults":
+        """
+        Load results saved by :meth:`save`.
+
+        Parameters
+        ----------
+        path : Path | str
+            Directory containing the results.
+        mmap : bool, optional
+            Memory-map the uncompressed columns, defaults to True. The arrays are
+            copy-on-write, so modifying them does not change the stored results.
+
+        Returns
+        -------
+        SimulationResults
+            Results, whose columns are read when first accessed.
+
+        """
+        return cls(*load_results(path, mmap))
+
+
+@dataclass
+class SimulationSnapshot:
+    """
+    Lightweight snapshot of the simulation state.
+
+    Attributes
+    ----------
+    t : float
+        Model time (s).
+    state : list[complex]
+        State vector of the continuous-time model, in the order of the subsystems.
+    T_s : float
+        Latest sampling period (s).
+    d_abc : Sequence[float]
+        Latest duty ratios from the control system.
+
+    """
+
+    t: float
+    state: list[complex]
+    T_s: float
+    d_abc: Sequence[float]
 
 
 class Simulation:
@@ -80,6 +189,20 @@ class Simulation:
         Show progress during simulation, defaults to True.
     cfg : SolverCfg, optional
         Solver configuration parameters.
+    accumulators : dict[str, Accumulator], optional
+        Streaming accumulators, which are updated from each solver segment. Their
+        results are available in `SimulationResults.metrics` under the same names.
+    stop_conditions : Sequence[StopCondition], optional
+        Conditions evaluated after each control step. The simulation stops before
+        `t_stop` when any of them is met, and its reason is recorded in
+        `SimulationResults.stop_reason`.
+    events : Sequence[Event], optional
+        Scheduled events changing the parameters or inputs of the model. The solver
+        segments are split at the event times, so that the solver does not integrate
+        across the changes. See also :meth:`schedule`.
+    cache : ResultCache, optional
+        Cache of simulation results. If given, :meth:`simulate` returns the stored
+        results of an identical configuration instead of simulating again.
 
     """
 
@@ -89,6 +212,10 @@ class Simulation:
         ctrl: ControlSystem,
         show_progress: bool = True,
         cfg: SolverCfg | None = None,
+        accumulators: dict[str, Accumulator] | None = None,
+        stop_conditions: Sequence[StopCondition] | None = None,
+        events: Sequence[Event] | None = None,
+        cache: "ResultCache | None" = None,
     ) -> None:
         if os.environ.get("BUILDING_DOCS") == "1":
             show_progress = False
@@ -96,8 +223,49 @@ class Simulation:
         self.cfg = cfg if cfg is not None else SolverCfg()
         self.mdl = mdl
         self.ctrl = ctrl
+        self.accumulators = accumulators if accumulators is not None else {}
+        self.stop_conditions = list(stop_conditions or [])
+        self.stop_reason = "t_stop"
+        self.events = sorted(events or [])
+        self.cache = cache
+        self._next_event = 0
+        self._started = False
+        self._segment: SegmentSignals | None = None
+        self._results: SimulationResults | None = None  # Loaded from the cache
+        self._solver_options: dict[str, Any] = {}
+        self._T_s: float = 0.0
+        self._d_abc: Sequence[float] = []
+
+    def schedule(
+        self, t: float, action: Callable[["Simulation"], None], name: str = ""
+    ) -> Event:
+        """
+        Schedule an event.
 
-    def simulate(self, t_stop: float = 1.0) -> SimulationResults:
+        Parameters
+        ----------
+        t : float
+            Time (s) of the event. Events before the current simulation time are
+            applied at the beginning of the next sampling period.
+        action : Callable[[Simulation], None]
+            Function applying the change, e.g., :class:`SetAttribute`.
+        name : str, optional
+            Name of the event, defaults to "".
+
+        Returns
+        -------
+        Event
+            Scheduled event.
+
+        """
+        event = Event(t, action, name)
+        # The pending events are kept sorted, the applied ones stay before them
+        insort(self.events, event, lo=self._next_event)
+        return event
+
+    def simulate(
+        self, t_stop: float = 1.0, save_history: bool = True
+    ) -> SimulationResults:
         """
         Solve continuous-time system model and call control system.
 
@@ -105,15 +273,28 @@ class Simulation:
         ----------
         t_stop : float, optional
             Simulation stop time, defaults to 1.
+        save_history : bool, optional
+            Save the model and controller histories, defaults to True. If False, only
+            the accumulated metrics are available and the memory footprint stays
+            constant.
 
         """
+        if self.cache is not None and save_history and not self._started:
+            return self.cache.simulate(self, t_stop, lambda: self._simulate(t_stop))
+        return self._simulate(t_stop, save_history)
+
+    def _simulate(self, t_stop: float, save_history: bool = True) -> SimulationResults:
+        """Run the simulation."""
+        self.stop_reason = "t_stop"
         try:
             # Initialize outputs based on initial states
-            self.mdl.set_outputs(0.0)
+            self._start()
 
             # Main simulation loop
             progress_bar = None
             if self.show_progress:
+                from tqdm import tqdm  # noqa: PLC0415
+
                 progress_bar = tqdm(
                     total=t_stop,
                     desc="Simulation",
@@ -126,7 +307,7 @@ class Simulation:
                     progress_bar.n = min(self.mdl.t0, t_stop)
                     progress_bar.refresh()
 
-            self._run_simulation_loop(t_stop, update_progress)
+            self._run_simulation_loop(t_stop, update_progress, save_history)
 
             if progress_bar is not None:
                 progress_bar.n = t_stop
@@ -135,8 +316,92 @@ class Simulation:
 
         except FloatingPointError:
             print(f"Invalid value encountered at {self.mdl.t0:.2f} s.")
+            self.stop_reason = "invalid value"
+
+        return self.post_process()
+
+    def step(self, n: int = 1, save_history: bool = True) -> SimulationSnapshot:
+        """
+        Advance the simulation manually.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of sampling periods to advance, defaults to 1.
+        save_history : bool, optional
+            Save the model and controller histories, defaults to True.
 
-        # Post-process the solution data
+        Returns
+        -------
+        SimulationSnapshot
+            Snapshot after the last sampling period.
+
+        """
+        self._start()
+        with np.errstate(invalid="raise"):
+            for _ in range(n):
+                self._step(save_history)
+        return self.snapshot()
+
+    def iter_steps(
+        self, t_stop: float, every: int = 1, save_history: bool = True
+    ) -> Iterator[SimulationSnapshot]:
+        """
+        Advance the simulation stepwise and yield snapshots.
+
+        The generator can be stopped at any time, e.g. by breaking out of the loop,
+        after which the collected results are available via :meth:`post_process`.
+        The generator also stops if any of the stop conditions is met. Invalid values
+        raise `FloatingPointError`.
+
+        Parameters
+        ----------
+        t_stop : float
+            Simulation stop time (s).
+        every : int, optional
+            Yield a snapshot after every `every` sampling periods, defaults to 1. The
+            snapshot after the last sampling period is always yielded.
+        save_history : bool, optional
+            Save the model and controller histories, defaults to True. If False, the
+            memory footprint stays constant.
+
+        Yields
+        ------
+        SimulationSnapshot
+            Snapshot of the current state and the latest control output.
+
+        """
+        self._start()
+        k = 0
+        while self.mdl.t0 <= t_stop:
+            with np.errstate(invalid="raise"):
+                self._step(save_history)
+            k += 1
+            stop = self._check_stop_conditions()
+            if stop or k % every == 0:
+                yield self.snapshot()
+            if stop:
+                return
+        if k % every != 0:
+            # The final state is yielded also if not on the `every` grid
+            yield self.snapshot()
+
+    def snapshot(self) -> SimulationSnapshot:
+        """Return a snapshot of the current simulation state."""
+        return SimulationSnapshot(
+            self.mdl.t0, self.mdl.get_initial_values(), self._T_s, self._d_abc
+        )
+
+    def post_process(self) -> SimulationResults:
+        """Post-process the solution data collected so far."""
+        if self._results is not None:
+            return self._results
+        metrics = {name: acc.result() for name, acc in self.accumulators.items()}
+        if not self.mdl._history.t:
+            # No history saved, only the accumulated metrics are available
+            return SimulationResults(
+                ModelTimeSeries(ModelStateHistory()), None, metrics, self.stop_reason
+            )
         mdl_ts = ModelTimeSeries(
             self.mdl._history,
             self.mdl.subsystems,
@@ -144,34 +409,118 @@ class Simulation:
             self.mdl.zoh_connections,
         )
         ctrl_ts = self.ctrl.post_process()
-        return SimulationResults(mdl_ts, ctrl_ts)
+        return SimulationResults(mdl_ts, ctrl_ts, metrics, self.stop_reason)
+
+    def _start(self) -> None:
+        """Initialize outputs based on initial states, if not done yet."""
+        if not self._started:
+            self.mdl.set_outputs(self.mdl.t0)
+            self.mdl.real_angles = self.cfg.real_angles
+            self._solver_options = self.cfg.get_options(self.mdl)
+            if self.accumulators:
+                self._segment = SegmentSignals(self.mdl)
+            self._started = True
 
     @np.errstate(invalid="raise")
     def _run_simulation_loop(
-        self, t_stop: float, update_progress: Callable[[], None]
+        self,
+        t_stop: float,
+        update_progress: Callable[[], None],
+        save_history: bool = True,
     ) -> None:
         """Run the main simulation loop."""
         while self.mdl.t0 <= t_stop:
-            # Control, computational delay, and carrier comparison
-            T_s, ref_duty_ratio = self.ctrl(self.mdl)
-            duty_ratio = self.mdl.delay(ref_duty_ratio)
-            t_steps, sw_states = self.mdl.pwm(T_s, duty_ratio)
-
-            # Loop over the sampling period T_s
-            for i, t_step in enumerate(t_steps):
-                if t_step > 0:
-                    # Set the switching state and get initial values
-                    self.mdl.set_zoh_input("sw_state", sw_states[i])
-                    self.mdl.interconnect()
-                    state0 = self.mdl.get_initial_values()
-
-                    # Integrate over t_span
-                    t_span = (self.mdl.t0, self.mdl.t0 + t_step)
-                    sol = solve_ivp(self.mdl.rhs, t_span, state0, **self.cfg.solver)
-
-                    # Set the new initial time and save the solution
-                    self.mdl.t0 = t_span[-1]
-                    self.mdl.save(sol)
-
+            self._step(save_history)
             # Update progress after each control step
             update_progress()
+            if self._check_stop_conditions():
+                break
+
+    def _check_stop_conditions(self) -> bool:
+        """Evaluate the stop conditions and record the reason, if any is met."""
+        for condition in self.stop_conditions:
+            if condition.update(self):
+                self.stop_reason = condition.reason
+                return True
+        return False
+
+    def _step(self, save_history: bool = True) -> None:
+        """Run the control system and solve the model over one sampling period."""
+        # Events due at the sampling instant are applied before the control system
+        self._apply_events()
+
+        # Control, computational delay, and carrier comparison
+        T_s, ref_duty_ratio = self.ctrl(self.mdl)
+        duty_ratio = self.mdl.delay(ref_duty_ratio)
+        t_steps, sw_states = self.mdl.pwm(T_s, duty_ratio)
+        self._T_s, self._d_abc = T_s, ref_duty_ratio
+        if not save_history:
+            self.ctrl.clear_data()
+
+        # Loop over the sampling period T_s
+        for i, t_step in enumerate(t_steps):
+            if t_step > 0:
+                # Set the switching state
+                self.mdl.set_zoh_input("sw_state", sw_states[i])
+                self.mdl.interconnect()
+                # Split the segment at the events
+                t_end = self.mdl.t0 + t_step
+                while self._next_event_time() < t_end:
+                    self._integrate(self._next_event_time(), save_history)
+                    self._apply_events()
+                self._integrate(t_end, save_history)
+
+    def _next_event_time(self) -> float:
+        """Return the time of the next pending event."""
+        if self._next_event < len(self.events):
+            return self.events[self._next_event].t
+        return np.inf
+
+    def _apply_events(self) -> None:
+        """Apply the pending events, whose time has been reached."""
+        applied = False
+        while self._next_event_time() <= self.mdl.t0:
+            self.events[self._next_event].action(self)
+            self._next_event += 1
+            applied = True
+        if applied:
+            # Update the outputs, e.g., for the measurements of the control system
+            self.mdl.set_outputs(self.mdl.t0)
+            self.mdl.interconnect()
+
+    def _integrate(self, t_end: float, save_history: bool) -> None:
+        """Solve the model from the current time to `t_end`."""
+        # Imported here, so that importing the models does not import SciPy
+        from scipy.integrate import solve_ivp  # noqa: PLC0415
+
+        while t_end > self.mdl.t0:
+            # The solver stops at the state events, e.g., diode commutations
+            events = self.mdl.get_solver_events(self.mdl.t0)
+            state0 = self.mdl.get_solver_initial_values()
+            t_span = (self.mdl.t0, t_end)
+            sol = solve_ivp(
+                self.mdl.rhs,
+                t_span,
+                state0,
+                events=[func for func, _ in events] or None,
+                **self._solver_options,
+            )
+            if events:
+                # The event functions may have left intermediate states
+                self.mdl.set_solver_states(sol.y[:, -1])
+                self.mdl.set_outputs(sol.t[-1])
+                self.mdl.interconnect()
+
+            # Set the new initial time and save the solution
+            self.mdl.t0 = sol.t[-1] if sol.status == 1 else t_end
+            if save_history:
+                self.mdl.save(sol)
+            if self._segment is not None:
+                self._segment.update(sol.t, self.mdl.to_phasors(sol.y))
+                for acc in self.accumulators.values():
+                    acc.update(self._segment)
+
+            if sol.status == 1:
+                for (_, event), t_events in zip(events, sol.t_events, strict=True):
+                    if t_events.size and event.action is not None:
+                        event.action()
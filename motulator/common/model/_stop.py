@@ -0,0 +1,260 @@
+"""
+Stop conditions for simulations.
+
+The stop conditions are evaluated after each control step. A condition stops the
+simulation when it has been met continuously for its minimum duration. The signals are
+functions of the simulation object, e.g., `lambda sim: sim.mdl.converter.state.u_dc`,
+so that the states of the model and the control system are available.
+
+"""
+
+from math import inf
+from typing import TYPE_CHECKING, Any, Callable, Protocol
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from motulator.common.model._simulation import Simulation
+
+type SimSignal = Callable[["Simulation"], Any]
+
+
+# %%
+class StopCondition(Protocol):
+    """
+    Base class for stop conditions.
+
+    Parameters
+    ----------
+    reason : str
+        Reason for stopping, recorded in `SimulationResults.stop_reason`.
+    min_duration : float, optional
+        Minimum duration (s) the condition must be met before stopping, defaults to 0.
+
+    """
+
+    reason: str
+    min_duration: float
+    _t_met: float | None
+
+    def __init__(self, reason: str, min_duration: float = 0.0) -> None:
+        self.reason = reason
+        self.min_duration = min_duration
+        self._t_met = None  # Time instant since which the condition has been met
+
+    def is_met(self, sim: "Simulation", active: bool) -> bool:
+        """
+        Evaluate the condition.
+
+        Parameters
+        ----------
+        sim : Simulation
+            Simulation object.
+        active : bool
+            True if the condition was met at the previous evaluation. This allows the
+            implementations to use a hysteresis band.
+
+        """
+        ...
+
+    def update(self, sim: "Simulation") -> bool:
+        """Evaluate the condition and return True if the simulation should stop."""
+        t = sim.mdl.t0
+        if not self.is_met(sim, self._t_met is not None):
+            self._t_met = None
+            return False
+        if self._t_met is None:
+            self._t_met = t
+        # Small tolerance for the accumulated rounding errors of the time
+        return t - self._t_met >= self.min_duration - 1e-9
+
+
+def _magnitude(value: Any) -> np.ndarray:
+    """Return the element-wise magnitude of a scalar or an array."""
+    return np.abs(np.asarray(value))
+
+
+class SteadyState(StopCondition):
+    """
+    Stop when the steady state is reached.
+
+    The steady state is reached when the magnitudes of all the error signals are below
+    their tolerances. Once reached, it is considered to be lost only when an error
+    exceeds its tolerance multiplied by (1 + `hysteresis`).
+
+    Parameters
+    ----------
+    error : Callable[[Simulation], Any]
+        Error signal, e.g., the speed error. Sequences of errors are supported.
+    tol : float | Sequence[float]
+        Tolerance for each error signal.
+    min_duration : float, optional
+        Minimum duration (s) of the steady state, defaults to 0.
+    hysteresis : float, optional
+        Relative hysteresis, defaults to 0.
+    reason : str, optional
+        Reason for stopping, defaults to "steady state".
+
+    """
+
+    def __init__(
+        self,
+        error: SimSignal,
+        tol: Any,
+        min_duration: float = 0.0,
+        hysteresis: float = 0.0,
+        reason: str = "steady state",
+    ) -> None:
+        super().__init__(reason, min_duration)
+        self.error = error
+        self.tol = np.asarray(tol)
+        self.hysteresis = hysteresis
+
+    def is_met(self, sim: "Simulation", active: bool) -> bool:
+        """Check if all the errors are within their tolerances."""
+        tol = self.tol * (1 + self.hysteresis) if active else self.tol
+        return bool(np.all(_magnitude(self.error(sim)) <= tol))
+
+
+class LimitExceeded(StopCondition):
+    """
+    Stop when a signal exceeds its limit, e.g., an overcurrent or an overvoltage.
+
+    Once exceeded, the limit is considered to be exceeded until the magnitude falls
+    below the limit multiplied by (1 - `hysteresis`).
+
+    Parameters
+    ----------
+    signal : Callable[[Simulation], Any]
+        Monitored signal, e.g., the phase currents or the DC-bus voltage.
+    limit : float | Sequence[float]
+        Limit for the magnitude of the signal.
+    min_duration : float, optional
+        Minimum duration (s) of exceeding the limit, defaults to 0.
+    hysteresis : float, optional
+        Relative hysteresis, defaults to 0.
+    reason : str, optional
+        Reason for stopping, defaults to "limit exceeded".
+
+    """
+
+    def __init__(
+        self,
+        signal: SimSignal,
+        limit: Any,
+        min_duration: float = 0.0,
+        hysteresis: float = 0.0,
+        reason: str = "limit exceeded",
+    ) -> None:
+        super().__init__(reason, min_duration)
+        self.signal = signal
+        self.limit = np.asarray(limit)
+        self.hysteresis = hysteresis
+
+    def is_met(self, sim: "Simulation", active: bool) -> bool:
+        """Check if any element of the signal exceeds its limit."""
+        limit = self.limit * (1 - self.hysteresis) if active else self.limit
+        return bool(np.any(_magnitude(self.signal(sim)) > limit))
+
+
+class GrowingOscillation(StopCondition):
+    """
+    Stop when the oscillation of a signal grows.
+
+    The oscillation amplitude is computed over consecutive time windows as half of the
+    peak-to-peak value minus the net change over the window, so that monotonic
+    transients, such as speed ramps, are not detected as oscillations. The condition is
+    met when the amplitude has grown by the factor `growth` in `n_windows` consecutive
+    windows. For complex signals, the real and imaginary parts are monitored.
+
+    Parameters
+    ----------
+    signal : Callable[[Simulation], Any]
+        Monitored signal.
+    window : float
+        Length (s) of the time window, should cover several oscillation periods.
+    growth : float, optional
+        Growth factor of the amplitude between consecutive windows, defaults to 1.2.
+    n_windows : int, optional
+        Number of consecutive growing windows, defaults to 3.
+    min_amplitude : float, optional
+        Amplitudes below this value are ignored, defaults to 0.
+    reason : str, optional
+        Reason for stopping, defaults to "growing oscillation".
+
+    """
+
+    def __init__(
+        self,
+        signal: SimSignal,
+        window: float,
+        growth: float = 1.2,
+        n_windows: int = 3,
+        min_amplitude: float = 0.0,
+        reason: str = "growing oscillation",
+    ) -> None:
+        super().__init__(reason)
+        self.signal = signal
+        self.window = window
+        self.growth = growth
+        self.n_windows = n_windows
+        self.min_amplitude = min_amplitude
+        self._t_window: float | None = None
+        self._y0: Any = None
+        self._lo: Any = inf
+        self._hi: Any = -inf
+        self._amplitude: float | None = None
+        self._count = 0
+
+    def is_met(self, sim: "Simulation", active: bool) -> bool:
+        """Update the amplitude and check if it has kept growing."""
+        t = sim.mdl.t0
+        y = np.atleast_1d(np.asarray(self.signal(sim)))
+        if np.iscomplexobj(y):
+            y = np.concatenate((y.real, y.imag))
+        self._lo, self._hi = np.minimum(self._lo, y), np.maximum(self._hi, y)
+        if self._t_window is None:
+            self._t_window, self._y0 = t, y
+        elif t - self._t_window >= self.window - 1e-9:
+            # End of the window
+            amplitude = float(np.max(self._hi - self._lo - np.abs(y - self._y0))) / 2
+            if (
+                self._amplitude is not None
+                and amplitude > self.growth * self._amplitude
+                and amplitude > self.min_amplitude
+            ):
+                self._count += 1
+            else:
+                self._count = 0
+            self._amplitude = amplitude
+            self._t_window, self._y0, self._lo, self._hi = t, y, y, y
+        return self._count >= self.n_windows
+
+
+class StopCallback(StopCondition):
+    """
+    Stop when a user-defined function returns True.
+
+    Parameters
+    ----------
+    func : Callable[[Simulation], bool]
+        Function evaluated after each control step.
+    min_duration : float, optional
+        Minimum duration (s) of the condition, defaults to 0.
+    reason : str, optional
+        Reason for stopping, defaults to "callback".
+
+    """
+
+    def __init__(
+        self,
+        func: Callable[["Simulation"], bool],
+        min_duration: float = 0.0,
+        reason: str = "callback",
+    ) -> None:
+        super().__init__(reason, min_duration)
+        self.func = func
+
+    def is_met(self, sim: "Simulation", active: bool) -> bool:
+        """Evaluate the function."""
+        return bool(self.func(sim))
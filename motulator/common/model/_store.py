@@ -0,0 +1,223 @@
+"""
+Columnar storage of simulation results.
+
+The results are stored in a directory, where each signal is a separate `.npy` column
+(or a compressed `.npz` archive). The file `manifest.json` describes the subsystems of
+the continuous-time model (e.g., `machine`, `mechanics`, `converter`, `ac_filter`) and
+the signal groups of the control system (e.g., `ref` and `fbk`), together with the
+stop reason. The metrics of the streaming accumulators are stored in a single pickled
+column::
+
+    results/
+        manifest.json
+        metrics.npy
+        mdl/t.npy
+        mdl/machine/i_s_ab.npy
+        ...
+        ctrl/t.npy
+        ctrl/ref/u_s.npy
+        ...
+
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from motulator.common.control._base import TimeSeries
+from motulator.common.model._base import (
+    LazyTimeSeries,
+    ModelStateHistory,
+    ModelTimeSeries,
+    defer_signals,
+    resolve_all_deferred,
+)
+
+FORMAT = "motulator-results"
+VERSION = 1
+_SINGLE = {np.dtype(np.float64): np.float32, np.dtype(np.complex128): np.complex64}
+
+
+# %%
+def _signals(obj: Any) -> dict[str, Any]:
+    """Return the signals of a time-series container."""
+    return obj if isinstance(obj, dict) else resolve_all_deferred(obj)
+
+
+def _save_column(
+    folder: Path, name: str, value: Any, single: bool, compress: bool, used: set
+) -> tuple[str, np.ndarray]:
+    """Save a single signal and return its file name and data."""
+    data = np.asarray(value)
+    if single and name != "t" and data.dtype in _SINGLE:
+        data = data.astype(_SINGLE[data.dtype])
+    # File names are made unique also on case-insensitive file systems
+    stem, n = name, 1
+    while stem.lower() in used:
+        stem, n = f"{name}~{n}", n + 1
+    used.add(stem.lower())
+    fname = f"{stem}.npz" if compress else f"{stem}.npy"
+    pickled = data.dtype.hasobject
+    if compress:
+        np.savez_compressed(folder / fname, data, allow_pickle=pickled)
+    else:
+        np.save(folder / fname, data, allow_pickle=pickled)
+    return fname, data
+
+
+def _save_group(
+    root: Path, rel: str, signals: dict[str, Any], single: bool, compress: bool
+) -> dict[str, Any]:
+    """Save the signals of a group into the folder `rel` below `root`."""
+    folder = root / rel
+    folder.mkdir(parents=True, exist_ok=True)
+    used: set[str] = set()
+    entries = {}
+    for name, value in signals.items():
+        if not name.startswith("_"):
+            fname, data = _save_column(folder, name, value, single, compress, used)
+            entries[name] = {
+                "file": f"{rel}/{fname}",
+                "dtype": str(data.dtype),
+                "shape": list(data.shape),
+            }
+    return entries
+
+
+def save_results(
+    mdl: ModelTimeSeries,
+    ctrl: Any,
+    path: Path | str,
+    single: bool = False,
+    compress: bool = False,
+    metrics: dict[str, Any] | None = None,
+    stop_reason: str = "t_stop",
+) -> None:
+    """
+    Save the simulation results to a directory.
+
+    Parameters
+    ----------
+    mdl : ModelTimeSeries
+        Results from the continuous-time model.
+    ctrl : TimeSeries | None
+        Results from the control system, None if the history was not saved.
+    path : Path | str
+        Directory, created if needed.
+    single : bool, optional
+        Down-cast float64 and complex128 signals to float32 and complex64, except the
+        time vectors, defaults to False.
+    compress : bool, optional
+        Compress each column, defaults to False. Compressed columns cannot be
+        memory-mapped.
+    metrics : dict[str, Any], optional
+        Results from the streaming accumulators.
+    stop_reason : str, optional
+        Reason for stopping the simulation, defaults to "t_stop".
+
+    """
+    root = Path(path)
+    root.mkdir(parents=True, exist_ok=True)
+    manifest: dict[str, Any] = {
+        "format": FORMAT,
+        "version": VERSION,
+        "stop_reason": stop_reason,
+        "metrics": None,
+        "mdl": {"signals": {}, "subsystems": {}},
+        "ctrl": None if ctrl is None else {"signals": {}, "groups": {}},
+    }
+    if metrics:
+        data = np.empty((), dtype=object)
+        data[()] = metrics
+        np.save(root / "metrics.npy", data, allow_pickle=True)
+        manifest["metrics"] = "metrics.npy"
+    parts = [("mdl", mdl, "subsystems")]
+    if ctrl is not None:
+        parts.append(("ctrl", ctrl, "groups"))
+    for part, obj, nested in parts:
+        signals, groups = {}, {}
+        for name, value in _signals(obj).items():
+            if isinstance(value, (np.ndarray, list, tuple, int, float, complex)):
+                signals[name] = value
+            elif not name.startswith("_") and hasattr(value, "__dict__"):
+                groups[name] = _signals(value)
+        manifest[part]["signals"] = _save_group(root, part, signals, single, compress)
+        for name, group in groups.items():
+            manifest[part][nested][name] = _save_group(
+                root, f"{part}/{name}", group, single, compress
+            )
+    # The manifest is written last, so an interrupted save is not mistaken for a
+    # complete one
+    with open(root / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+
+
+def _loader(file: Path, entry: dict[str, Any], mmap: bool) -> Callable[[], np.ndarray]:
+    """Return a function loading a single column."""
+    pickled = entry["dtype"] == "object"
+
+    def load() -> np.ndarray:
+        if file.suffix == ".npz":
+            with np.load(file, allow_pickle=pickled) as data:
+                return data["arr_0"]
+        mmap_mode = "c" if mmap and not pickled else None
+        return np.load(file, mmap_mode=mmap_mode, allow_pickle=pickled)
+
+    return load
+
+
+def _load_group(root: Path, entries: dict[str, Any], mmap: bool) -> LazyTimeSeries:
+    """Defer loading the columns of a group."""
+    ts = LazyTimeSeries()
+    for name, entry in entries.items():
+        ts.defer(name, _loader(root / entry["file"], entry, mmap))
+    return ts
+
+
+def load_results(
+    path: Path | str, mmap: bool = True
+) -> tuple[ModelTimeSeries, Any, dict[str, Any], str]:
+    """
+    Load simulation results saved by :func:`save_results`.
+
+    Parameters
+    ----------
+    path : Path | str
+        Directory containing the results.
+    mmap : bool, optional
+        Memory-map the uncompressed columns (copy-on-write), defaults to True.
+
+    Returns
+    -------
+    tuple[ModelTimeSeries, TimeSeries | None, dict[str, Any], str]
+        Results from the continuous-time model and from the control system, the
+        metrics, and the stop reason. The columns are read when first accessed.
+
+    """
+    root = Path(path)
+    with open(root / "manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != FORMAT or manifest.get("version") != VERSION:
+        raise ValueError(f"Unsupported result store: {root}")
+
+    mdl = ModelTimeSeries(ModelStateHistory())
+    for name, entry in manifest["mdl"]["signals"].items():
+        defer_signals(mdl, name, _loader(root / entry["file"], entry, mmap))
+    for name, entries in manifest["mdl"]["subsystems"].items():
+        setattr(mdl, name, _load_group(root, entries, mmap))
+
+    ctrl = None
+    if manifest["ctrl"] is not None:
+        ctrl = TimeSeries()
+        for name, entry in manifest["ctrl"]["signals"].items():
+            setattr(ctrl, name, _loader(root / entry["file"], entry, mmap)())
+        for name, entries in manifest["ctrl"]["groups"].items():
+            setattr(ctrl, name, _load_group(root, entries, mmap))
+
+    # Results saved before the metrics were stored lack these entries
+    metrics = {}
+    if manifest.get("metrics"):
+        metrics = np.load(root / manifest["metrics"], allow_pickle=True)[()]
+    return mdl, ctrl, metrics, manifest.get("stop_reason", "t_stop")
@@ -1,10 +1,30 @@
 """Common utilities."""
 
-from motulator.common.utils._utils import (
+from motulator.common.utils._profile import Profile
+from motulator.common.utils._signals import (
+    Constant,
+    PiecewiseConstant,
+    Ramp,
     SequenceGenerator,
     Step,
-    abc2complex,
-    complex2abc,
+    Switch,
+    TimeFunction,
+    TimeSignal,
+    as_time_signal,
 )
+from motulator.common.utils._utils import abc2complex, complex2abc
 
-__all__ = ["SequenceGenerator", "Step", "abc2complex", "complex2abc"]
+__all__ = [
+    "Constant",
+    "PiecewiseConstant",
+    "Profile",
+    "Ramp",
+    "SequenceGenerator",
+    "Step",
+    "Switch",
+    "TimeFunction",
+    "TimeSignal",
+    "abc2complex",
+    "as_time_signal",
+    "complex2abc",
+]
@@ -0,0 +1,41 @@
+"""Lazy module attributes."""
+
+from importlib import import_module
+from typing import Any, Callable
+
+
+def lazy_attributes(
+    module_name: str, lazy: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Create module-level `__getattr__` and `__dir__` functions (PEP 562).
+
+    The attributes are imported from their submodules when first accessed, so that
+    importing the package does not import heavy dependencies, such as matplotlib.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the package, i.e., `__name__`.
+    lazy : dict[str, str]
+        Submodule for each lazily imported attribute.
+
+    Returns
+    -------
+    tuple[Callable[[str], Any], Callable[[], list[str]]]
+        Functions to be assigned to `__getattr__` and `__dir__` of the package.
+
+    """
+    module = import_module(module_name)
+
+    def __getattr__(name: str) -> Any:
+        if name not in lazy:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(import_module(lazy[name]), name)
+        setattr(module, name, value)  # Cache, so __getattr__ is not called again
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(module), *lazy})
+
+    return __getattr__, __dir__
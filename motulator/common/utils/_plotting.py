@@ -1,8 +1,11 @@
 """Helper functions for plots."""
 
 from pathlib import Path
+from typing import Any
+from weakref import WeakKeyDictionary
 
 import matplotlib.pyplot as plt
+import numpy as np
 from cycler import cycler
 from numpy.typing import ArrayLike
 
@@ -106,6 +109,103 @@ def configure_axes(
                 ax.set_yticks(ytick)
 
 
+# %%
+def minmax_indices(
+    x: np.ndarray, y: np.ndarray, x_lims: tuple[float, float], n_buckets: int
+) -> np.ndarray:
+    """
+    Select the samples forming the min/max envelope of each bucket.
+
+    The x-range `x_lims` is divided into `n_buckets` equally wide buckets. In each
+    bucket, the first, last, minimum, and maximum samples are kept, so that the ripple
+    peaks are preserved. The nearest samples outside the range are also kept, so that
+    the line continues to the axis edges.
+
+    Parameters
+    ----------
+    x : ndarray, shape (n,)
+        Monotonically increasing x-coordinates.
+    y : ndarray, shape (n,)
+        y-coordinates.
+    x_lims : tuple[float, float]
+        Range of the x-coordinates to be plotted.
+    n_buckets : int
+        Number of buckets, typically the axis width in pixels.
+
+    Returns
+    -------
+    ndarray
+        Sorted indices of the selected samples.
+
+    """
+    edges = np.searchsorted(x, np.linspace(x_lims[0], x_lims[1], n_buckets + 1))
+    edges[-1] = np.searchsorted(x, x_lims[1], side="right")
+    i0, i1 = edges[0], edges[-1]
+    nonempty = edges[:-1] < edges[1:]
+    starts, ends = edges[:-1][nonempty], edges[1:][nonempty]
+    keep = [starts, ends - 1, [max(i0 - 1, 0), min(i1, len(x) - 1)]]
+    if i1 > i0:
+        seg = y[i0:i1]
+        bucket = np.repeat(np.arange(len(starts)), ends - starts)
+        for reduce in (np.minimum, np.maximum):
+            pos = np.flatnonzero(seg == reduce.reduceat(seg, starts - i0)[bucket])
+            _, first = np.unique(bucket[pos], return_index=True)
+            keep.append(i0 + pos[first])
+    return np.unique(np.concatenate(keep))
+
+
+# Full data of the downsampled lines and the oversampling of their axes
+_full_data: WeakKeyDictionary[Any, tuple[np.ndarray, np.ndarray]] = WeakKeyDictionary()
+_oversampling: WeakKeyDictionary[Any, int] = WeakKeyDictionary()
+
+
+def _reduce_lines(ax: Any) -> None:
+    """Set the envelopes of the lines of `ax` for its current x-limits."""
+    n_buckets = _oversampling[ax] * max(int(ax.get_window_extent().width), 1)
+    x_lims = tuple(sorted(ax.get_xlim()))
+    for line in ax.get_lines():
+        if line not in _full_data:
+            continue
+        x, y = _full_data[line]
+        if len(x) <= 4 * n_buckets:
+            line.set_data(x, y)
+        else:
+            index = minmax_indices(x, y, x_lims, n_buckets)
+            line.set_data(x[index], y[index])
+
+
+def downsample_lines(axes: list, oversampling: int = 1) -> None:
+    """
+    Downsample long lines to the min/max envelope per pixel column.
+
+    The lines with monotonically increasing x-data and more samples than the axis
+    width are reduced based on the current x-limits and the axis width in pixels.
+    Hence, this function should be called after the axis limits have been set. The
+    full data are kept aside, and the envelopes are recomputed from them whenever the
+    x-limits change, e.g., when zooming or panning interactively.
+
+    Parameters
+    ----------
+    axes : list
+        List of matplotlib axes objects.
+    oversampling : int, optional
+        Number of buckets per pixel column, defaults to 1.
+
+    """
+    for ax in axes:
+        for line in ax.get_lines():
+            if line in _full_data:
+                continue
+            x = np.asarray(line.get_xdata(), dtype=float)
+            y = np.asarray(line.get_ydata(), dtype=float)
+            if x.ndim == 1 and not np.any(np.diff(x) < 0):
+                _full_data[line] = (x, y)
+        if ax not in _oversampling:
+            ax.callbacks.connect("xlim_changed", _reduce_lines)
+        _oversampling[ax] = oversampling
+        _reduce_lines(ax)
+
+
 # %%
 def save_and_show(save_path: str | Path | None = None, **savefig_kwargs) -> None:
     """
@@ -0,0 +1,182 @@
+"""
+Large time-series profiles, such as drive cycles.
+
+The profile values are linearly interpolated using a cursor, which exploits the
+monotonically advancing simulation time. The interval found at the previous query is
+cached, so that repeated queries within the same interval take constant time. If the
+time advances past the interval, the next interval is found using an exponential search
+starting at the cursor, which is also used for moving backwards, e.g., after rejected
+solver steps. No arrays are allocated per query, and the profile can be memory-mapped
+from a file, so that only the pages around the cursor are read.
+
+"""
+
+from bisect import bisect_right
+from math import inf
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from motulator.common.utils._signals import TimeSignal
+
+
+# %%
+class Profile(TimeSignal):
+    """
+    Profile interpolated with a monotonic cursor.
+
+    The output values are linearly interpolated between the data points, and held
+    constant outside the time range as in :class:`SequenceGenerator`.
+
+    Parameters
+    ----------
+    times : ndarray, shape (n,)
+        Increasing time values (s). Duplicate time values can be used for steps.
+    values : ndarray, shape (n,)
+        Output values.
+    periodic : bool, optional
+        Enables periodicity with the period ``times[-1] - times[0]``, defaults to False.
+
+    """
+
+    def __init__(self, times: Any, values: Any, periodic: bool = False) -> None:
+        self.times = times
+        self.values = values
+        self.periodic = periodic
+        self._path: tuple[str, int] | None = None
+        self._init_cursor()
+
+    def _init_cursor(self) -> None:
+        n = len(self.times)
+        if n < 2 or len(self.values) != n:
+            raise ValueError("The profile must have at least two data points")
+        self._n = n
+        self._t_first = float(self.times[0])
+        self._t_last = float(self.times[-1])
+        self._v_first = float(self.values[0])
+        self._v_last = float(self.values[-1])
+        self._period = self._t_last - self._t_first if self.periodic else None
+        self._k = 0
+        self._set_interval(0)
+
+    @classmethod
+    def load(
+        cls, path: str | Path, column: int = 1, periodic: bool = False
+    ) -> "Profile":
+        """
+        Load a profile from a NumPy file.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path to a ``.npy`` file containing a 2-D array of shape (n, m), whose first
+            column is the time. The file is memory-mapped.
+        column : int, optional
+            Column of the output values, defaults to 1.
+        periodic : bool, optional
+            Enables periodicity, defaults to False.
+
+        Returns
+        -------
+        Profile
+            Memory-mapped profile. When pickled, e.g., for worker processes, only the
+            path is stored and the file is mapped again.
+
+        """
+        data = np.load(path, mmap_mode="r")
+        if data.ndim != 2 or data.shape[1] <= column:
+            raise ValueError(f"Expected an array of shape (n, >{column}) in '{path}'")
+        profile = cls(data[:, 0], data[:, column], periodic)
+        profile._path = (str(path), column)
+        return profile
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Store only the path of a memory-mapped profile."""
+        state = self.__dict__.copy()
+        if self._path is not None:
+            state["times"] = state["values"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Map the file again, if needed."""
+        self.__dict__.update(state)
+        if self._path is not None:
+            path, column = self._path
+            data = np.load(path, mmap_mode="r")
+            self.times, self.values = data[:, 0], data[:, column]
+
+    def _set_interval(self, k: int) -> None:
+        """Move the cursor to the interval [times[k], times[k + 1])."""
+        self._k = k
+        t0, t1 = self.times.item(k), self.times.item(k + 1)
+        v0, v1 = self.values.item(k), self.values.item(k + 1)
+        self._t0, self._t1, self._v0 = t0, t1, v0
+        self._slope = (v1 - v0) / (t1 - t0) if t1 > t0 else 0.0
+
+    def _seek(self, t: float) -> None:
+        """Move the cursor to the interval containing `t`."""
+        times, k, n = self.times, self._k, self._n
+        # Exponential search for the bracket lo <= k_new < hi, starting at the cursor
+        step = 1
+        if t >= self._t1:
+            lo, hi = k + 1, k + 2
+            while hi < n and times.item(hi) <= t:
+                lo, hi = hi, hi + step
+                step *= 2
+            hi = min(hi, n)
+        else:
+            lo, hi = k - 1, k
+            while lo > 0 and times.item(lo) > t:
+                hi, lo = lo, lo - step
+                step *= 2
+            lo = max(lo, 0)
+        if hi - lo > 1:
+            # Last index with times[k] <= t
+            lo = bisect_right(times, t, lo, hi) - 1
+        self._set_interval(min(max(lo, 0), n - 2))
+
+    def _wrap(self, t: float) -> float:
+        """Map the time instant into the first period."""
+        if self._period is None:
+            return t
+        return self._t_first + (t - self._t_first) % self._period
+
+    def at(self, t: float) -> float:
+        """Evaluate the profile at a single time instant."""
+        if self._period is not None:
+            t = self._t_first + (t - self._t_first) % self._period
+        if not self._t0 <= t < self._t1:
+            if t <= self._t_first:
+                return self._v_first
+            if t >= self._t_last:
+                return self._v_last
+            self._seek(t)
+        return self._v0 + self._slope * (t - self._t0)
+
+    def sample(self, t: np.ndarray) -> np.ndarray:
+        """Evaluate the profile at an array of time instants."""
+        if self._period is not None:
+            t = self._t_first + (t - self._t_first) % self._period
+        return np.interp(t, self.times, self.values)
+
+    def constant_until(self, t: float) -> float:
+        """
+        Return the time until which the profile stays constant.
+
+        Only the interval at the cursor is inspected, so that the query takes constant
+        time. The result is a lower bound.
+
+        """
+        t_wrapped = self._wrap(t)
+        if t_wrapped < self._t_first:
+            end = self._t_first
+        elif t_wrapped >= self._t_last:
+            if self._period is not None:
+                return t
+            return inf
+        else:
+            if not self._t0 <= t_wrapped < self._t1:
+                self._seek(t_wrapped)
+            end = self._t1 if self._slope == 0.0 else t_wrapped
+        return t + (end - t_wrapped)
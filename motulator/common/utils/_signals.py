@@ -0,0 +1,465 @@
+"""
+Time signals for references, loads, and source parameters.
+
+The time signals are callables, which can be used wherever a function of time is
+expected. A scalar argument is evaluated using a fast scalar path and an array argument
+using a vectorized path, so that both the state derivatives and the post-processing are
+cheap. The signals can be combined using the arithmetic operators, e.g.,
+``Step(0.1, 1.0) + Ramp(0.2, 0.4, 0.5)``. The method :meth:`TimeSignal.constant_until`
+returns the time until which the signal is known to stay constant.
+
+"""
+
+import operator
+from bisect import bisect_right
+from math import inf
+from typing import Any, Callable
+
+import numpy as np
+
+
+# %%
+class TimeSignal:
+    """Base class for time signals."""
+
+    def __call__(self, t: Any) -> Any:
+        """
+        Evaluate the signal.
+
+        Parameters
+        ----------
+        t : float | ndarray
+            Time (s), either a scalar or an array.
+
+        Returns
+        -------
+        Any
+            Value of the signal, with the same shape as `t` for array arguments.
+
+        """
+        if isinstance(t, float | int):
+            return self.at(t)
+        if np.ndim(t) == 0:
+            return self.at(float(t))
+        return self.sample(np.asarray(t, dtype=float))
+
+    def at(self, t: float) -> Any:
+        """Evaluate the signal at a single time instant."""
+        raise NotImplementedError
+
+    def sample(self, t: np.ndarray) -> np.ndarray:
+        """Evaluate the signal at an array of time instants."""
+        return np.array([self.at(t_k) for t_k in t.ravel()]).reshape(t.shape)
+
+    def constant_until(self, t: float) -> float:
+        """
+        Return the time until which the signal stays constant.
+
+        Parameters
+        ----------
+        t : float
+            Current time (s).
+
+        Returns
+        -------
+        float
+            Time (s) until which the value equals the value at `t`. The result is a
+            lower bound: it equals `t` if the signal is not known to stay constant, and
+            it is infinite if the signal never changes.
+
+        """
+        return t
+
+    def _combine(self, other: Any, op: Callable, reverse: bool = False) -> "TimeSignal":
+        other = as_time_signal(other)
+        operands = (other, self) if reverse else (self, other)
+        return Combination(op, *operands)
+
+    def __add__(self, other: Any) -> "TimeSignal":
+        return self._combine(other, operator.add)
+
+    def __radd__(self, other: Any) -> "TimeSignal":
+        return self._combine(other, operator.add, reverse=True)
+
+    def __sub__(self, other: Any) -> "TimeSignal":
+        return self._combine(other, operator.sub)
+
+    def __rsub__(self, other: Any) -> "TimeSignal":
+        return self._combine(other, operator.sub, reverse=True)
+
+    def __mul__(self, other: Any) -> "TimeSignal":
+        return self._combine(other, operator.mul)
+
+    def __rmul__(self, other: Any) -> "TimeSignal":
+        return self._combine(other, operator.mul, reverse=True)
+
+    def __truediv__(self, other: Any) -> "TimeSignal":
+        return self._combine(other, operator.truediv)
+
+    def __neg__(self) -> "TimeSignal":
+        return Combination(operator.neg, self)
+
+
+def as_time_signal(u: Any) -> TimeSignal:
+    """
+    Convert a constant or a function of time to a time signal.
+
+    Parameters
+    ----------
+    u : Any
+        Time signal, function of time, or constant.
+
+    Returns
+    -------
+    TimeSignal
+        Time signal.
+
+    """
+    if isinstance(u, TimeSignal):
+        return u
+    if callable(u):
+        return TimeFunction(u)
+    return Constant(u)
+
+
+# %%
+class Combination(TimeSignal):
+    """
+    Element-wise combination of time signals.
+
+    Parameters
+    ----------
+    op : Callable[..., Any]
+        Operation, e.g., `operator.add`, applied to the values of the signals.
+    *signals : TimeSignal
+        Operands.
+
+    """
+
+    def __init__(self, op: Callable[..., Any], *signals: TimeSignal) -> None:
+        self.op = op
+        self.signals = signals
+
+    def at(self, t: float) -> Any:
+        """Evaluate the signal at a single time instant."""
+        return self.op(*(signal.at(t) for signal in self.signals))
+
+    def sample(self, t: np.ndarray) -> np.ndarray:
+        """Evaluate the signal at an array of time instants."""
+        return self.op(*(signal.sample(t) for signal in self.signals))
+
+    def constant_until(self, t: float) -> float:
+        """Return the time until which all the operands stay constant."""
+        return min(signal.constant_until(t) for signal in self.signals)
+
+
+class TimeFunction(TimeSignal):
+    """
+    Time signal defined by an arbitrary function of time.
+
+    The function is first tried with the array argument. If it is not vectorized, it
+    is evaluated at each time instant separately. The function is never assumed to stay
+    constant.
+
+    Parameters
+    ----------
+    func : Callable[[float], Any]
+        Function of time.
+
+    """
+
+    def __init__(self, func: Callable[[Any], Any]) -> None:
+        self.func = func
+
+    def at(self, t: float) -> Any:
+        """Evaluate the signal at a single time instant."""
+        return self.func(t)
+
+    def sample(self, t: np.ndarray) -> np.ndarray:
+        """Evaluate the signal at an array of time instants."""
+        try:
+            y = np.asarray(self.func(t))
+        except (TypeError, ValueError):
+            y = None
+        if y is not None and y.shape == t.shape:
+            return y
+        return super().sample(t)
+
+
+class Switch(TimeSignal):
+    """
+    Signal switching from one signal to another at a given time.
+
+    Parameters
+    ----------
+    t_switch : float
+        Switching time (s).
+    before : TimeSignal
+        Signal before the switching time.
+    after : TimeSignal
+        Signal from the switching time onwards.
+
+    """
+
+    def __init__(self, t_switch: float, before: TimeSignal, after: TimeSignal) -> None:
+        self.t_switch = t_switch
+        self.before = before
+        self.after = after
+
+    def at(self, t: float) -> Any:
+        """Evaluate the signal at a single time instant."""
+        if t >= self.t_switch:
+            return self.after.at(t)
+        return self.before.at(t)
+
+    def sample(self, t: np.ndarray) -> np.ndarray:
+        """Evaluate the signal at an array of time instants."""
+        return np.where(t >= self.t_switch, self.after.sample(t), self.before.sample(t))
+
+    def constant_until(self, t: float) -> float:
+        """Return the time until which the active signal stays constant."""
+        if t >= self.t_switch:
+            return self.after.constant_until(t)
+        return min(self.before.constant_until(t), self.t_switch)
+
+
+# %%
+class Constant(TimeSignal):
+    """
+    Constant signal.
+
+    Parameters
+    ----------
+    value : Any
+        Constant value.
+
+    """
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def at(self, t: float) -> Any:
+        """Evaluate the signal at a single time instant."""
+        return self.value
+
+    def sample(self, t: np.ndarray) -> np.ndarray:
+        """Evaluate the signal at an array of time instants."""
+        return np.full(t.shape, self.value)
+
+    def constant_until(self, t: float) -> float:
+        """The signal never changes."""
+        return inf
+
+
+class Step(TimeSignal):
+    """
+    Step function.
+
+    Parameters
+    ----------
+    step_time : float
+        Time of the step.
+    step_value : float
+        Value of the step.
+    initial_value : float, optional
+        Initial value, defaults to 0.
+
+    """
+
+    def __init__(
+        self, step_time: float, step_value: float, initial_value: float = 0.0
+    ) -> None:
+        self.step_time = step_time
+        self.step_value = step_value
+        self.initial_value = initial_value
+
+    def at(self, t: float) -> float:
+        """Evaluate the signal at a single time instant."""
+        if t >= self.step_time:
+            return self.initial_value + self.step_value
+        return self.initial_value
+
+    def sample(self, t: np.ndarray) -> np.ndarray:
+        """Evaluate the signal at an array of time instants."""
+        return self.initial_value + (t >= self.step_time) * self.step_value
+
+    def constant_until(self, t: float) -> float:
+        """Return the step time before the step, otherwise infinity."""
+        return self.step_time if t < self.step_time else inf
+
+
+class Ramp(TimeSignal):
+    """
+    Ramp between two constant values.
+
+    Parameters
+    ----------
+    start_time : float
+        Start time of the ramp.
+    end_time : float
+        End time of the ramp.
+    end_value : float
+        Value at the end of the ramp.
+    initial_value : float, optional
+        Value before the ramp, defaults to 0.
+
+    """
+
+    def __init__(
+        self,
+        start_time: float,
+        end_time: float,
+        end_value: float,
+        initial_value: float = 0.0,
+    ) -> None:
+        if end_time <= start_time:
+            raise ValueError("The end time must be after the start time")
+        self.start_time = start_time
+        self.end_time = end_time
+        self.end_value = end_value
+        self.initial_value = initial_value
+        self._slope = (end_value - initial_value) / (end_time - start_time)
+
+    def at(self, t: float) -> float:
+        """Evaluate the signal at a single time instant."""
+        if t <= self.start_time:
+            return self.initial_value
+        if t >= self.end_time:
+            return self.end_value
+        return self.initial_value + self._slope * (t - self.start_time)
+
+    def sample(self, t: np.ndarray) -> np.ndarray:
+        """Evaluate the signal at an array of time instants."""
+        t_ramp = np.clip(t, self.start_time, self.end_time) - self.start_time
+        return self.initial_value + self._slope * t_ramp
+
+    def constant_until(self, t: float) -> float:
+        """Return the start time before the ramp and infinity after it."""
+        if t < self.start_time:
+            return self.start_time
+        return inf if t >= self.end_time else t
+
+
+class PiecewiseConstant(TimeSignal):
+    """
+    Piecewise-constant signal.
+
+    The value is `values[k]` for ``times[k] <= t < times[k + 1]``. Before the first
+    time instant, the value is `values[0]`.
+
+    Parameters
+    ----------
+    times : ndarray
+        Increasing time instants of the changes.
+    values : ndarray
+        Values starting at the time instants.
+
+    """
+
+    def __init__(self, times: Any, values: Any) -> None:
+        if len(times) != len(values) or len(times) == 0:
+            raise ValueError("The times and values must have the same nonzero length")
+        self.times = np.asarray(times, dtype=float)
+        self.values = np.asarray(values)
+        self._times = self.times.tolist()
+        self._values = self.values.tolist()
+        # End of the constant run starting at each time instant
+        self._run_end = len(self._times) * [inf]
+        for k in range(len(self._times) - 2, -1, -1):
+            if self._values[k + 1] == self._values[k]:
+                self._run_end[k] = self._run_end[k + 1]
+            else:
+                self._run_end[k] = self._times[k + 1]
+
+    def at(self, t: float) -> Any:
+        """Evaluate the signal at a single time instant."""
+        k = max(bisect_right(self._times, t) - 1, 0)
+        return self._values[k]
+
+    def sample(self, t: np.ndarray) -> np.ndarray:
+        """Evaluate the signal at an array of time instants."""
+        k = np.maximum(np.searchsorted(self.times, t, side="right") - 1, 0)
+        return self.values[k]
+
+    def constant_until(self, t: float) -> float:
+        """Return the time of the next change of the value."""
+        return self._run_end[max(bisect_right(self._times, t) - 1, 0)]
+
+
+class SequenceGenerator(TimeSignal):
+    """
+    Sequence generator.
+
+    The time array must be increasing. The output values are interpolated between the
+    data points.
+
+    Parameters
+    ----------
+    times : ndarray
+        Time values.
+    values : ndarray
+        Output values.
+    periodic : bool, optional
+        Enables periodicity, defaults to False.
+
+    """
+
+    def __init__(self, times: Any, values: Any, periodic: bool = False) -> None:
+        self.times = times
+        self.values = values
+        if periodic is True:
+            self._period = times[-1] - times[0]
+        else:
+            self._period = None
+        self._times = np.asarray(times, dtype=float).tolist()
+        # Complex values, e.g., space-vector references, are kept complex
+        values = np.asarray(values)
+        if not np.iscomplexobj(values):
+            values = values.astype(float)
+        self._values = values.tolist()
+        # End of the constant run starting at each data point. A segment is constant if
+        # its end values are equal, and the signal is constant after the last point.
+        # The run of a point followed by a non-constant segment ends at the point.
+        n = len(self._times)
+        self._run_end = n * [inf]
+        for k in range(n - 2, -1, -1):
+            if self._values[k + 1] == self._values[k]:
+                self._run_end[k] = self._run_end[k + 1]
+            else:
+                self._run_end[k] = self._times[k]
+
+    def _wrap(self, t: Any) -> Any:
+        """Map the time instants into the first period."""
+        if self._period is None:
+            return t
+        return self._times[0] + (t - self._times[0]) % self._period
+
+    def at(self, t: float) -> float:
+        """Evaluate the signal at a single time instant."""
+        t = self._wrap(t)
+        times, values = self._times, self._values
+        if t <= times[0]:
+            return values[0]
+        if t >= times[-1]:
+            return values[-1]
+        k = bisect_right(times, t) - 1
+        slope = (values[k + 1] - values[k]) / (times[k + 1] - times[k])
+        return values[k] + slope * (t - times[k])
+
+    def sample(self, t: np.ndarray) -> np.ndarray:
+        """Evaluate the signal at an array of time instants."""
+        # The time is wrapped here, since np.interp(..., period=...) reorders the
+        # duplicate time instants of steps
+        return np.interp(self._wrap(t), self.times, self.values)
+
+    def constant_until(self, t: float) -> float:
+        """Return the time until which the interpolated value stays constant."""
+        t_wrapped = self._wrap(t)
+        k = max(bisect_right(self._times, t_wrapped) - 1, 0)
+        end = max(self._run_end[k], t_wrapped)
+        if self._period is None:
+            return end
+        if self._run_end[0] == inf:
+            return inf
+        # Conservatively, the run is not continued to the next period
+        return t + (min(end, self._times[-1]) - t_wrapped)
@@ -0,0 +1,111 @@
+"""Helpers for windowing and resampling time series."""
+
+from typing import Any
+
+import numpy as np
+
+
+# %%
+def signal_names(obj: Any) -> list[str]:
+    """Return the names of the signals in a container, without computing them."""
+    if isinstance(obj, dict):
+        return [name for name in obj if not name.startswith("_")]
+    names = [*vars(obj), *vars(obj).get("_deferred", {})]
+    return [name for name in dict.fromkeys(names) if not name.startswith("_")]
+
+
+class TimeWindow:
+    """
+    Select the samples within a time window.
+
+    The window is located using binary search, and the selected samples are views of
+    the original arrays.
+
+    Parameters
+    ----------
+    t : ndarray, shape (n,)
+        Time instants, monotonically increasing.
+    t0, t1 : float
+        Start and end of the window.
+
+    """
+
+    def __init__(self, t: np.ndarray, t0: float, t1: float) -> None:
+        self.n = len(t)
+        i0 = int(np.searchsorted(t, t0, side="left"))
+        i1 = int(np.searchsorted(t, t1, side="right"))
+        self.index = slice(i0, max(i0, i1))
+
+    def __call__(self, y: Any, axis: int = 0) -> Any:
+        """Select the window of the signal `y`, if it is a time series."""
+        y = np.asarray(y)
+        if y.ndim == 0 or y.shape[axis] != self.n:
+            return y
+        index: list[Any] = [slice(None)] * y.ndim
+        index[axis] = self.index
+        return y[tuple(index)]
+
+
+# %%
+class Resampler:
+    """
+    Resample time series at new time instants.
+
+    The indices and interpolation weights are computed once and then applied to any
+    number of signals. With the zero-order hold, the latest sample at or before each
+    new instant is taken. The linear interpolation is done between the samples
+    enclosing each new instant. At the repeated time instants, where the solver
+    segments meet, the later sample is used. Hence, the interpolation never crosses
+    the switching instants and the ZOH signals remain piecewise constant. Integer and
+    Boolean signals, such as switching states, are always held. Outside the original
+    time range, the first and last samples are held.
+
+    Parameters
+    ----------
+    t : ndarray, shape (n,)
+        Original time instants, monotonically increasing.
+    t_new : ndarray, shape (m,)
+        New time instants.
+    method : str, optional
+        Resampling method, "zoh" (default) or "linear".
+
+    """
+
+    def __init__(self, t: np.ndarray, t_new: np.ndarray, method: str = "zoh") -> None:
+        if method not in ("zoh", "linear"):
+            raise ValueError(f"Unknown resampling method: {method}")
+        self.n = n = len(t)
+        i = np.searchsorted(t, t_new, side="right") - 1
+        self.index = np.clip(i, 0, n - 1)
+        self.weight = None
+        if method == "linear" and n > 1:
+            self.index = np.clip(i, 0, n - 2)
+            dt = t[self.index + 1] - t[self.index]
+            w = np.divide(
+                t_new - t[self.index], dt, out=np.zeros(len(t_new)), where=dt > 0
+            )
+            self.weight = np.clip(w, 0, 1)
+
+    def __call__(self, y: Any, axis: int = 0) -> Any:
+        """Resample the signal `y` along its time axis, if it is a time series."""
+        y = np.asarray(y)
+        if y.ndim == 0 or y.shape[axis] != self.n:
+            return y
+        y0 = np.take(y, self.index, axis=axis)
+        if self.weight is None or not np.issubdtype(y.dtype, np.inexact):
+            return y0
+        y1 = np.take(y, self.index + 1, axis=axis)
+        shape = [1] * y.ndim
+        shape[axis] = -1
+        w = self.weight.reshape(shape)
+        return y0 + w * (y1 - y0)
+
+
+def uniform_grid(t: np.ndarray, dt: float) -> np.ndarray:
+    """Return uniformly spaced time instants covering the range of `t`."""
+    if dt <= 0:
+        raise ValueError("Sampling interval must be positive")
+    if len(t) == 0:
+        return np.array([])
+    n = int(np.floor((t[-1] - t[0]) / dt * (1 + 1e-12))) + 1
+    return t[0] + dt * np.arange(n)
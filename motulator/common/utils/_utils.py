@@ -64,79 +64,6 @@ def complex2abc(u: Any) -> np.ndarray:
     )
 
 
-# %%
-class SequenceGenerator:
-    """
-    Sequence generator.
-
-    The time array must be increasing. The output values are interpolated between the
-    data points.
-
-    Parameters
-    ----------
-    times : ndarray
-        Time values.
-    values : ndarray
-        Output values.
-    periodic : bool, optional
-        Enables periodicity, defaults to False.
-
-    """
-
-    def __init__(self, times: Any, values: Any, periodic: bool = False) -> None:
-        self.times = times
-        self.values = values
-        if periodic is True:
-            self._period = times[-1] - times[0]
-        else:
-            self._period = None
-
-    def __call__(self, t: float) -> Any:
-        """Interpolate the output."""
-        return np.interp(t, self.times, self.values, period=self._period)
-
-
-# %%
-class Step:
-    """
-    Step function.
-
-    Parameters
-    ----------
-    step_time : float
-        Time of the step.
-    step_value : float
-        Value of the step.
-    initial_value : float, optional
-        Initial value, defaults to 0.
-
-    """
-
-    def __init__(
-        self, step_time: float, step_value: float, initial_value: float = 0.0
-    ) -> None:
-        self.step_time = step_time
-        self.step_value = step_value
-        self.initial_value = initial_value
-
-    def __call__(self, t: float) -> float:
-        """
-        Step function.
-
-        Parameters
-        ----------
-        t : float
-            Time.
-
-        Returns
-        -------
-        float
-            Step output.
-
-        """
-        return self.initial_value + (t >= self.step_time) * self.step_value
-
-
 # %%
 def wrap(theta: float) -> Any:
     """
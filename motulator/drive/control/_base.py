@@ -3,7 +3,7 @@
 from cmath import exp
 from dataclasses import dataclass
 from math import inf
-from typing import Callable, Literal, Protocol, Sequence
+from typing import Any, Callable, Literal, Protocol, Sequence
 
 from motulator.common.control._base import ControlSystem, TimeSeries
 from motulator.common.control._controllers import PIController, RateLimiter
@@ -75,6 +75,14 @@ class VectorController[Ref, Fbk](Protocol):
         """Update controller states."""
         ...
 
+    def get_state(self) -> dict[str, Any]:
+        """Return a copy of the controller states."""
+        ...
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the controller states returned by :meth:`get_state`."""
+        ...
+
     def post_process(self, ts: TimeSeries) -> None:
         """Post-process controller outputs."""
         ...
@@ -155,18 +163,20 @@ class VectorControlSystem(ControlSystem):
         fbk.u_dc = meas.u_dc
         return fbk
 
-    def compute_output(self, fbk: Feedbacks) -> References:
-        """Compute controller output based on feedback."""
+    def compute_torque_ref(self, t: float, w_M: float) -> tuple[float | None, float]:
+        """Compute the speed reference, if any, and the torque reference."""
         # Speed-control mode
         if self.speed_ctrl and self.ext_ref.w_M is not None:
-            w_M_ref = self.ext_ref.w_M(self.t)
-            tau_M_ref = self.speed_ctrl.compute_output(w_M_ref, fbk.w_M)
+            w_M_ref = self.ext_ref.w_M(t)
+            return w_M_ref, self.speed_ctrl.compute_output(w_M_ref, w_M)
         # Torque-control mode
-        elif self.ext_ref.tau_M is not None:
-            w_M_ref = None
-            tau_M_ref = self.ext_ref.tau_M(self.t)
-        else:
-            raise ValueError("Either speed or torque reference must be set")
+        if self.ext_ref.tau_M is not None:
+            return None, self.ext_ref.tau_M(t)
+        raise ValueError("Either speed or torque reference must be set")
+
+    def compute_output(self, fbk: Feedbacks) -> References:
+        """Compute controller output based on feedback."""
+        w_M_ref, tau_M_ref = self.compute_torque_ref(self.t, fbk.w_M)
         ref = self.vector_ctrl.compute_output(tau_M_ref, fbk)
         u_s_ab_ref = exp(1j * fbk.theta_c) * ref.u_s
         ref.d_abc = self.pwm(ref.T_s, u_s_ab_ref, fbk.u_dc, fbk.w_c)
@@ -180,6 +190,23 @@ class VectorControlSystem(ControlSystem):
         if self.speed_ctrl and ref.tau_M is not None:
             self.speed_ctrl.update(ref.T_s, ref.tau_M)
 
+    def get_state(self) -> dict[str, Any]:
+        """Extend the get-state method."""
+        state = super().get_state()
+        state["pwm"] = self.pwm.get_state()
+        state["vector_ctrl"] = self.vector_ctrl.get_state()
+        if self.speed_ctrl:
+            state["speed_ctrl"] = self.speed_ctrl.get_state()
+        return state
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Extend the set-state method."""
+        super().set_state(state)
+        self.pwm.set_state(state["pwm"])
+        self.vector_ctrl.set_state(state["vector_ctrl"])
+        if self.speed_ctrl:
+            self.speed_ctrl.set_state(state["speed_ctrl"])
+
     def post_process(self) -> TimeSeries:
         """Extend the post-process method."""
         ts = super().post_process()
@@ -1,6 +1,7 @@
 """Common control functions and classes for machine drives."""
 
 from math import inf
+from typing import Any
 
 from motulator.common.control._controllers import PIController
 
@@ -104,3 +105,11 @@ class SpeedObserver:
 
         self.w_M += T_s * d_w_M
         self.tau_L += T_s * d_tau_L
+
+    def get_state(self) -> dict[str, Any]:
+        """Return the state estimates."""
+        return {"w_M": self.w_M, "tau_L": self.tau_L}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the state estimates."""
+        self.w_M, self.tau_L = state["w_M"], state["tau_L"]
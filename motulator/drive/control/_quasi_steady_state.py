@@ -0,0 +1,130 @@
+"""Control system for the quasi-steady-state drive model."""
+
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from motulator.common.control._base import ControlSystem
+from motulator.drive.control._base import VectorControlSystem
+from motulator.drive.model._quasi_steady_state import QuasiSteadyStateDrive
+
+
+# %%
+@dataclass
+class IdealFeedbacks:
+    """
+    Ideal feedback signals.
+
+    The fields of the observer outputs, which the reference generation of the vector
+    controllers can use, are given their actual values in controller coordinates.
+
+    """
+
+    u_dc: float = 0.0  # DC-bus voltage
+    i_s: complex = 0j  # Stator current
+    u_s: complex = 0j  # Stator voltage
+    psi_s: complex = 0j  # Stator flux linkage
+    psi_R: complex = 0j  # Rotor flux linkage (induction machines)
+    tau_M: float = 0.0  # Electromagnetic torque
+    w_c: float = 0.0  # Angular speed of the coordinate system
+    w_s: float = 0.0  # Synchronous angular frequency
+    w_r: float = 0.0  # Slip angular frequency
+    w_m: float = 0.0  # Electrical angular speed of the rotor
+    w_M: float = 0.0  # Mechanical angular speed of the rotor
+    theta_c: float = 0.0  # Coordinate system angle
+
+
+class QuasiSteadyStateControlSystem(ControlSystem):
+    """
+    Control system for the quasi-steady-state drive model.
+
+    The speed controller, the external references, and the current reference generation
+    of the given vector control system are used. The current control and the observer
+    are assumed to be ideal, so that the current reference is passed directly to
+    :class:`motulator.drive.model.QuasiSteadyStateDrive` in each control cycle. The
+    converter is not modeled, and the duty ratios are those of the zero voltage. Since
+    the electrical dynamics are not simulated, the sampling period can be chosen based
+    on the speed-control bandwidth.
+
+    Parameters
+    ----------
+    ctrl : VectorControlSystem
+        Vector control system, whose vector controller provides the stator current
+        reference `ref.i_s`, i.e., current-vector control.
+    T_s : float, optional
+        Sampling period (s), defaults to 1e-3.
+
+    Notes
+    -----
+    The internal states of the vector controller are not updated. Hence, the field
+    weakening of the induction machine current-vector controller, which integrates the
+    voltage error, is not modeled. The field weakening of the synchronous machine
+    current-vector controller is based on the speed and the DC-bus voltage, and it is
+    modeled.
+
+    """
+
+    def __init__(self, ctrl: VectorControlSystem, T_s: float = 1e-3) -> None:
+        super().__init__()
+        self.ctrl = ctrl
+        self.T_s = T_s
+        self.ref: Any = None  # Latest references
+
+    def get_measurement(self, mdl: QuasiSteadyStateDrive) -> IdealFeedbacks:
+        """Get the actual signals in controller coordinates."""
+        out, inp = mdl.machine.out, mdl.machine.inp
+        w_M = mdl.mechanics.meas_speed()
+        w_m = mdl.machine.par.n_p * w_M
+        return IdealFeedbacks(
+            u_dc=mdl.converter.meas_dc_voltage(),
+            i_s=inp.i_s,
+            u_s=out.u_s,
+            psi_s=out.psi_s,
+            psi_R=out.psi_R,
+            tau_M=out.tau_M,
+            w_c=out.w_s,
+            w_s=out.w_s,
+            w_r=out.w_s - w_m,
+            w_m=w_m,
+            w_M=w_M,
+        )
+
+    def get_feedback(self, meas: IdealFeedbacks) -> IdealFeedbacks:
+        """Get feedback signals, equal to the actual signals."""
+        return meas
+
+    def compute_output(self, fbk: IdealFeedbacks) -> Any:
+        """Compute the current reference."""
+        w_M_ref, tau_M_ref = self.ctrl.compute_torque_ref(self.t, fbk.w_M)
+        ref = self.ctrl.vector_ctrl.compute_output(tau_M_ref, fbk)
+        ref.T_s = self.T_s
+        ref.w_M = w_M_ref
+        ref.d_abc = [0.5, 0.5, 0.5]
+        return ref
+
+    def update(self, ref: Any, fbk: IdealFeedbacks) -> None:
+        """Update the speed controller."""
+        super().update(ref, fbk)
+        self.ref = ref
+        if self.ctrl.speed_ctrl and ref.tau_M is not None:
+            self.ctrl.speed_ctrl.update(ref.T_s, ref.tau_M)
+
+    def run_control_loop(
+        self, mdl: QuasiSteadyStateDrive
+    ) -> tuple[float, Sequence[float]]:
+        """Run the control loop and pass the current reference to the model."""
+        T_s, d_abc = super().run_control_loop(mdl)
+        mdl.set_current_reference(self.ref.i_s)
+        return T_s, d_abc
+
+    def get_state(self) -> dict[str, Any]:
+        """Extend the get-state method with the speed-controller state."""
+        state = super().get_state()
+        if self.ctrl.speed_ctrl:
+            state["speed_ctrl"] = self.ctrl.speed_ctrl.get_state()
+        return state
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Extend the set-state method with the speed-controller state."""
+        super().set_state(state)
+        if self.ctrl.speed_ctrl:
+            self.ctrl.speed_ctrl.set_state(state["speed_ctrl"])
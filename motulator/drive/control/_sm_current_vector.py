@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from math import inf, pi
-from typing import Callable
+from typing import Any, Callable
 
 from motulator.common.control import ComplexPIController
 from motulator.common.control._base import TimeSeries
@@ -198,5 +198,17 @@ class CurrentVectorController:
         self.observer.update(ref.T_s, fbk)
         self.current_ctrl.update(ref.T_s, fbk.u_s, fbk.w_c)
 
+    def get_state(self) -> dict[str, Any]:
+        """Return the states of the observer and the current controller."""
+        return {
+            "observer": self.observer.get_state(),
+            "current_ctrl": self.current_ctrl.get_state(),
+        }
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the states of the observer and the current controller."""
+        self.observer.set_state(state["observer"])
+        self.current_ctrl.set_state(state["current_ctrl"])
+
     def post_process(self, ts: TimeSeries) -> None:
         """Post-process controller time series."""
@@ -3,7 +3,7 @@
 from cmath import exp
 from dataclasses import dataclass
 from math import pi
-from typing import Callable
+from typing import Any, Callable
 
 from motulator.common.utils._utils import wrap
 from motulator.drive.control._common import SpeedObserver
@@ -179,6 +179,15 @@ class FluxObserver:
         self.theta_m = wrap(self.theta_m + T_s * out.w_c)
         self.par.psi_f += T_s * self.k_f(out.w_m) * out.eps_f
 
+    def get_state(self) -> dict[str, Any]:
+        """Return the state estimates, including the PM-flux estimate."""
+        return {"psi_s": self.psi_s, "theta_m": self.theta_m, "psi_f": self.par.psi_f}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the state estimates."""
+        self.psi_s, self.theta_m = state["psi_s"], state["theta_m"]
+        self.par.psi_f = state["psi_f"]
+
 
 # %%
 class SpeedFluxObserver:
@@ -247,6 +256,18 @@ class SpeedFluxObserver:
         self.speed_observer.update(T_s, out.eps, out.tau_M)
         self.flux_observer.update(T_s, out)
 
+    def get_state(self) -> dict[str, Any]:
+        """Return the state estimates."""
+        return {
+            "speed_observer": self.speed_observer.get_state(),
+            "flux_observer": self.flux_observer.get_state(),
+        }
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Set the state estimates."""
+        self.speed_observer.set_state(state["speed_observer"])
+        self.flux_observer.set_state(state["flux_observer"])
+
 
 # %%
 def create_sensored_observer(
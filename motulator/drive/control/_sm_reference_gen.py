@@ -3,8 +3,6 @@
 from cmath import exp, phase
 from math import inf, sqrt
 
-from scipy.optimize import root_scalar
-
 from motulator.common.utils._utils import clip, sign
 from motulator.drive.utils._parameters import (
     SaturatedSynchronousMachinePars,
@@ -146,6 +144,8 @@ class ReferenceGenerator:
         needed.
 
         """
+        from scipy.optimize import root_scalar  # noqa: PLC0415
+
         delta_range = (0, phase(self._psi_s_mtpv))
 
         def error(delta: float) -> float:
@@ -16,6 +16,7 @@ from motulator.drive.control._im_flux_vector import (
     ReferenceGenerator,
 )
 from motulator.drive.control._im_observers import FluxObserver, SpeedFluxObserver
+from motulator.drive.control._quasi_steady_state import QuasiSteadyStateControlSystem
 from motulator.drive.utils._parameters import InductionMachineInvGammaPars
 
 __all__ = [
@@ -31,6 +32,7 @@ __all__ = [
     "ObserverBasedVHzController",
     "ObserverBasedVHzControllerCfg",
     "PIController",
+    "QuasiSteadyStateControlSystem",
     "ReferenceGenerator",
     "SpeedController",
     "SpeedObserver",
@@ -2,6 +2,7 @@
 
 from motulator.drive.control._base import VectorControlSystem, VHzControlSystem
 from motulator.drive.control._common import PIController, SpeedController, SpeedObserver
+from motulator.drive.control._quasi_steady_state import QuasiSteadyStateControlSystem
 from motulator.drive.control._sm_current_vector import (
     CurrentController,
     CurrentVectorController,
@@ -27,6 +28,7 @@ from motulator.drive.utils._parameters import (
 
 __all__ = [
     "PIController",
+    "QuasiSteadyStateControlSystem",
     "CurrentVectorControllerCfg",
     "VHzControlSystem",
     "VectorControlSystem",
@@ -1,15 +1,27 @@
 """Continuous-time machine drive models."""
 
-from motulator.common.model._converter import FrequencyConverter, VoltageSourceConverter
+from motulator.common.model._converter import (
+    AveragedFrequencyConverter,
+    FrequencyConverter,
+    VoltageSourceConverter,
+)
 from motulator.common.model._simulation import Simulation
 from motulator.drive.model._drive import Drive
 from motulator.drive.model._lc_filter import LCFilter
-from motulator.drive.model._machine import InductionMachine, SynchronousMachine
+from motulator.drive.model._machine import (
+    InductionMachine,
+    RotorFrameInductionMachine,
+    SynchronousMachine,
+)
 from motulator.drive.model._mechanics import (
     ExternalRotorSpeed,
     MechanicalSystem,
     TwoMassMechanicalSystem,
 )
+from motulator.drive.model._quasi_steady_state import (
+    QuasiSteadyStateDrive,
+    QuasiSteadyStateMachine,
+)
 from motulator.drive.utils._parameters import (
     InductionMachineInvGammaPars,
     InductionMachinePars,
@@ -19,6 +31,7 @@ from motulator.drive.utils._parameters import (
 )
 
 __all__ = [
+    "AveragedFrequencyConverter",
     "Drive",
     "ExternalRotorSpeed",
     "FrequencyConverter",
@@ -27,6 +40,9 @@ __all__ = [
     "InductionMachineInvGammaPars",
     "LCFilter",
     "MechanicalSystem",
+    "QuasiSteadyStateDrive",
+    "QuasiSteadyStateMachine",
+    "RotorFrameInductionMachine",
     "SaturatedSynchronousMachinePars",
     "Simulation",
     "SpatialSaturatedSynchronousMachinePars",
@@ -2,7 +2,7 @@
 Continuous-time models for electric machines.
 
 Peak-valued complex space vectors are used. Quantities in stationary coordinates are
-marked with ab and quantities in synchronous coordinates are marked with dq.
+marked with ab and quantities in synchronous or rotor coordinates are marked with dq.
 
 """
 
@@ -153,17 +153,105 @@ class InductionMachineTimeSeries(SubsystemTimeSeries):
         """Compute output time series from the states."""
         self.psi_s_ab = np.array(subsystem._history.psi_s_ab)
         self.psi_r_ab = np.array(subsystem._history.psi_r_ab)
-        self.i_s_ab, self.i_r_ab, self.tau_M = subsystem.compute_outputs(self)
+        self.defer(
+            ("i_s_ab", "i_r_ab", "tau_M"), lambda: subsystem.compute_outputs(self)
+        )
+        self.defer("psi_R_ab", lambda: self.compute_inv_gamma_flux(subsystem))
+
+    def compute_inv_gamma_flux(self, subsystem: InductionMachine) -> np.ndarray:
+        """Compute the rotor flux linkage of the inverse-Γ model."""
         L_s = get_value(subsystem.par.L_s, np.abs(self.psi_s_ab))
-        # Inverse-Γ quantities
         gamma = L_s / (L_s + subsystem.par.L_ell)
-        self.psi_R_ab = gamma * self.psi_r_ab
+        return gamma * self.psi_r_ab
 
     def compute_input_derived_signals(
         self, t: np.ndarray, subsystem: InductionMachine
     ) -> None:
         """Compute signals derived from inputs."""
-        self.w_m = subsystem.par.n_p * self.w_M  # Electrical rotor speed
+        # Electrical rotor speed
+        self.defer("w_m", lambda: subsystem.par.n_p * self.w_M)
+
+
+# %%
+@dataclass
+class RotorFrameInductionMachineStates:
+    """State variables in rotor coordinates."""
+
+    psi_s_dq: complex = 0j
+    psi_r_dq: complex = 0j
+    exp_j_theta_m: complex = complex(1)
+
+    @property
+    def psi_s_ab(self) -> complex:
+        """Stator flux linkage in stator coordinates."""
+        return self.exp_j_theta_m * self.psi_s_dq
+
+    @property
+    def psi_r_ab(self) -> complex:
+        """Rotor flux linkage in stator coordinates."""
+        return self.exp_j_theta_m * self.psi_r_dq
+
+
+@dataclass
+class RotorFrameInductionMachineStateHistory:
+    """State history."""
+
+    psi_s_dq: list[complex] = field(default_factory=list)
+    psi_r_dq: list[complex] = field(default_factory=list)
+    exp_j_theta_m: list[complex] = field(default_factory=list)
+
+    @property
+    def psi_s_ab(self) -> np.ndarray:
+        """Stator flux linkage in stator coordinates."""
+        return np.multiply(self.exp_j_theta_m, self.psi_s_dq)
+
+    @property
+    def psi_r_ab(self) -> np.ndarray:
+        """Rotor flux linkage in stator coordinates."""
+        return np.multiply(self.exp_j_theta_m, self.psi_r_dq)
+
+
+class RotorFrameInductionMachine(InductionMachine):
+    """
+    Γ-equivalent model of an induction machine in rotor coordinates.
+
+    This model is mathematically identical to :class:`InductionMachine`, but the flux
+    linkages are integrated in rotor coordinates. In steady state, the states rotate at
+    the slip angular frequency instead of the stator angular frequency, which allows
+    the solver to take longer steps. The rotor angle is an additional state. The
+    interfaces and the time series are in stator coordinates.
+
+    Parameters
+    ----------
+    par : InductionMachinePars | InductionMachineInvGammaPars
+        Machine parameters.
+
+    """
+
+    def __init__(
+        self, par: InductionMachinePars | InductionMachineInvGammaPars
+    ) -> None:
+        super().__init__(par)
+        # The states are in rotor coordinates, see the properties for stator coordinates
+        self.state: RotorFrameInductionMachineStates = (  # type: ignore
+            RotorFrameInductionMachineStates()
+        )
+        self._history: RotorFrameInductionMachineStateHistory = (  # type: ignore
+            RotorFrameInductionMachineStateHistory()
+        )
+
+    def rhs(self, t: float) -> list[complex]:
+        """Compute state derivatives."""
+        state, inp, out, par = self.state, self.inp, self.out, self.par
+        exp_j_theta_m_conj = np.conj(state.exp_j_theta_m)
+        u_s_dq = inp.u_s_ab * exp_j_theta_m_conj
+        i_s_dq = out.i_s_ab * exp_j_theta_m_conj
+        i_r_dq = out.i_r_ab * exp_j_theta_m_conj
+        w_m = par.n_p * inp.w_M
+        d_psi_s_dq = u_s_dq - par.R_s * i_s_dq - 1j * w_m * state.psi_s_dq
+        d_psi_r_dq = -par.R_r * i_r_dq
+        d_exp_j_theta_m = 1j * w_m * state.exp_j_theta_m
+        return [d_psi_s_dq, d_psi_r_dq, d_exp_j_theta_m]
 
 
 # %%
@@ -296,12 +384,15 @@ class SynchronousMachineTimeSeries(SubsystemTimeSeries):
         """Compute time series from states."""
         self.psi_s_dq = np.array(subsystem._history.psi_s_dq)
         self.exp_j_theta_m = np.array(subsystem._history.exp_j_theta_m)
-        self.theta_m = np.angle(self.exp_j_theta_m)
-        self.i_s_dq, self.i_s_ab, self.tau_M = subsystem.compute_outputs(self)
-        self.psi_s_ab = self.exp_j_theta_m * self.psi_s_dq
+        self.defer("theta_m", lambda: np.angle(self.exp_j_theta_m))
+        self.defer(
+            ("i_s_dq", "i_s_ab", "tau_M"), lambda: subsystem.compute_outputs(self)
+        )
+        self.defer("psi_s_ab", lambda: self.exp_j_theta_m * self.psi_s_dq)
 
     def compute_input_derived_signals(
         self, t: np.ndarray, subsystem: SynchronousMachine
     ) -> None:
         """Compute signals derived from inputs."""
-        self.w_m = subsystem.par.n_p * self.w_M  # Electrical rotor speed
+        # Electrical rotor speed
+        self.defer("w_m", lambda: subsystem.par.n_p * self.w_M)
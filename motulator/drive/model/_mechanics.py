@@ -7,6 +7,7 @@ from typing import Any, Callable
 import numpy as np
 
 from motulator.common.model import Subsystem, SubsystemTimeSeries
+from motulator.common.utils._signals import Constant, as_time_signal
 from motulator.common.utils._utils import empty_array, get_value
 
 
@@ -16,7 +17,7 @@ class Inputs:
     """Input variables."""
 
     tau_M: float | None = None
-    tau_L: Callable[[float], float] = lambda t: 0.0 * t
+    tau_L: Callable[[float], float] = field(default_factory=lambda: Constant(0.0))
 
 
 @dataclass
@@ -128,8 +129,8 @@ class MechanicalSystemTimeSeries(SubsystemTimeSeries):
     def __post_init__(self, t: np.ndarray, subsystem: MechanicalSystem) -> None:
         self.w_M = np.real(np.array(subsystem._history.w_M))
         self.exp_j_theta_M = np.array(subsystem._history.exp_j_theta_M)
-        self.tau_L_tot = subsystem.compute_total_load_torque(t, self)
-        self.theta_M = np.angle(self.exp_j_theta_M)
+        self.defer("tau_L_tot", lambda: subsystem.compute_total_load_torque(t, self))
+        self.defer("theta_M", lambda: np.angle(self.exp_j_theta_M))
 
 
 # %%
@@ -273,8 +274,8 @@ class TwoMassMechanicalSystemTimeSeries(SubsystemTimeSeries):
         self.exp_j_theta_M = np.array(subsystem._history.exp_j_theta_M)
         self.w_L = np.real(np.array(subsystem._history.w_L))
         self.theta_ML = np.real(np.array(subsystem._history.theta_ML))
-        self.tau_S, self.tau_L_tot = subsystem.compute_torques(t, self)
-        self.theta_M = np.angle(self.exp_j_theta_M)
+        self.defer(("tau_S", "tau_L_tot"), lambda: subsystem.compute_torques(t, self))
+        self.defer("theta_M", lambda: np.angle(self.exp_j_theta_M))
 
 
 # %%
@@ -306,7 +307,7 @@ class ExternalRotorSpeed(Subsystem):
         self.state: ExternalRotorSpeedStates = ExternalRotorSpeedStates()
         self.out: Outputs = Outputs(exp_j_theta_M=self.state.exp_j_theta_M, w_M=0.0)
         self._history: ExternalRotorSpeedStateHistory = ExternalRotorSpeedStateHistory()
-        self.w_M = lambda t: 0.0  # External input
+        self.w_M: Callable[[float], float] = Constant(0.0)  # External input
 
     def set_external_rotor_speed(self, w_M: Callable[[float], float]) -> None:
         """Set external rotor speed (rad/s)."""
@@ -356,6 +357,6 @@ class ExternalRotorSpeedTimeSeries(SubsystemTimeSeries):
     theta_M: np.ndarray = field(default_factory=empty_array)
 
     def __post_init__(self, t: np.ndarray, subsystem: ExternalRotorSpeed) -> None:
-        self.w_M = np.array([subsystem.w_M(t) for t in t])
+        self.defer("w_M", lambda: as_time_signal(subsystem.w_M).sample(t))
         self.exp_j_theta_M = np.array(subsystem._history.exp_j_theta_M)
-        self.theta_M = np.angle(self.exp_j_theta_M)
+        self.defer("theta_M", lambda: np.angle(self.exp_j_theta_M))
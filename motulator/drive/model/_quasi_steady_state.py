@@ -0,0 +1,253 @@
+"""
+Reduced-order drive model with quasi-steady-state electrical dynamics.
+
+The flux dynamics of the machine are replaced with their algebraic steady-state relation
+in controller coordinates, i.e., in rotor coordinates for synchronous machines and in
+rotor-flux coordinates for induction machines. The current control and the state
+estimation are assumed to be ideal, so that the stator current equals its reference
+given by the control system. Only the mechanical states are integrated, so that the
+step size is not limited by the electrical time constants.
+
+"""
+
+from dataclasses import InitVar, dataclass, field
+from typing import Any
+
+import numpy as np
+
+from motulator.common.model._base import Delay, Model, Subsystem, SubsystemTimeSeries
+from motulator.common.model._converter import VoltageSourceConverter
+from motulator.common.utils._utils import empty_array, get_value
+from motulator.drive.model._machine import InductionMachine, SynchronousMachine
+from motulator.drive.model._mechanics import (
+    ExternalRotorSpeed,
+    MechanicalSystem,
+    TwoMassMechanicalSystem,
+)
+from motulator.drive.utils._parameters import InductionMachinePars
+
+
+# %%
+@dataclass
+class QuasiSteadyStateMachineInputs:
+    """Machine inputs."""
+
+    i_s: complex = 0j  # Stator current in controller coordinates
+    w_M: float = 0.0  # Mechanical rotor speed (rad/s)
+
+
+@dataclass
+class QuasiSteadyStateMachineOutputs:
+    """Machine outputs."""
+
+    psi_s: complex = 0j
+    psi_R: complex = 0j
+    u_s: complex = 0j
+    tau_M: float = 0.0
+    w_s: float = 0.0
+
+
+class QuasiSteadyStateMachine(Subsystem):
+    """
+    Quasi-steady-state machine model.
+
+    For synchronous machines, the flux linkage follows from the current using the
+    magnetic model in rotor coordinates. For induction machines, the Γ-model rotor flux
+    is aligned with the real axis and the slip angular frequency follows from the
+    steady-state rotor voltage equation. If the stator inductance is saturable, the
+    flux magnitude is solved using fixed-point iteration. The stator voltage is
+    computed from the steady-state stator voltage equation.
+
+    Parameters
+    ----------
+    machine : InductionMachine | SynchronousMachine
+        Machine model, whose parameters are used.
+
+    """
+
+    def __init__(self, machine: InductionMachine | SynchronousMachine) -> None:
+        self.par = machine.par
+        self.inp: QuasiSteadyStateMachineInputs = QuasiSteadyStateMachineInputs()
+        self.out: QuasiSteadyStateMachineOutputs = QuasiSteadyStateMachineOutputs()
+        self.state = None
+        self._history = None
+        self._flux: tuple | None = None
+        self.set_outputs(0.0)
+
+    def compute_outputs(self, i_s: Any, w_M: Any) -> tuple[Any, Any, Any, Any, Any]:
+        """
+        Compute the steady-state quantities.
+
+        Parameters
+        ----------
+        i_s : complex | ndarray
+            Stator current (A) in controller coordinates.
+        w_M : float | ndarray
+            Mechanical rotor speed (rad/s).
+
+        Returns
+        -------
+        psi_s : complex | ndarray
+            Stator flux linkage (Vs).
+        psi_R : complex | ndarray
+            Inverse-Γ rotor flux linkage (Vs), zero for synchronous machines.
+        u_s : complex | ndarray
+            Stator voltage (V).
+        tau_M : float | ndarray
+            Electromagnetic torque (Nm).
+        w_s : float | ndarray
+            Angular frequency (rad/s) of the controller coordinates.
+
+        """
+        psi_s, psi_R, w_r = self.compute_flux(i_s)
+        w_s = self.par.n_p * w_M + w_r
+        u_s = self.par.R_s * i_s + 1j * w_s * psi_s
+        tau_M = 1.5 * self.par.n_p * np.imag(i_s * np.conj(psi_s))
+        return psi_s, psi_R, u_s, tau_M, w_s
+
+    def compute_flux(self, i_s: Any) -> tuple[Any, Any, Any]:
+        """Compute the flux linkages and the slip angular frequency."""
+        par = self.par
+        if not isinstance(par, InductionMachinePars):
+            psi_s = par.psi_s_dq(i_s)
+            return psi_s, 0j * psi_s, 0.0 * np.real(psi_s)
+        # Rotor current is orthogonal to the rotor flux in steady state
+        i_sd, i_sq = np.real(i_s), np.imag(i_s)
+        L_s = get_value(par.L_s, 0.0)
+        if callable(par.L_s):
+            # Solve the flux magnitude by bisection, since the residual decreases
+            # monotonically if the inductance decreases with the flux
+            lo, hi = 0.0 * np.abs(i_s), L_s * np.abs(i_s)
+            for _ in range(40):
+                psi = 0.5 * (lo + hi)
+                L_s = par.L_s(psi)
+                res = np.abs(L_s * (i_sd + 1j * par.L_ell / (L_s + par.L_ell) * i_sq))
+                lo, hi = np.where(res > psi, psi, lo), np.where(res > psi, hi, psi)
+            L_s = par.L_s(0.5 * (lo + hi))
+        gamma = L_s / (L_s + par.L_ell)
+        psi_r = L_s * i_sd
+        psi_s = L_s * i_sd + 1j * (1 - gamma) * L_s * i_sq
+        w_r = gamma * par.R_r * i_sq / np.where(psi_r > 0, psi_r, np.inf)
+        return psi_s, gamma * psi_r + 0j, w_r
+
+    def set_outputs(self, t: float) -> None:
+        """Set output variables."""
+        out, i_s = self.out, self.inp.i_s
+        # The current is constant over the sampling period, reuse the flux solution
+        if self._flux is None or self._flux[0] != i_s:
+            self._flux = (i_s, *self.compute_flux(i_s))
+        out.psi_s, out.psi_R, w_r = self._flux[1:]
+        out.w_s = self.par.n_p * self.inp.w_M + w_r
+        out.u_s = self.par.R_s * i_s + 1j * out.w_s * out.psi_s
+        out.tau_M = 1.5 * self.par.n_p * np.imag(i_s * np.conj(out.psi_s))
+
+    def rhs(self, t: float) -> list[complex]:
+        """No state variables."""
+        return []
+
+    def create_time_series(
+        self, t: np.ndarray
+    ) -> tuple[str, "QuasiSteadyStateMachineTimeSeries"]:
+        """Create time series."""
+        return "machine", QuasiSteadyStateMachineTimeSeries(t, self)
+
+
+@dataclass
+class QuasiSteadyStateMachineTimeSeries(SubsystemTimeSeries):
+    """Continuous time series."""
+
+    t: InitVar[np.ndarray]
+    subsystem: InitVar[QuasiSteadyStateMachine]
+    # Inputs
+    i_s: np.ndarray = field(default_factory=empty_array)
+    w_M: np.ndarray = field(default_factory=empty_array)
+    # Derived signals
+    psi_s: np.ndarray = field(default_factory=empty_array)
+    psi_R: np.ndarray = field(default_factory=empty_array)
+    u_s: np.ndarray = field(default_factory=empty_array)
+    tau_M: np.ndarray = field(default_factory=empty_array)
+    w_s: np.ndarray = field(default_factory=empty_array)
+    w_m: np.ndarray = field(default_factory=empty_array)
+
+    def __post_init__(self, t: np.ndarray, subsystem: QuasiSteadyStateMachine) -> None:
+        """No state variables, all signals are derived from the inputs."""
+
+    def compute_input_derived_signals(
+        self, t: np.ndarray, subsystem: QuasiSteadyStateMachine
+    ) -> None:
+        """Compute signals derived from inputs."""
+        self.defer(
+            ("psi_s", "psi_R", "u_s", "tau_M", "w_s"),
+            lambda: subsystem.compute_outputs(
+                np.asarray(self.i_s, dtype=complex), self.w_M
+            ),
+        )
+        self.defer("w_m", lambda: subsystem.par.n_p * self.w_M)
+
+
+# %%
+class QuasiSteadyStateDrive(Model):
+    """
+    Reduced-order drive model with quasi-steady-state electrical dynamics.
+
+    This model is to be used with :class:`QuasiSteadyStateControlSystem`, which sets
+    the stator current reference in controller coordinates using
+    :meth:`set_current_reference`. The current is held as the ZOH input "i_s" of the
+    machine. Only the mechanical states are integrated.
+
+    Parameters
+    ----------
+    machine : InductionMachine | SynchronousMachine
+        Machine model, whose parameters are used.
+    mechanics : MechanicalSystem | TwoMassMechanicalSystem | ExternalRotorSpeed
+        Mechanical system model.
+    converter : VoltageSourceConverter
+        Converter model, whose DC-bus voltage is used.
+    delay : int, optional
+        Delay (samples) of the current response, defaults to 1.
+
+    """
+
+    def __init__(
+        self,
+        machine: InductionMachine | SynchronousMachine,
+        mechanics: MechanicalSystem | TwoMassMechanicalSystem | ExternalRotorSpeed,
+        converter: VoltageSourceConverter,
+        delay: int = 1,
+    ) -> None:
+        super().__init__()
+        self.current_delay = Delay(delay, elem=1)
+        self.machine = QuasiSteadyStateMachine(machine)
+        self.mechanics = mechanics
+        self.converter = converter
+        self.subsystems = [self.machine, self.mechanics]
+        self.connections = {
+            (self.machine, "w_M"): (self.mechanics, "w_M"),
+            (self.mechanics, "tau_M"): (self.machine, "tau_M"),
+        }
+        self.zoh_connections = {(self.machine, "i_s"): "i_s"}
+        self.set_zoh_input("i_s", 0j)
+
+    def set_current_reference(self, i_s_ref: complex) -> None:
+        """
+        Set the stator current reference for the next sampling period.
+
+        Parameters
+        ----------
+        i_s_ref : complex
+            Stator current reference (A) in controller coordinates. The current follows
+            its reference after the delay.
+
+        """
+        self.set_zoh_input("i_s", self.current_delay([i_s_ref])[0])
+
+    def get_state(self) -> dict[str, Any]:
+        """Extend the get-state method with the current delay."""
+        state = super().get_state()
+        state["current_delay"] = self.current_delay.get_state()
+        return state
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Extend the set-state method with the current delay."""
+        self.current_delay.set_state(state["current_delay"])
+        super().set_state(state)
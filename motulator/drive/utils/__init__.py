@@ -1,42 +1,80 @@
-"""Utility functions for machine drives."""
+"""
+Utility functions for machine drives.
 
-from motulator.common.utils._utils import (
-    BaseValues,
-    NominalValues,
+The plotting and flux-map utilities are imported when first accessed, so that the
+models and controls can be used without importing matplotlib.
+
+"""
+
+from typing import TYPE_CHECKING
+
+from motulator.common.utils._lazy import lazy_attributes
+from motulator.common.utils._profile import Profile
+from motulator.common.utils._signals import (
+    Constant,
+    PiecewiseConstant,
+    Ramp,
     SequenceGenerator,
     Step,
+    TimeSignal,
 )
-from motulator.drive.utils._plots import (
-    plot,
-    plot_dc_bus_waveforms,
-    plot_stator_waveforms,
-)
-from motulator.drive.utils._sm_control_loci import ControlLoci
-from motulator.drive.utils._sm_flux_maps import (
-    MagneticModel,
-    SaturationModelBase,
-    SaturationModelPMSyRM,
-    SaturationModelSyRM,
-    import_syre_data,
+from motulator.common.utils._utils import BaseValues, NominalValues
+
+if TYPE_CHECKING:
+    from motulator.drive.utils._plots import (
+        plot,
+        plot_dc_bus_waveforms,
+        plot_stator_waveforms,
+    )
+    from motulator.drive.utils._sm_control_loci import ControlLoci
+    from motulator.drive.utils._sm_flux_maps import (
+        MagneticModel,
+        SaturationModelBase,
+        SaturationModelPMSyRM,
+        SaturationModelSyRM,
+        import_syre_data,
+    )
+    from motulator.drive.utils._sm_plot_control_loci import MachineCharacteristics
+    from motulator.drive.utils._sm_plot_flux_maps import plot_flux_vs_current, plot_map
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "plot": "motulator.drive.utils._plots",
+        "plot_dc_bus_waveforms": "motulator.drive.utils._plots",
+        "plot_stator_waveforms": "motulator.drive.utils._plots",
+        "ControlLoci": "motulator.drive.utils._sm_control_loci",
+        "MagneticModel": "motulator.drive.utils._sm_flux_maps",
+        "SaturationModelBase": "motulator.drive.utils._sm_flux_maps",
+        "SaturationModelPMSyRM": "motulator.drive.utils._sm_flux_maps",
+        "SaturationModelSyRM": "motulator.drive.utils._sm_flux_maps",
+        "import_syre_data": "motulator.drive.utils._sm_flux_maps",
+        "MachineCharacteristics": "motulator.drive.utils._sm_plot_control_loci",
+        "plot_flux_vs_current": "motulator.drive.utils._sm_plot_flux_maps",
+        "plot_map": "motulator.drive.utils._sm_plot_flux_maps",
+    },
 )
-from motulator.drive.utils._sm_plot_control_loci import MachineCharacteristics
-from motulator.drive.utils._sm_plot_flux_maps import plot_flux_vs_current, plot_map
 
 __all__ = [
     "BaseValues",
+    "Constant",
     "ControlLoci",
     "import_syre_data",
     "MachineCharacteristics",
     "MagneticModel",
     "NominalValues",
+    "PiecewiseConstant",
+    "Profile",
     "plot",
     "plot_stator_waveforms",
     "plot_dc_bus_waveforms",
     "plot_flux_vs_current",
     "plot_map",
+    "Ramp",
     "SaturationModelPMSyRM",
     "SaturationModelSyRM",
     "SaturationModelBase",
     "SequenceGenerator",
     "Step",
+    "TimeSignal",
 ]
@@ -4,7 +4,6 @@ from dataclasses import dataclass, field
 from typing import Callable, Protocol, Tuple
 
 import numpy as np
-from scipy.optimize import root, root_scalar
 
 EPS: float = 1e-3
 
@@ -281,6 +280,8 @@ class SaturatedSynchronousMachinePars(BaseSynchronousMachinePars):
     L_q0: float = field(init=False)
 
     def __post_init__(self) -> None:
+        from scipy.optimize import root_scalar  # noqa: PLC0415
+
         if self.i_s_dq_fcn is not None:
             self.psi_f = root_scalar(
                 lambda psi_d: np.real(self.i_s_dq(psi_d)), x0=0, method="newton"
@@ -332,6 +333,8 @@ class SaturatedSynchronousMachinePars(BaseSynchronousMachinePars):
         algorithm. This is less efficient, but may be convenient in some special cases.
 
         """
+        from scipy.optimize import root  # noqa: PLC0415
+
         if self.i_s_dq_fcn is not None:
             return complex(self.i_s_dq(psi_s_dq))
 
@@ -377,6 +380,8 @@ class SpatialSaturatedSynchronousMachinePars(BaseSynchronousMachinePars):
     psi_f: float = field(init=False, default=0.0)
 
     def __post_init__(self) -> None:
+        from scipy.optimize import root_scalar  # noqa: PLC0415
+
         self.psi_f = root_scalar(
             lambda psi_d: np.real(self.i_s_dq(psi_d, 1.0)), x0=0, method="newton"
         ).root
@@ -9,6 +9,7 @@ from numpy.typing import ArrayLike
 from motulator.common.model._simulation import SimulationResults
 from motulator.common.utils._plotting import (
     configure_axes,
+    downsample_lines,
     save_and_show,
     set_latex_style,
     set_screen_style,
@@ -166,6 +167,7 @@ def plot(
     y_ticks: list[ArrayLike | None] | None = None,
     latex: bool = False,
     save_path: str | Path | None = None,
+    downsample: bool = False,
     **savefig_kwargs,
 ) -> None:
     """
@@ -194,6 +196,10 @@ def plot(
         installation, defaults to False.
     save_path : str | Path, optional
         Path to save the figure. If None, the figure is not saved.
+    downsample : bool, optional
+        Plot only the min/max envelope of the waveforms per pixel column, which
+        preserves the ripple peaks, defaults to False. The envelope is recomputed from
+        the full waveforms when the time axis is zoomed or panned.
     **savefig_kwargs
         Additional keyword arguments passed to plt.savefig().
 
@@ -252,6 +258,8 @@ def plot(
 
     # Configure all axes
     configure_axes(axes, t_lims, t_ticks, y_lims, y_ticks)
+    if downsample:
+        downsample_lines(axes)
 
     fig.align_ylabels()
     axes[-1].set_xlabel("Time (s)")
@@ -293,6 +301,7 @@ def plot_stator_waveforms(
     y_ticks: list[ArrayLike | None] | None = None,
     latex: bool = False,
     save_path: str | Path | None = None,
+    downsample: bool = False,
     **savefig_kwargs,
 ) -> None:
     """
@@ -316,6 +325,10 @@ def plot_stator_waveforms(
         Use LaTeX fonts for the labels, requires a working LaTeX installation.
     save_path : str | Path, optional
         Path to save the figure. If None, the figure is not saved.
+    downsample : bool, optional
+        Plot only the min/max envelope of the waveforms per pixel column, which
+        preserves the ripple peaks, defaults to False. The envelope is recomputed from
+        the full waveforms when the time axis is zoomed or panned.
     **savefig_kwargs
         Additional keyword arguments passed to plt.savefig().
 
@@ -347,6 +360,8 @@ def plot_stator_waveforms(
 
     # Configure all axes
     configure_axes(axes, t_lims, t_ticks, y_lims, y_ticks)
+    if downsample:
+        downsample_lines(axes)
 
     # Add axis labels
     if pu_vals:
@@ -387,6 +402,7 @@ def plot_dc_bus_waveforms(
     y_ticks: list[ArrayLike | None] | None = None,
     latex: bool = False,
     save_path: str | Path | None = None,
+    downsample: bool = False,
     **savefig_kwargs,
 ) -> None:
     """
@@ -410,6 +426,10 @@ def plot_dc_bus_waveforms(
         Use LaTeX fonts for the labels, requires a working LaTeX installation.
     save_path : str | Path, optional
         Path to save the figure. If None, the figure is not saved.
+    downsample : bool, optional
+        Plot only the min/max envelope of the waveforms per pixel column, which
+        preserves the ripple peaks, defaults to False. The envelope is recomputed from
+        the full waveforms when the time axis is zoomed or panned.
     **savefig_kwargs
         Additional keyword arguments passed to plt.savefig().
 
@@ -446,6 +466,8 @@ def plot_dc_bus_waveforms(
 
     # Configure all axes
     configure_axes(axes, t_lims, t_ticks, y_lims, y_ticks)
+    if downsample:
+        downsample_lines(axes)
 
     # Add axis labels
     if pu_vals:
@@ -4,7 +4,6 @@ from dataclasses import dataclass
 from typing import Any, Callable
 
 import numpy as np
-from scipy.optimize import root_scalar
 
 from motulator.drive.utils._parameters import (
     SaturatedSynchronousMachinePars,
@@ -89,6 +88,7 @@ class ControlLoci:
 
     def compute_mtpa_current_angle(self, i_s_abs: float) -> float:
         """MTPA current angle (rad) at given current magnitude (A)."""
+        from scipy.optimize import root_scalar  # noqa: PLC0415
 
         def mtpa_cond(gamma: float) -> float:
             i_s_dq = i_s_abs * np.exp(1j * gamma)
@@ -142,6 +142,7 @@ class ControlLoci:
 
     def compute_mtpv_flux_angle(self, psi_s_abs: float) -> float:
         """MTPV flux angle (rad) at given flux magnitude (Vs)."""
+        from scipy.optimize import root_scalar  # noqa: PLC0415
 
         def mtpv_cond(delta: float) -> float:
             psi_s_dq = psi_s_abs * np.exp(1j * delta)
@@ -250,6 +251,7 @@ class ControlLoci:
             MTPV current (A). If no MTPV exists, returns np.nan.
 
         """
+        from scipy.optimize import root_scalar  # noqa: PLC0415
 
         def mtpv_cond(gamma: float) -> float:
             i_s_dq = i_s_abs * np.exp(1j * gamma)
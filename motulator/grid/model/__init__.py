@@ -1,6 +1,7 @@
 """Continuous-time grid converter models."""
 
 from motulator.common.model._simulation import Simulation
+from motulator.grid.model._ac_filter import RotatingFrameLCLFilter, RotatingFrameLFilter
 from motulator.grid.model._converter_system import (
     CapacitiveDCBusConverter,
     GridConverterSystem,
@@ -14,6 +15,8 @@ __all__ = [
     "GridConverterSystem",
     "LCLFilter",
     "LFilter",
+    "RotatingFrameLCLFilter",
+    "RotatingFrameLFilter",
     "ThreePhaseSource",
     "Simulation",
     "VoltageSourceConverter",
@@ -3,17 +3,20 @@ AC filter and grid impedance models.
 
 This module contains continuous-time models for subsystems comprising an AC filter and a
 grid impedance between the converter and grid voltage sources. The models are
-implemented with space vectors in stationary coordinates.
+implemented with space vectors in stationary coordinates. The rotating-frame variants
+integrate the states in coordinates rotating at a given angular frequency, while their
+interfaces remain in stationary coordinates.
 
 """
 
 from dataclasses import InitVar, dataclass, field
-from typing import Any
+from math import pi
+from typing import Any, Callable
 
 import numpy as np
 
 from motulator.common.model import Subsystem, SubsystemTimeSeries
-from motulator.common.utils._utils import complex2abc, empty_array
+from motulator.common.utils._utils import complex2abc, empty_array, get_value
 
 
 # %%
@@ -144,7 +147,94 @@ class LFilterTimeSeries(SubsystemTimeSeries):
 
     def compute_input_derived_signals(self, t: np.ndarray, subsystem: LFilter) -> None:
         """Compute direct feedthrough time series."""
-        self.u_g_ab = subsystem.pcc_voltage(self, self)
+        self.defer("u_g_ab", lambda: subsystem.pcc_voltage(self, self))
+
+
+# %%
+@dataclass
+class RotatingFrameLFilterStates:
+    """State variables in rotating coordinates."""
+
+    i_c_dq: complex = 0j
+    exp_j_theta: complex = complex(1)
+
+    @property
+    def i_c_ab(self) -> complex:
+        """Converter current in stationary coordinates."""
+        return self.exp_j_theta * self.i_c_dq
+
+
+@dataclass
+class RotatingFrameLFilterStateHistory:
+    """State history."""
+
+    i_c_dq: list[complex] = field(default_factory=list)
+    exp_j_theta: list[complex] = field(default_factory=list)
+
+    @property
+    def i_c_ab(self) -> np.ndarray:
+        """Converter current in stationary coordinates."""
+        return np.multiply(self.exp_j_theta, self.i_c_dq)
+
+
+class RotatingFrameLFilter(LFilter):
+    """
+    Model of an L filter and an inductive-resistive grid in rotating coordinates.
+
+    This model is mathematically identical to :class:`LFilter`, but the current is
+    integrated in coordinates rotating at the angular frequency `w`. If `w` equals the
+    angular frequency of the grid voltage source, the states are constant in balanced
+    steady state, which allows the solver to take longer steps. The angle of the
+    coordinates is an additional state, starting from zero as the angle of
+    :class:`ThreePhaseSource`. The interfaces and the time series are in stationary
+    coordinates.
+
+    Parameters
+    ----------
+    L_f : float
+        Filter inductance (H).
+    R_f : float, optional
+        Series resistance (Ω) of the filter inductor, defaults to 0.
+    L_g : float, optional
+        Grid inductance (H), defaults to 0.
+    R_g : float, optional
+        Grid resistance (Ω), defaults to 0.
+    w : float | Callable[[float], float], optional
+        Angular frequency (rad/s) of the coordinates, defaults to 2*pi*50.
+
+    """
+
+    def __init__(
+        self,
+        L_f: float,
+        R_f: float = 0.0,
+        L_g: float = 0.0,
+        R_g: float = 0.0,
+        w: float | Callable[[float], float] = 2 * pi * 50,
+    ) -> None:
+        super().__init__(L_f, R_f, L_g, R_g)
+        self.w = w
+        # The states are in rotating coordinates, see the properties for stationary
+        # coordinates
+        self.state: RotatingFrameLFilterStates = (  # type: ignore
+            RotatingFrameLFilterStates()
+        )
+        self._history: RotatingFrameLFilterStateHistory = (  # type: ignore
+            RotatingFrameLFilterStateHistory()
+        )
+
+    def rhs(self, t: float) -> list[complex]:
+        """Compute the state derivatives."""
+        state, inp = self.state, self.inp
+        w = get_value(self.w, t)
+        exp_j_theta_conj = np.conj(state.exp_j_theta)
+        L_t = self.L_f + self.L_g
+        R_t = self.R_f + self.R_g
+        d_i_c_dq = (
+            (inp.u_c_ab - inp.e_g_ab) * exp_j_theta_conj - R_t * state.i_c_dq
+        ) / L_t - 1j * w * state.i_c_dq
+        d_exp_j_theta = 1j * w * state.exp_j_theta
+        return [d_i_c_dq, d_exp_j_theta]
 
 
 # %%
@@ -309,4 +399,135 @@ class LCLFilterTimeSeries(SubsystemTimeSeries):
         self, t: np.ndarray, subsystem: LCLFilter
     ) -> None:
         """Process input time series."""
-        self.u_g_ab = subsystem.pcc_voltage(self, self)
+        self.defer("u_g_ab", lambda: subsystem.pcc_voltage(self, self))
+
+
+# %%
+@dataclass
+class RotatingFrameLCLFilterStates:
+    """LCL filter states in rotating coordinates."""
+
+    i_c_dq: complex = 0j
+    u_f_dq: complex = 0j
+    i_g_dq: complex = 0j
+    exp_j_theta: complex = complex(1)
+
+    @property
+    def i_c_ab(self) -> complex:
+        """Converter current in stationary coordinates."""
+        return self.exp_j_theta * self.i_c_dq
+
+    @property
+    def u_f_ab(self) -> complex:
+        """Capacitor voltage in stationary coordinates."""
+        return self.exp_j_theta * self.u_f_dq
+
+    @property
+    def i_g_ab(self) -> complex:
+        """Grid current in stationary coordinates."""
+        return self.exp_j_theta * self.i_g_dq
+
+
+@dataclass
+class RotatingFrameLCLFilterStateHistory:
+    """LCL filter state history."""
+
+    i_c_dq: list[complex] = field(default_factory=list)
+    u_f_dq: list[complex] = field(default_factory=list)
+    i_g_dq: list[complex] = field(default_factory=list)
+    exp_j_theta: list[complex] = field(default_factory=list)
+
+    @property
+    def i_c_ab(self) -> np.ndarray:
+        """Converter current in stationary coordinates."""
+        return np.multiply(self.exp_j_theta, self.i_c_dq)
+
+    @property
+    def u_f_ab(self) -> np.ndarray:
+        """Capacitor voltage in stationary coordinates."""
+        return np.multiply(self.exp_j_theta, self.u_f_dq)
+
+    @property
+    def i_g_ab(self) -> np.ndarray:
+        """Grid current in stationary coordinates."""
+        return np.multiply(self.exp_j_theta, self.i_g_dq)
+
+
+class RotatingFrameLCLFilter(LCLFilter):
+    """
+    Model of an LCL filter and an inductive-resistive grid in rotating coordinates.
+
+    This model is mathematically identical to :class:`LCLFilter`, but the states are
+    integrated in coordinates rotating at the angular frequency `w`. If `w` equals the
+    angular frequency of the grid voltage source, the states are constant in balanced
+    steady state, which allows the solver to take longer steps. The angle of the
+    coordinates is an additional state, starting from zero as the angle of
+    :class:`ThreePhaseSource`. The interfaces and the time series are in stationary
+    coordinates.
+
+    Parameters
+    ----------
+    L_fc : float
+        Converter-side filter inductance (H).
+    L_fg : float
+        Grid-side filter inductance (H).
+    C_f : float
+        Filter capacitance (F).
+    R_fc : float, optional
+        Series resistance (Ω) of the converter-side inductor, defaults to 0.
+    R_fg : float, optional
+        Series resistance (Ω) of the grid-side inductor, defaults to 0.
+    L_g : float, optional
+        Grid inductance (H), defaults to 0.
+    R_g : float, optional
+        Grid resistance (Ω), defaults to 0.
+    u_f0_ab : complex, optional
+        Initial value of the filter capacitor voltage (V), defaults to 0.
+    w : float | Callable[[float], float], optional
+        Angular frequency (rad/s) of the coordinates, defaults to 2*pi*50.
+
+    """
+
+    def __init__(
+        self,
+        L_fc: float,
+        L_fg: float,
+        C_f: float,
+        R_fc: float = 0.0,
+        R_fg: float = 0.0,
+        L_g: float = 0.0,
+        R_g: float = 0.0,
+        u_f0_ab: complex = 0j,
+        w: float | Callable[[float], float] = 2 * pi * 50,
+    ) -> None:
+        super().__init__(L_fc, L_fg, C_f, R_fc, R_fg, L_g, R_g, u_f0_ab)
+        self.w = w
+        # The states are in rotating coordinates, see the properties for stationary
+        # coordinates. The coordinates are initially aligned with the stationary ones.
+        self.state: RotatingFrameLCLFilterStates = (  # type: ignore
+            RotatingFrameLCLFilterStates(u_f_dq=u_f0_ab)
+        )
+        self._history: RotatingFrameLCLFilterStateHistory = (  # type: ignore
+            RotatingFrameLCLFilterStateHistory()
+        )
+
+    def rhs(self, t: float) -> list[complex]:
+        """Compute the state derivatives."""
+        state, inp = self.state, self.inp
+        w = get_value(self.w, t)
+        exp_j_theta_conj = np.conj(state.exp_j_theta)
+        u_c_dq = inp.u_c_ab * exp_j_theta_conj
+        e_g_dq = inp.e_g_ab * exp_j_theta_conj
+        # Total inductance and resistance
+        L_t = self.L_fg + self.L_g
+        R_t = self.R_fg + self.R_g
+        # State equations
+        d_i_c_dq = (
+            u_c_dq - state.u_f_dq - self.R_fc * state.i_c_dq
+        ) / self.L_fc - 1j * w * state.i_c_dq
+        d_u_f_dq = (state.i_c_dq - state.i_g_dq) / self.C_f - 1j * w * state.u_f_dq
+        d_i_g_dq = (
+            state.u_f_dq - e_g_dq - R_t * state.i_g_dq
+        ) / L_t - 1j * w * state.i_g_dq
+        d_exp_j_theta = 1j * w * state.exp_j_theta
+        return [d_i_c_dq, d_u_f_dq, d_i_g_dq, d_exp_j_theta]
@@ -7,6 +7,7 @@ from typing import Any, Callable
 import numpy as np
 
 from motulator.common.model import Subsystem, SubsystemTimeSeries
+from motulator.common.utils._signals import as_time_signal
 from motulator.common.utils._utils import empty_array, get_value
 
 
@@ -72,6 +73,7 @@ class ThreePhaseSource(Subsystem):
         self.phi = phi
         self.e_g_neg = e_g_neg
         self.phi_neg = phi_neg
+        self.e_p_dq: Callable[[Any], Any] | None = None
         self.inp = None
         self.state: States = States()
         self.out: Outputs = Outputs()
@@ -87,8 +89,25 @@ class ThreePhaseSource(Subsystem):
         e_g_ab = e_g * exp_j_theta_g * np.exp(1j * phi)
         # Add possible negative sequence component
         e_g_ab += e_g_neg * np.conj(exp_j_theta_g * np.exp(1j * phi_neg))
+        # Add possible perturbation given in source coordinates
+        if self.e_p_dq is not None:
+            e_g_ab += self.e_p_dq(t) * exp_j_theta_g
         return e_g_ab
 
+    def set_perturbation(self, e_p_dq: Callable[[Any], Any] | None) -> None:
+        """
+        Set a perturbation voltage superimposed on the source.
+
+        Parameters
+        ----------
+        e_p_dq : Callable[[Any], Any] | None
+            Perturbation voltage (V) in coordinates rotating with the source angle, as
+            a function of time. The function should accept both scalar and array
+            arguments. If None, the perturbation is removed.
+
+        """
+        self.e_p_dq = e_p_dq
+
     def set_outputs(self, t) -> None:
         """Set output variables."""
         self.out.e_g_ab = self.generate_space_vector(t, self.state.exp_j_theta_g)
@@ -117,6 +136,8 @@ class ThreePhaseSourceTimeSeries(SubsystemTimeSeries):
     def __post_init__(self, t: np.ndarray, subsystem: ThreePhaseSource) -> None:
         """Compute output time series from the states."""
         self.exp_j_theta_g = np.array(subsystem._history.exp_j_theta_g)
-        self.w_g = np.vectorize(get_value)(subsystem.w_g, t)
-        self.theta_g = np.angle(self.exp_j_theta_g)
-        self.e_g_ab = subsystem.generate_space_vector(t, self.exp_j_theta_g)
+        self.defer("w_g", lambda: as_time_signal(subsystem.w_g).sample(t))
+        self.defer("theta_g", lambda: np.angle(self.exp_j_theta_g))
+        self.defer(
+            "e_g_ab", lambda: subsystem.generate_space_vector(t, self.exp_j_theta_g)
+        )
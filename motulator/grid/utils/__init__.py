@@ -1,23 +1,66 @@
-"""Utility functions for grid converters."""
+"""
+Utility functions for grid converters.
 
-from motulator.common.utils._utils import (
-    BaseValues,
-    NominalValues,
+The plotting and admittance-scan utilities are imported when first accessed, so that
+the models and controls can be used without importing matplotlib.
+
+"""
+
+from typing import TYPE_CHECKING
+
+from motulator.common.utils._lazy import lazy_attributes
+from motulator.common.utils._profile import Profile
+from motulator.common.utils._signals import (
+    Constant,
+    PiecewiseConstant,
+    Ramp,
     SequenceGenerator,
     Step,
+    TimeSignal,
 )
-from motulator.grid.utils._plots import (
-    plot_control_signals,
-    plot_grid_waveforms,
-    plot_voltage_vector,
+from motulator.common.utils._utils import BaseValues, NominalValues
+
+if TYPE_CHECKING:
+    from motulator.grid.utils._impedance_scan import (
+        AdmittanceScanResults,
+        Multisine,
+        scan_admittance,
+    )
+    from motulator.grid.utils._plots import (
+        plot_admittance,
+        plot_control_signals,
+        plot_grid_waveforms,
+        plot_voltage_vector,
+    )
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AdmittanceScanResults": "motulator.grid.utils._impedance_scan",
+        "Multisine": "motulator.grid.utils._impedance_scan",
+        "scan_admittance": "motulator.grid.utils._impedance_scan",
+        "plot_admittance": "motulator.grid.utils._plots",
+        "plot_control_signals": "motulator.grid.utils._plots",
+        "plot_grid_waveforms": "motulator.grid.utils._plots",
+        "plot_voltage_vector": "motulator.grid.utils._plots",
+    },
 )
 
 __all__ = [
+    "AdmittanceScanResults",
     "BaseValues",
+    "Constant",
+    "Multisine",
     "NominalValues",
+    "PiecewiseConstant",
+    "Profile",
+    "plot_admittance",
     "plot_control_signals",
     "plot_grid_waveforms",
     "plot_voltage_vector",
+    "Ramp",
+    "scan_admittance",
     "Step",
     "SequenceGenerator",
+    "TimeSignal",
 ]
@@ -0,0 +1,307 @@
+"""
+Impedance scan for grid converter systems.
+
+A multisine perturbation is superimposed either on the grid voltage or on the converter
+voltage reference. One simulation is run per perturbation direction (d and q), and the
+dq admittance matrix of the converter is extracted at all excitation frequencies at
+once using windowed FFTs on a uniformly resampled time grid.
+
+"""
+
+from dataclasses import dataclass
+from math import pi
+from typing import Any, Callable, Literal
+
+import numpy as np
+
+from motulator.common.control._pwm import PWM
+from motulator.common.model._simulation import Simulation, SimulationResults
+from motulator.grid.model._ac_source import ThreePhaseSource
+
+
+# %%
+class Multisine:
+    """
+    Multisine perturbation signal.
+
+    The excitation frequencies are integer multiples of the frequency resolution
+    `f_res`, which makes the signal periodic with the period `1/f_res`. The frequencies
+    are logarithmically spaced between `f_min` and `f_max` and separated by at least two
+    frequency bins, so that the Hann-windowed spectra do not leak into each other. The
+    Schroeder phases are used to keep the crest factor low.
+
+    Parameters
+    ----------
+    f_min : float
+        Lowest excitation frequency (Hz).
+    f_max : float
+        Highest excitation frequency (Hz).
+    n_freqs : int
+        Number of excitation frequencies.
+    amplitude : float
+        Peak value of each frequency component.
+    f_res : float, optional
+        Frequency resolution (Hz), defaults to `f_min/2`.
+    t_start : float, optional
+        Time instant (s) when the perturbation is switched on, defaults to 0.
+
+    Notes
+    -----
+    Since the frequencies are rounded to the frequency grid, closely spaced frequencies
+    at the low end may be shifted upwards. The realized frequencies are available in
+    the attribute `f`.
+
+    """
+
+    def __init__(
+        self,
+        f_min: float,
+        f_max: float,
+        n_freqs: int,
+        amplitude: float,
+        f_res: float | None = None,
+        t_start: float = 0.0,
+    ) -> None:
+        self.f_res = 0.5 * f_min if f_res is None else f_res
+        self.amplitude = amplitude
+        self.t_start = t_start
+        # Frequency bins: at least 2 and separated by at least 2 bins
+        k = np.round(np.geomspace(f_min, f_max, n_freqs) / self.f_res).astype(int)
+        k[0] = max(k[0], 2)
+        for n in range(1, len(k)):
+            k[n] = max(k[n], k[n - 1] + 2)
+        self.k = k
+        self.f = self.f_res * k
+        # Schroeder phases
+        n = np.arange(1, len(k) + 1)
+        self.phi = -pi * n * (n - 1) / len(k)
+
+    @property
+    def T_p(self) -> float:
+        """Period (s) of the signal."""
+        return 1 / self.f_res
+
+    def __call__(self, t: Any) -> Any:
+        """
+        Evaluate the signal.
+
+        Parameters
+        ----------
+        t : float | ndarray
+            Time (s).
+
+        Returns
+        -------
+        float | ndarray
+            Perturbation signal.
+
+        """
+        tau = np.asarray(t, dtype=float) - self.t_start
+        arg = np.multiply.outer(tau, 2 * pi * self.f) + self.phi
+        y = self.amplitude * np.sum(np.cos(arg), axis=-1)
+        return np.where(tau >= 0, y, 0.0)[()]
+
+
+# %%
+@dataclass
+class AdmittanceScanResults:
+    """
+    Results of an admittance scan.
+
+    The admittance is seen from the point of common coupling (PCC) towards the
+    unperturbed side of the system, with the current positive into that side. For the
+    source injection, this is the converter admittance ``Y = -dI_dq*inv(dU_dq)``, where
+    `dU_dq` is the PCC voltage and `dI_dq` is the grid current flowing from the
+    converter to the grid, both in coordinates rotating with the source angle. For the
+    reference injection, this is the grid admittance ``Y = dI_dq*inv(dU_dq)``. With
+    this sign convention, a passive subsystem has a positive-semidefinite real part of
+    `Y`.
+
+    Attributes
+    ----------
+    f : ndarray, shape (n,)
+        Excitation frequencies (Hz) in dq coordinates.
+    Y : ndarray, shape (n, 2, 2)
+        Complex admittance matrices ``[[Y_dd, Y_dq], [Y_qd, Y_qq]]`` (S).
+
+    """
+
+    f: np.ndarray
+    Y: np.ndarray
+
+    @property
+    def Y_dd(self) -> np.ndarray:
+        """Admittance from d-axis voltage to d-axis current (S)."""
+        return self.Y[:, 0, 0]
+
+    @property
+    def Y_dq(self) -> np.ndarray:
+        """Admittance from q-axis voltage to d-axis current (S)."""
+        return self.Y[:, 0, 1]
+
+    @property
+    def Y_qd(self) -> np.ndarray:
+        """Admittance from d-axis voltage to q-axis current (S)."""
+        return self.Y[:, 1, 0]
+
+    @property
+    def Y_qq(self) -> np.ndarray:
+        """Admittance from q-axis voltage to q-axis current (S)."""
+        return self.Y[:, 1, 1]
+
+    @property
+    def Z(self) -> np.ndarray:
+        """Impedance matrices ``inv(Y)`` (Ω)."""
+        return np.linalg.inv(self.Y)
+
+
+# %%
+class _PerturbedPWM:
+    """Add a perturbation to the converter voltage reference before the PWM."""
+
+    def __init__(
+        self,
+        pwm: PWM,
+        u_p_dq: Callable[[Any], Any],
+        source: ThreePhaseSource,
+        ctrl: Any,
+    ) -> None:
+        self.pwm = pwm
+        self.u_p_dq = u_p_dq
+        self.source = source
+        self.ctrl = ctrl
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.pwm, name)
+
+    def __call__(
+        self, T_s: float, u_c_ref_ab: complex, u_dc: float, w: float
+    ) -> list[float]:
+        u_p_ab = self.u_p_dq(self.ctrl.t) * self.source.state.exp_j_theta_g
+        return self.pwm(T_s, u_c_ref_ab + u_p_ab, u_dc, w)
+
+
+def _resample(t_edges: np.ndarray, t: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Average the piecewise-linear signal over each interval of the uniform grid."""
+    # Cumulative integral of the signal, evaluated at the interval edges
+    x_int = np.concatenate(([0], np.cumsum(0.5 * (x[1:] + x[:-1]) * np.diff(t))))
+    return np.diff(np.interp(t_edges, t, x_int)) / np.diff(t_edges)
+
+
+def _dq_spectra(
+    res: SimulationResults, exc: Multisine, t0: float, n_periods: int, n_per: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the voltage and current spectra at the excitation frequencies."""
+    mdl = res.mdl
+    conj_exp_j_theta_g = np.conj(mdl.ac_source.exp_j_theta_g)
+    u_g_dq = mdl.ac_filter.u_g_ab * conj_exp_j_theta_g
+    i_g_dq = mdl.ac_filter.i_g_ab * conj_exp_j_theta_g
+
+    # Uniform grid covering an integer number of signal periods. The signals are
+    # averaged over the grid intervals, which suppresses the switching ripple.
+    N = n_periods * n_per
+    t_edges = t0 + exc.T_p * np.arange(N + 1) / n_per
+    window = 0.5 - 0.5 * np.cos(2 * pi * np.arange(N) / N)  # Periodic Hann window
+    bins = n_periods * exc.k
+
+    def spectrum(x_dq: np.ndarray) -> np.ndarray:
+        X = []
+        for x in (np.real(x_dq), np.imag(x_dq)):
+            x_n = _resample(t_edges, mdl.t, x)
+            X.append(np.fft.rfft(window * (x_n - np.mean(x_n)))[bins])
+        return np.array(X)  # Shape (2, n)
+
+    return spectrum(u_g_dq), spectrum(i_g_dq)
+
+
+def scan_admittance(
+    create_sim: Callable[[], Simulation],
+    exc: Multisine,
+    t_settle: float,
+    n_periods: int = 1,
+    n_discard: int = 1,
+    inject: Literal["source", "reference"] = "source",
+    f_s: float | None = None,
+) -> AdmittanceScanResults:
+    """
+    Scan the dq admittance of a grid converter system.
+
+    The perturbation is switched on at `t_settle`, after which `n_discard` signal
+    periods are discarded to let the transients decay. The following `n_periods` signal
+    periods are analyzed. Two simulations are run, one with the perturbation in the
+    d-direction and the other in the q-direction.
+
+    Parameters
+    ----------
+    create_sim : Callable[[], Simulation]
+        Function returning a fresh simulation object. It is called once per
+        perturbation direction, since the simulation objects are not reusable.
+    exc : Multisine
+        Perturbation signal. Its `t_start` attribute is overwritten by `t_settle`.
+    t_settle : float
+        Time (s) for reaching the operating point before the perturbation.
+    n_periods : int, optional
+        Number of analyzed signal periods, defaults to 1.
+    n_discard : int, optional
+        Number of signal periods discarded after switching on the perturbation,
+        defaults to 1.
+    inject : Literal["source", "reference"], optional
+        Injection point, defaults to "source". If "source", the perturbation is added to
+        the grid voltage and the converter admittance is identified. If "reference", it
+        is added to the converter voltage reference before the PWM and the admittance of
+        the grid impedance is identified, which requires a nonzero grid impedance.
+    f_s : float, optional
+        Sampling frequency (Hz) of the uniform analysis grid, rounded to an integer
+        multiple of the frequency resolution. Defaults to the mean control sampling
+        frequency, which averages out the switching ripple if the PWM is enabled.
+
+    Returns
+    -------
+    AdmittanceScanResults
+        Frequencies and admittance matrices.
+
+    Notes
+    -----
+    In the case of the reference injection, the perturbation passes through the
+    zero-order hold of the PWM, whose spectral images alias back to the excitation
+    frequencies. The highest excitation frequency should therefore be well below the
+    Nyquist frequency of the control system.
+
+    """
+    exc.t_start = t_settle
+    t_stop = t_settle + (n_discard + n_periods) * exc.T_p
+    t0 = t_settle + n_discard * exc.T_p
+
+    U_list, I_list = [], []
+    for direction in (1, 1j):
+        sim = create_sim()
+        mdl: Any = sim.mdl
+        ctrl: Any = sim.ctrl
+
+        def perturbation(t: Any, direction: complex = direction) -> Any:
+            return direction * exc(t)
+
+        if inject == "source":
+            mdl.ac_source.set_perturbation(perturbation)
+        elif inject == "reference":
+            ctrl.pwm = _PerturbedPWM(ctrl.pwm, perturbation, mdl.ac_source, ctrl)
+        else:
+            raise ValueError(f"Unknown injection point: {inject}")
+        res = sim.simulate(t_stop=t_stop)
+        if f_s is None:
+            T_s = (res.ctrl.t[-1] - res.ctrl.t[0]) / (len(res.ctrl.t) - 1)
+            n_per = round(exc.T_p / T_s)
+        else:
+            n_per = round(f_s * exc.T_p)
+        if n_per < 2 * exc.k[-1]:
+            raise ValueError("Sampling frequency is too low for the excitation")
+        U_exp, I_exp = _dq_spectra(res, exc, t0, n_periods, n_per)
+        U_list.append(U_exp)
+        I_list.append(I_exp)
+
+    # Each experiment forms one column of the voltage and current matrices
+    U_mat = np.moveaxis(np.array(U_list), [0, 1, 2], [2, 1, 0])  # Shape (n, 2, 2)
+    I_mat = np.moveaxis(np.array(I_list), [0, 1, 2], [2, 1, 0])
+    sign = -1 if inject == "source" else 1
+    Y = sign * I_mat @ np.linalg.inv(U_mat)
+    return AdmittanceScanResults(exc.f, Y)
@@ -9,11 +9,13 @@ from numpy.typing import ArrayLike
 from motulator.common.model._simulation import SimulationResults
 from motulator.common.utils._plotting import (
     configure_axes,
+    downsample_lines,
     save_and_show,
     set_latex_style,
     set_screen_style,
 )
 from motulator.common.utils._utils import BaseValues, complex2abc
+from motulator.grid.utils._impedance_scan import AdmittanceScanResults
 
 
 # %%
@@ -274,6 +276,7 @@ def plot_grid_waveforms(
     latex: bool = False,
     plot_pcc_voltage: bool = True,
     save_path: str | Path | None = None,
+    downsample: bool = False,
     **savefig_kwargs,
 ) -> None:
     """
@@ -302,6 +305,10 @@ def plot_grid_waveforms(
         Otherwise, plot the grid voltage waveforms, defaults to True.
     save_path : str | Path, optional
         Path to save the figure. If None, the figure is not saved.
+    downsample : bool, optional
+        Plot only the min/max envelope of the waveforms per pixel column, which
+        preserves the ripple peaks, defaults to False. The envelope is recomputed from
+        the full waveforms when the time axis is zoomed or panned.
     **savefig_kwargs
         Additional keyword arguments passed to plt.savefig().
 
@@ -331,6 +338,8 @@ def plot_grid_waveforms(
 
     # Configure all axes
     configure_axes(axes, t_lims, t_ticks, y_lims, y_ticks)
+    if downsample:
+        downsample_lines(axes)
 
     # Add axis labels
     if pu_vals:
@@ -401,3 +410,55 @@ def plot_voltage_vector(
     ax.set_aspect("equal")
 
     save_and_show(save_path, **savefig_kwargs)
+
+
+# %%
+def plot_admittance(
+    scan: AdmittanceScanResults,
+    base: BaseValues | None = None,
+    latex: bool = False,
+    save_path: str | Path | None = None,
+    **savefig_kwargs,
+) -> None:
+    """
+    Plot the magnitude and phase of the dq admittance matrix elements.
+
+    Parameters
+    ----------
+    scan : AdmittanceScanResults
+        Admittance scan results.
+    base : BaseValues, optional
+        Base values for scaling the admittance. If not given, the admittance is plotted
+        in SI units.
+    latex : bool, optional
+        Use LaTeX fonts for the labels. Enabling this option requires a working LaTeX
+        installation, defaults to False.
+    save_path : str | Path, optional
+        Path to save the figure. If None, the figure is not saved.
+    **savefig_kwargs
+        Additional keyword arguments passed to plt.savefig().
+
+    """
+    width, height = _setup_plot(latex)
+    Y_base = 1.0 if base is None else 1 / base.Z
+
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(width, height), sharex=True)
+    elements = {
+        r"$Y_\mathrm{dd}$": scan.Y_dd,
+        r"$Y_\mathrm{dq}$": scan.Y_dq,
+        r"$Y_\mathrm{qd}$": scan.Y_qd,
+        r"$Y_\mathrm{qq}$": scan.Y_qq,
+    }
+    for label, Y in elements.items():
+        ax1.loglog(scan.f, np.abs(Y) / Y_base, ".-", label=label)
+        ax2.semilogx(scan.f, np.rad2deg(np.angle(Y)), ".-", label=label)
+
+    ax1.set_ylabel("Magnitude (S)" if base is None else "Magnitude (p.u.)")
+    ax2.set_ylabel("Phase (deg)")
+    ax2.set_ylim(-180, 180)
+    ax2.set_yticks([-180, -90, 0, 90, 180])
+    ax2.set_xlabel("Frequency (Hz)")
+    ax1.legend()
+    fig.align_ylabels()
+
+    save_and_show(save_path, **savefig_kwargs)